@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import simpy
+
+from InstanceGenerator import generate_day_plan
+from OperationStore import DONE, INTERRUPTED, RUNNING
+from ProductionDaySimulation import ENGINES, ProductionDaySimulation, get_jssp_from_schedule, get_undone_operations_df
+
+# (Jobs, Maschinen) je Größenstufe, von 10 bis 100.000 Operationen
+SIZES = {
+    10: (2, 5),
+    100: (10, 10),
+    1000: (50, 20),
+    10000: (200, 50),
+    100000: (1000, 100),
+}
+
+
+# --- Messung ---
+
+def measure(function, repeats=3, memory=True):
+    """
+    Misst eine Funktion: beste Wandzeit über repeats Läufe und (optional) den
+    Spitzen-Speicher eines weiteren Laufs mit tracemalloc (nicht in der Zeit enthalten).
+
+    Returns:
+        (float, float | None, object): Sekunden, Spitzen-Speicher in MB, Rückgabewert des letzten Laufs
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        function()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return best, peak_mb, result
+
+
+def count_events(store):
+    """Start-, Ende- und Abbruch-Ereignisse eines Laufs."""
+    started = np.count_nonzero((store.status == RUNNING) | (store.status == DONE))
+    return int(started + np.count_nonzero(store.status == DONE) + np.count_nonzero(store.status == INTERRUPTED))
+
+
+# --- Benchmarks je Komponente ---
+
+def bench_simulation(df_plan, engine, seed, repeats):
+    def run():
+        simulation = ProductionDaySimulation(df_plan, seed=seed, engine=engine, sinks=[])
+        simulation.run()
+        return simulation
+
+    seconds, peak_mb, simulation = measure(run, repeats)
+    events = count_events(simulation.store)
+    return {"wall_s": seconds, "events": events, "events_per_s": events / seconds, "peak_mb": peak_mb}
+
+
+def bench_postprocessing(df_plan, seed, repeats):
+    simulation = ProductionDaySimulation(df_plan, seed=seed, engine="fast", sinks=[])
+    df_execution, df_undone = simulation.run()
+
+    def run():
+        undone = get_undone_operations_df(df_plan, df_execution)
+        return get_jssp_from_schedule(undone, duration_column="Planned Duration")
+
+    seconds, peak_mb, _ = measure(run, repeats)
+    return {"wall_s": seconds, "rows": len(df_execution), "peak_mb": peak_mb}
+
+
+def bench_undone(df_plan, seed, repeats):
+    """Offene Operationen bestimmen (index-basiert, get_undone_operations_df)."""
+    simulation = ProductionDaySimulation(df_plan, seed=seed, engine="fast", sinks=[])
+    df_execution, _ = simulation.run()
+
+    seconds, peak_mb, undone = measure(lambda: get_undone_operations_df(df_plan, df_execution), repeats)
+    return {"wall_s": seconds, "rows": len(undone), "peak_mb": peak_mb}
+
+
+def bench_rendering(df_plan, seed, repeats):
+    """
+    Gantt-Diagramm mit allen Operationen füllen und neu zeichnen (benötigt Tk und ein Display):
+    einzeln wie im Live-Betrieb (wall_s) und gebündelt per load_results mit 10 Sprüngen des Zeitreglers (replay_s).
+    """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as error:  # kein tkinter oder kein Display
+        return {"skipped": str(error) or type(error).__name__}
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "GUI"))
+    from GanttCanvas import GanttCanvas
+
+    simulation = ProductionDaySimulation(df_plan, seed=seed, engine="fast", sinks=[])
+    df_execution, df_undone = simulation.run()
+    records = list(df_execution[["Job", "Machine", "Start", "End"]].itertuples(index=False))
+    root.withdraw()
+
+    def run():
+        canvas = GanttCanvas(root)
+        canvas.setup_machines(simulation.machines.keys())
+        for job_id, machine_name, start, end in records:
+            operation = SimpleNamespace(job=SimpleNamespace(job_id=job_id), machine_name=machine_name, start_time=start)
+            canvas.add_operation(operation)
+            canvas.finish_operation(job_id, machine_name, end, "green")
+        canvas.render()
+        root.update_idletasks()
+        canvas.destroy()
+
+    def replay():
+        canvas = GanttCanvas(root)
+        canvas.load_results(df_execution, df_undone)
+        for minutes in range(0, canvas.total_minutes + 1, canvas.total_minutes // 10):
+            canvas.set_replay_time(minutes)
+            canvas.render()
+        root.update_idletasks()
+        canvas.destroy()
+
+    try:
+        seconds, peak_mb, _ = measure(run, repeats, memory=False)
+        replay_seconds, _, _ = measure(replay, repeats, memory=False)
+    finally:
+        root.destroy()
+    return {"wall_s": seconds, "replay_s": replay_seconds, "rows": len(records), "peak_mb": peak_mb}
+
+
+# --- Gesamtlauf ---
+
+def run_benchmarks(sizes=tuple(SIZES), engines=ENGINES, repeats=3, seed=42, rendering=True, log=print):
+    """
+    Führt die Skalierungs-Benchmarks für alle Größenstufen aus.
+
+    Args:
+        sizes (iterable): Anzahl Operationen je Stufe (Schlüssel von SIZES)
+        engines (iterable): zu messende Simulations-Engines
+        repeats (int): Wiederholungen je Messung (beste Zeit zählt)
+        seed (int): Seed für Instanzen und Simulation
+        rendering (bool): Gantt-Rendering mitmessen (wird ohne Display übersprungen)
+        log (callable): Fortschrittsausgabe
+
+    Returns:
+        dict: {"meta": {...}, "results": [{"component", "engine", "operations", ...}, ...]}
+    """
+    results = []
+    for size in sizes:
+        if size not in SIZES:
+            raise ValueError(f"Unbekannte Größe {size}, erlaubt: {', '.join(map(str, SIZES))}")
+        n_jobs, n_machines = SIZES[size]
+        df_plan = generate_day_plan(n_jobs, n_machines, seed=seed)
+        base = {"operations": len(df_plan), "jobs": n_jobs, "machines": n_machines}
+
+        for engine in engines:
+            results.append({"component": "simulation", "engine": engine, **base,
+                            **bench_simulation(df_plan, engine, seed, repeats)})
+        results.append({"component": "postprocessing", **base, **bench_postprocessing(df_plan, seed, repeats)})
+        results.append({"component": "undone", **base, **bench_undone(df_plan, seed, repeats)})
+        if rendering:
+            results.append({"component": "rendering", **base, **bench_rendering(df_plan, seed, repeats)})
+
+        for result in results[-len(engines) - 2 - rendering:]:
+            log(_format_result(result))
+
+    return {"meta": _meta(repeats, seed), "results": results}
+
+
+def _format_result(result):
+    label = result["component"] + (f"[{result['engine']}]" if "engine" in result else "")
+    if "skipped" in result:
+        return f"{result['operations']:>7} ops  {label:<18} übersprungen: {result['skipped']}"
+    text = f"{result['operations']:>7} ops  {label:<18} {result['wall_s'] * 1000:10.2f} ms"
+    if "events_per_s" in result:
+        text += f"  {result['events_per_s']:12,.0f} Ereignisse/s"
+    if result["peak_mb"] is not None:
+        text += f"  {result['peak_mb']:8.2f} MB"
+    return text
+
+
+def _meta(repeats, seed):
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "simpy": simpy.__version__,
+        "repeats": repeats,
+        "seed": seed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmarks für Simulation, Nachbearbeitung und Rendering")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Anzahl Operationen je Stufe")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-render", action="store_true", help="Gantt-Rendering nicht messen")
+    parser.add_argument("--output", default="benchmark_results.json", help="Ergebnisdatei (JSON)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.engines, args.repeats, args.seed, rendering=not args.no_render)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Ergebnisse gespeichert in {args.output}")
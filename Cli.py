@@ -0,0 +1,76 @@
+import argparse
+import os
+import sys
+
+from DurationSampler import SCHEMES
+from EventSink import ConsoleSink
+from PlanIO import load_plan
+from ProductionDaySimulation import ENGINES, ProductionDaySimulation
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="jobshop-sim",
+        description="Simuliert einen Tagesplan (CSV) und schreibt df_execution/df_undone als CSV.",
+    )
+    parser.add_argument("plan", help="Tagesplan als CSV mit 'Job', 'Machine', 'Start', 'Duration', 'End'")
+    parser.add_argument("-o", "--out-dir", default=".", help="Ausgabeverzeichnis (Standard: aktuelles Verzeichnis)")
+    parser.add_argument("--engine", choices=ENGINES, default="fast",
+                        help="Simulationskern (Standard: fast; abweichend von ProductionDaySimulation und "
+                             "run_replications, die ohne Angabe 'simpy' verwenden)")
+    parser.add_argument("--vc", type=float, default=0.2, help="Variationskoeffizient der Lognormalverteilung")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--until", type=float, default=1440, help="Simulationsende in Minuten")
+    parser.add_argument("-n", "--replications", type=int, default=1, help="Anzahl Replikationen (> 1: Prozess-Pool)")
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse für Replikationen (Standard: alle Kerne)")
+    parser.add_argument("--sampling", choices=SCHEMES, default="iid", help="Varianzreduktion über Replikationen")
+    parser.add_argument("--no-cache", action="store_true", help="keinen .npz-Cache für den Plan anlegen")
+    parser.add_argument("--prune", choices=("route", "machine"), default=None,
+                        help="Jobs aufgeben, sobald sie laut Schranke nicht mehr rechtzeitig fertig werden")
+    parser.add_argument("--validate", action="store_true", help="Plan vorab auf Überschneidungen und Konsistenz prüfen")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Ereignisse auf der Konsole ausgeben (nur Einzellauf)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.replications > 1 and args.verbose:
+        parser.error("--verbose ist nur für einen Einzellauf (-n 1) möglich")
+    if args.sampling == "antithetic" and args.replications % 2:
+        parser.error(f"--sampling antithetic benötigt eine gerade Anzahl Replikationen, erhalten: -n {args.replications}")
+
+    df_plan = load_plan(args.plan, cache=not args.no_cache)
+    if args.validate:
+        from PlanValidator import assert_valid_plan
+        try:
+            assert_valid_plan(df_plan)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 1
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    if args.replications > 1:
+        # Erst hier importieren: Einzelläufe brauchen weder Prozess-Pool noch KPIs
+        from KPI import compute_kpis, summarize_kpis
+        from Replications import run_replications
+
+        df_execution, df_undone = run_replications(df_plan, args.replications, vc=args.vc, seeds=args.seed,
+                                                   workers=args.workers, until=args.until, sampling=args.sampling,
+                                                   prune=args.prune, engine=args.engine)
+        df_kpis = compute_kpis(df_plan, df_execution, df_undone, until=args.until)
+        df_kpis.to_csv(os.path.join(args.out_dir, "kpis.csv"))
+        print(summarize_kpis(df_kpis).to_string())
+    else:
+        simulation = ProductionDaySimulation(df_plan, vc=args.vc, seed=args.seed, engine=args.engine,
+                                             sinks=[ConsoleSink()] if args.verbose else [], prune=args.prune)
+        df_execution, df_undone = simulation.run(until=args.until)
+
+    df_execution.to_csv(os.path.join(args.out_dir, "execution.csv"), index=False)
+    df_undone.to_csv(os.path.join(args.out_dir, "undone.csv"), index=False)
+    print(f"{len(df_execution)} Operationen ausgeführt, {len(df_undone)} offen -> {os.path.abspath(args.out_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
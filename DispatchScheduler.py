@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+RULES = ("SPT", "LPT", "MWKR", "FIFO", "EDD")
+
+
+def dispatch_schedule(jssp, rule="SPT", due_dates=None, start_time=0, machine_ready=None):
+    """
+    Erzeugt mit dem Giffler-Thompson-Verfahren einen aktiven Ablaufplan und wählt
+    im Konfliktfall nach einer Prioritätsregel:
+    - SPT: kürzeste Operation zuerst
+    - LPT: längste Operation zuerst
+    - MWKR: Job mit der meisten Restarbeit zuerst
+    - FIFO: Job, der am längsten bereitsteht, zuerst
+    - EDD: frühester Liefertermin zuerst (ohne due_dates: kürzeste Gesamtbearbeitungszeit)
+
+    Maschinen- und Job-Bereitschaftszeiten liegen als Arrays vor, jede Iteration
+    ist eine vektorisierte Operation über alle Jobs mit offenen Operationen.
+
+    Args:
+        jssp (dict): {job: [[machine, duration], ...]} wie von get_jssp_from_schedule
+        rule (str): Prioritätsregel (SPT, LPT, MWKR, FIFO, EDD)
+        due_dates (dict, optional): {job: Liefertermin in Minuten} für EDD
+        start_time (float): frühester Start aller Operationen
+        machine_ready (dict, optional): {machine: frühester Start} je Maschine
+
+    Returns:
+        DataFrame: Plan mit 'Job', 'Machine' ("M<n>"), 'Start', 'Duration', 'End', sortiert nach Start
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unbekannte Regel '{rule}', erlaubt: {', '.join(RULES)}")
+
+    job_ids = [job for job, operations in jssp.items() if operations]
+    job_lengths = np.array([len(jssp[job]) for job in job_ids], dtype=np.int64)
+    job_offsets = np.concatenate(([0], np.cumsum(job_lengths)[:-1])).astype(np.int64)
+
+    flat = [op for job in job_ids for op in jssp[job]]
+    if not flat:
+        return pd.DataFrame(columns=["Job", "Machine", "Start", "Duration", "End"])
+    op_machine_ids = np.array([machine for machine, _ in flat], dtype=np.int64)
+    raw_durations = np.array([duration for _, duration in flat])
+    op_durations = raw_durations.astype(float)
+
+    machine_ids, op_machines = np.unique(op_machine_ids, return_inverse=True)
+    machine_ready_times = np.full(len(machine_ids), float(start_time))
+    for machine, ready in (machine_ready or {}).items():
+        idx = np.searchsorted(machine_ids, machine)
+        if idx < len(machine_ids) and machine_ids[idx] == machine:
+            machine_ready_times[idx] = max(ready, start_time)
+
+    # Restarbeit ab jeder Operation (Suffixsummen je Job)
+    job_of_op = np.repeat(np.arange(len(job_ids)), job_lengths)
+    cumulative = np.cumsum(op_durations)
+    job_end_cumulative = cumulative[job_offsets + job_lengths - 1]
+    remaining_work = job_end_cumulative[job_of_op] - cumulative + op_durations
+    job_totals = remaining_work[job_offsets]
+
+    if due_dates is not None:
+        due = np.array([due_dates.get(job, np.inf) for job in job_ids], dtype=float)
+    else:
+        due = job_totals
+
+    job_ready = np.full(len(job_ids), float(start_time))
+    job_next = np.zeros(len(job_ids), dtype=np.int64)
+    active = np.arange(len(job_ids))
+
+    starts = np.empty(len(flat))
+
+    while len(active):
+        ops = job_offsets[active] + job_next[active]
+        machines = op_machines[ops]
+        durations = op_durations[ops]
+        earliest_starts = np.maximum(job_ready[active], machine_ready_times[machines])
+        earliest_ends = earliest_starts + durations
+
+        # Maschine mit der frühesten möglichen Fertigstellung und ihre Konfliktmenge
+        k = np.argmin(earliest_ends)
+        machine = machines[k]
+        conflict = np.flatnonzero((machines == machine) & (earliest_starts < earliest_ends[k]))
+
+        if rule == "SPT":
+            priority = durations[conflict]
+        elif rule == "LPT":
+            priority = -durations[conflict]
+        elif rule == "MWKR":
+            priority = -remaining_work[ops[conflict]]
+        elif rule == "FIFO":
+            priority = job_ready[active[conflict]]
+        else:  # EDD
+            priority = due[active[conflict]]
+        chosen = conflict[np.argmin(priority)]
+
+        job = active[chosen]
+        op = ops[chosen]
+        start = earliest_starts[chosen]
+        end = start + durations[chosen]
+
+        starts[op] = start
+        job_ready[job] = end
+        machine_ready_times[machine] = end
+        job_next[job] += 1
+        if job_next[job] == job_lengths[job]:
+            active = np.delete(active, chosen)
+
+    df_plan = pd.DataFrame({
+        "Job": np.repeat(np.array(job_ids, dtype=object), job_lengths),
+        "Machine": np.char.add("M", machine_ids[op_machines].astype(str)).astype(object),
+        "Start": starts,
+        "Duration": raw_durations,
+        "End": starts + op_durations,
+    })
+    return df_plan.sort_values(["Start", "Job"], kind="stable").reset_index(drop=True)
+
+
+def make_dispatch_scheduler(rule="SPT", **kwargs):
+    """Liefert einen scheduler(jssp, day) für run_rolling_horizon auf Basis von dispatch_schedule."""
+    def scheduler(jssp, day):
+        return dispatch_schedule(jssp, rule=rule, **kwargs)
+    return scheduler
@@ -0,0 +1,262 @@
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+SCHEMES = ("iid", "antithetic", "lhs")
+
+
+# --- Verteilungen für simulierte Bearbeitungsdauern ---
+
+class DurationSampler:
+    """
+    Basisklasse: zieht simulierte Dauern für viele Operationen auf einmal.
+    Unterklassen implementieren sample() vektorisiert mit einem numpy.random.Generator.
+    """
+
+    def sample(self, rng, durations, machines, size=None):
+        """
+        Args:
+            rng (numpy.random.Generator): Zufallsstrom
+            durations (ndarray): geplante Dauern je Operation
+            machines (ndarray): Maschine je Operation (für maschinenspezifische Verteilungen)
+            size (int, optional): Anzahl Replikationen -> Ergebnis-Shape (size, n_ops)
+
+        Returns:
+            ndarray: simulierte Dauern, Shape (n_ops,) bzw. (size, n_ops)
+        """
+        raise NotImplementedError
+
+    def ppf(self, uniforms, durations, machines):
+        """
+        Quantilfunktion: bildet Gleichverteilte aus (0, 1) auf Dauern ab (für antithetische
+        und Latin-Hypercube-Ziehungen). uniforms hat die Shape (n_ops,) bzw. (size, n_ops).
+        """
+        raise NotImplementedError(f"{type(self).__name__} unterstützt nur unabhängige Ziehungen (scheme='iid')")
+
+
+def _shape(durations, size):
+    return durations.shape if size is None else (size,) + durations.shape
+
+
+class LogNormalSampler(DurationSampler):
+    """Lognormal(log(duration), vc) (Erwartungswert liegt oberhalb von duration)."""
+
+    def __init__(self, vc=0.2):
+        self.vc = vc
+
+    def sample(self, rng, durations, machines, size=None):
+        return rng.lognormal(mean=np.log(durations), sigma=self.vc, size=_shape(durations, size))
+
+    def ppf(self, uniforms, durations, machines):
+        return np.exp(np.log(durations) + self.vc * norm_ppf(uniforms))
+
+
+class TruncatedNormalSampler(DurationSampler):
+    """
+    Normalverteilung mit Mittelwert duration und Standardabweichung vc * duration,
+    abgeschnitten auf [lower * duration, upper * duration] (Verwerfungsmethode).
+    """
+
+    def __init__(self, vc=0.2, lower=0.5, upper=None):
+        self.vc = vc
+        self.lower = lower
+        self.upper = upper
+
+    def sample(self, rng, durations, machines, size=None):
+        shape = _shape(durations, size)
+        durations = np.broadcast_to(durations, shape)
+        low = self.lower * durations
+        high = np.inf if self.upper is None else self.upper * durations
+
+        result = rng.normal(durations, self.vc * durations)
+        invalid = (result < low) | (result > high)
+        while invalid.any():
+            result[invalid] = rng.normal(durations[invalid], self.vc * durations[invalid])
+            invalid = (result < low) | (result > high)
+        return result
+
+    def ppf(self, uniforms, durations, machines):
+        # Standardisierte Grenzen sind für alle Operationen gleich
+        normal = NormalDist()
+        cdf_low = normal.cdf((self.lower - 1) / self.vc)
+        cdf_high = 1.0 if self.upper is None else normal.cdf((self.upper - 1) / self.vc)
+        return durations * (1 + self.vc * norm_ppf(cdf_low + uniforms * (cdf_high - cdf_low)))
+
+
+class EmpiricalSampler(DurationSampler):
+    """
+    Empirische Verteilung je Maschine: zieht Verhältnisse (Ist-Dauer / Plan-Dauer)
+    aus vergangenen df_execution-Logs und skaliert damit die geplante Dauer.
+    Maschinen ohne Historie nutzen die Verhältnisse aller Maschinen.
+    """
+
+    def __init__(self, ratios_by_machine):
+        """
+        Args:
+            ratios_by_machine (dict): {Maschine: Array der Verhältnisse Ist/Plan}
+        """
+        self.ratios_by_machine = {m: np.asarray(r, dtype=float) for m, r in ratios_by_machine.items()}
+        self.pooled_ratios = np.concatenate(list(self.ratios_by_machine.values()))
+
+    @classmethod
+    def fit(cls, df_plan, df_execution):
+        """Ermittelt die Verhältnisse aus Plan und ausgeführten Operationen (Zuordnung über Job, Machine)."""
+        df_merged = df_execution[["Job", "Machine", "Duration"]].merge(
+            df_plan[["Job", "Machine", "Duration"]],
+            on=["Job", "Machine"],
+            suffixes=("", " Planned")
+        )
+        df_merged["Ratio"] = df_merged["Duration"] / df_merged["Duration Planned"]
+        return cls({m: group.to_numpy() for m, group in df_merged.groupby("Machine")["Ratio"]})
+
+    def sample(self, rng, durations, machines, size=None):
+        shape = _shape(durations, size)
+        result = np.empty(shape)
+        for machine in pd.unique(machines):
+            mask = machines == machine
+            ratios = self.ratios_by_machine.get(machine, self.pooled_ratios)
+            drawn = rng.choice(ratios, size=shape[:-1] + (int(mask.sum()),))
+            result[..., mask] = drawn * durations[mask]
+        return result
+
+    def ppf(self, uniforms, durations, machines):
+        result = np.empty(np.shape(uniforms))
+        for machine in pd.unique(machines):
+            mask = machines == machine
+            ratios = np.sort(self.ratios_by_machine.get(machine, self.pooled_ratios))
+            idx = np.minimum((uniforms[..., mask] * len(ratios)).astype(np.int64), len(ratios) - 1)
+            result[..., mask] = ratios[idx] * durations[mask]
+        return result
+
+
+# --- Normalverteilung (vektorisiert, ohne SciPy) ---
+
+# Koeffizienten der rationalen Approximation nach Acklam (relativer Fehler < 1.2e-9)
+_PPF_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+          1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_PPF_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+          6.680131188771972e+01, -1.328068155288572e+01)
+_PPF_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+          -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_PPF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+          3.754408661907416e+00)
+
+
+def norm_ppf(uniforms):
+    """Quantilfunktion der Standardnormalverteilung für Arrays aus (0, 1)."""
+    u = np.asarray(uniforms, dtype=float)
+    a, b, c, d = _PPF_A, _PPF_B, _PPF_C, _PPF_D
+    result = np.empty_like(u)
+
+    tail = np.minimum(u, 1 - u)
+    central = tail >= 0.02425
+    q = u[central] - 0.5
+    r = q * q
+    result[central] = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+                      (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+
+    q = np.sqrt(-2 * np.log(tail[~central]))
+    z = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+        ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+    result[~central] = np.where(u[~central] < 0.5, z, -z)
+    return result
+
+
+# --- Gleichverteilte für varianzreduzierte Ziehungen ---
+
+def draw_uniforms(rng, n_ops, size, scheme="antithetic"):
+    """
+    Gleichverteilte (size, n_ops) für varianzreduzierte Replikationen:
+    - antithetic: Paare (u, 1 - u) in aufeinanderfolgenden Replikationen (size muss gerade sein)
+    - lhs: Latin Hypercube, je Operation fällt genau eine Replikation in jedes der size Intervalle
+    """
+    if scheme == "antithetic":
+        if size % 2:
+            raise ValueError(f"Antithetische Ziehung benötigt eine gerade Anzahl Replikationen, erhalten: {size}")
+        half = rng.random((size // 2, n_ops))
+        uniforms = np.empty((size, n_ops))
+        uniforms[0::2] = half
+        uniforms[1::2] = 1 - half
+        return uniforms
+
+    if scheme == "lhs":
+        strata = rng.permuted(np.tile(np.arange(size), (n_ops, 1)), axis=1).T
+        return (strata + rng.random((size, n_ops))) / size
+
+    raise ValueError(f"Unbekanntes Schema '{scheme}', erlaubt: {', '.join(SCHEMES)}")
+
+
+# --- Prüfung der Randverteilung ---
+
+def ks_lognormal_check(sim_durations, planned_durations, vc):
+    """
+    Kolmogorov-Smirnov-Test, ob simulierte Dauern (auch aus antithetischen oder LHS-Ziehungen)
+    je Operation der Randverteilung Lognormal(log(duration), vc) folgen: die standardisierten
+    Werte (log(x) - log(d)) / vc werden gepoolt gegen die Standardnormalverteilung getestet.
+    Bei abhängigen Ziehungen (antithetisch, LHS) ist der Test konservativ.
+
+    Args:
+        sim_durations (ndarray): simulierte Dauern, Shape (size, n_ops) oder (n_ops,)
+        planned_durations (ndarray): geplante Dauern je Operation (n_ops,)
+        vc (float): Variationskoeffizient
+
+    Returns:
+        (float, float): KS-Statistik D und asymptotischer p-Wert
+    """
+    z = np.sort(((np.log(sim_durations) - np.log(planned_durations)) / vc).ravel())
+    n = len(z)
+    cdf = 0.5 * (1 + np.frompyfunc(math.erf, 1, 1)(z / math.sqrt(2)).astype(float))
+    statistic = max(np.max(np.arange(1, n + 1) / n - cdf), np.max(cdf - np.arange(n) / n))
+
+    # Kolmogorov-Verteilung (Reihe) mit Korrektur nach Stephens
+    lam = (math.sqrt(n) + 0.12 + 0.11 / math.sqrt(n)) * statistic
+    p_value = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 101))
+    return statistic, min(max(p_value, 0.0), 1.0)
+
+
+# --- Ziehen für einen Tagesplan ---
+
+def _text_ranks(values):
+    """Rang jedes Werts in der Sortierung seiner Textdarstellung (unabhängig von dtype und Kategorienfolge)."""
+    codes, labels = pd.factorize(values)
+    ranks = np.empty(len(labels), dtype=np.int64)
+    ranks[np.argsort(np.asarray(labels, dtype=str), kind="stable")] = np.arange(len(labels))
+    return ranks[codes]
+
+
+def draw_durations(df_plan, sampler, rng, size=None, scheme="iid"):
+    """
+    Zieht die simulierten Dauern für alle Operationen des Plans vorab.
+
+    Die Ziehung erfolgt in der Reihenfolge (Job, Machine), unabhängig von der Zeilen-
+    reihenfolge des Plans. Zwei Pläne mit denselben Operationen erhalten bei gleichem
+    Seed also dieselben Störungen (Common Random Numbers).
+
+    Args:
+        df_plan (DataFrame): Tagesplan mit 'Job', 'Machine', 'Duration'
+        sampler (DurationSampler): Verteilung der simulierten Dauern
+        rng (numpy.random.Generator): Zufallsstrom
+        size (int, optional): Anzahl Replikationen
+        scheme (str): "iid" (unabhängig), "antithetic" oder "lhs" (nur mit size, benötigt sampler.ppf)
+
+    Returns:
+        ndarray: Dauern je Planzeile (Position), Shape (n_ops,) bzw. (size, n_ops), auf 2 Stellen gerundet
+    """
+    machines = df_plan["Machine"].to_numpy()
+    durations = df_plan["Duration"].to_numpy(dtype=float)
+
+    # Reihenfolge der Namen als Text (auch bei kategorialen Plänen mit M2 vor M10), lexsort auf Zahlen
+    order = np.lexsort((_text_ranks(df_plan["Machine"]), _text_ranks(df_plan["Job"])))
+    if scheme == "iid":
+        drawn = sampler.sample(rng, durations[order], machines[order], size=size)
+    elif size is None:
+        raise ValueError(f"Schema '{scheme}' benötigt eine Anzahl Replikationen (size)")
+    else:
+        uniforms = draw_uniforms(rng, len(order), size, scheme)
+        drawn = sampler.ppf(uniforms, durations[order], machines[order])
+
+    result = np.empty_like(drawn)
+    result[..., order] = drawn
+    return np.round(result, 2)
@@ -0,0 +1,154 @@
+import csv
+import json
+from collections import deque
+
+import pandas as pd
+
+
+# --- Hilfsfunktionen (Formatierung nur für textuelle Ausgaben) ---
+
+def get_time_str(minutes_in):
+    """Wandle Minuten in HH:MM:SS um, einfach basierend auf Minuten."""
+    minutes_total = int(minutes_in)
+    seconds = int((minutes_in - minutes_total) * 60)
+    hours = minutes_total // 60
+    minutes = minutes_total % 60
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def get_duration(minutes_in):
+    minutes = int(minutes_in)
+    seconds = int(round((minutes_in - minutes) * 60))
+    parts = []
+    if minutes:
+        parts.append(f"{minutes:02} minute{'s' if minutes != 1 else ''}")
+    if seconds:
+        parts.append(f"{seconds:02} second{'s' if seconds != 1 else ''}")
+
+    return " ".join(parts) if parts else ""
+
+
+# Ereignisse als Rohdaten: (Event, Time, Job, Machine, Value)
+# Value: simulierte Dauer (finished), geplantes Ende (interrupted), sonst None
+STARTED = "started"
+FINISHED = "finished"
+INTERRUPTED = "interrupted"
+RECORD_FIELDS = ("Event", "Time", "Job", "Machine", "Value")
+
+
+# --- Schnittstelle ---
+
+class EventSink:
+    """
+    Empfänger der Simulationsereignisse. Die Simulation ruft für jeden registrierten
+    Sink die drei Methoden auf; die Basisklasse ignoriert alle Ereignisse.
+    """
+
+    def job_started(self, time_stamp, job_id, machine_name):
+        pass
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        pass
+
+    def job_interrupted(self, time_stamp, job_id, machine_name, planned_end):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullSink(EventSink):
+    """Verwirft alle Ereignisse. Wird von der Simulation gar nicht erst registriert (keine Kosten)."""
+
+
+class ConsoleSink(EventSink):
+    """Bisherige Konsolenausgabe der Simulation."""
+
+    def job_started(self, time_stamp, job_id, machine_name):
+        print(f"[{get_time_str(time_stamp)}] {job_id} started on {machine_name}")
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        print(f"[{get_time_str(time_stamp)}] {job_id} finished on {machine_name} (after {get_duration(sim_duration)})")
+
+    def job_interrupted(self, time_stamp, job_id, machine_name, planned_end):
+        print(
+            f"[{get_time_str(time_stamp)}] {job_id} interrupted before machine "
+            f"{machine_name} — would finish too late at {get_time_str(planned_end)}"
+        )
+
+
+class RingBufferSink(EventSink):
+    """Hält die letzten `capacity` Ereignisse als Tupel im Speicher (ältere fallen heraus)."""
+
+    def __init__(self, capacity=10000):
+        self.buffer = deque(maxlen=capacity)
+
+    def job_started(self, time_stamp, job_id, machine_name):
+        self.buffer.append((STARTED, time_stamp, job_id, machine_name, None))
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        self.buffer.append((FINISHED, time_stamp, job_id, machine_name, sim_duration))
+
+    def job_interrupted(self, time_stamp, job_id, machine_name, planned_end):
+        self.buffer.append((INTERRUPTED, time_stamp, job_id, machine_name, planned_end))
+
+    def records(self):
+        return list(self.buffer)
+
+    def to_dataframe(self):
+        return pd.DataFrame(self.records(), columns=list(RECORD_FIELDS))
+
+
+class FileSink(RingBufferSink):
+    """
+    Schreibt Ereignisse gepuffert als JSONL oder CSV. Die Tupel werden erst beim
+    Leeren des Puffers (alle `buffer_size` Ereignisse bzw. bei close()) formatiert.
+    """
+
+    def __init__(self, path, file_format="jsonl", buffer_size=10000):
+        if file_format not in ("jsonl", "csv"):
+            raise ValueError(f"Unbekanntes Format '{file_format}', erlaubt: jsonl, csv")
+
+        super().__init__(capacity=None)
+        self.path = path
+        self.file_format = file_format
+        self.buffer_size = buffer_size
+        self.file = open(path, "w", newline="", encoding="utf-8")
+
+        if file_format == "csv":
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(RECORD_FIELDS)
+
+    def job_started(self, time_stamp, job_id, machine_name):
+        super().job_started(time_stamp, job_id, machine_name)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        super().job_finished(time_stamp, job_id, machine_name, sim_duration)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def job_interrupted(self, time_stamp, job_id, machine_name, planned_end):
+        super().job_interrupted(time_stamp, job_id, machine_name, planned_end)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.file_format == "csv":
+            self.writer.writerows(self.buffer)
+        else:
+            self.file.writelines(json.dumps(dict(zip(RECORD_FIELDS, record))) + "\n" for record in self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,406 @@
+import heapq
+import math
+from collections import deque
+from itertools import count
+
+# Ereignisarten im Heap
+ARRIVE = 0   # Job erreicht (nach Wartezeit auf den geplanten Start) die Maschine
+GRANT = 1    # Maschine wird dem Job zugeteilt
+FINISH = 2   # Operation ist fertig bearbeitet
+RELEASE = 3  # Freigabe der Maschine wird verarbeitet -> nächster Wartender
+BLOCK = 4    # Maschine fällt aus (nur in Was-wäre-wenn-Forks, siehe Snapshot)
+UNBLOCK = 5  # Maschine ist wieder verfügbar
+
+
+class FastEngine:
+    """
+    Spezialisierter Ereignis-Kernel für ProductionDaySimulation (engine="fast").
+
+    Statt eines SimPy-Generators pro Job und eines simpy.Resource pro Maschine
+    gibt es nur eine Prioritätswarteschlange (Zeit, Sequenznummer, Art, Ziel).
+    Die Ereignisse und ihre Reihenfolge entsprechen exakt denen von SimPy
+    (Timeout -> Request -> Release, Warteschlangen-Regel je Maschine, Abbruchregel),
+    daher liefern beide Engines bei gleichem Seed identische Ergebnisse.
+    FIFO-Warteschlangen sind deques, alle anderen Regeln Heaps (Schlüssel, Reihenfolge, Job).
+
+    Ereignisse zum aktuellen Zeitpunkt (Zuteilung, Freigabe, Ankunft ohne Wartezeit) landen
+    nicht im Heap, sondern in einer FIFO-Liste: Sie wären ohnehin nach allen schon
+    eingeplanten Ereignissen dieses Zeitpunkts an der Reihe. Eine Freigabe, die als Nächstes
+    verarbeitet würde, übergibt die Maschine direkt im FINISH an den ersten Wartenden.
+    Maschinen sind über ihren Code (OperationStore.machine_codes) indiziert; Starts und
+    Enden werden gesammelt und am Ende jedes run() in den OperationStore geschrieben.
+    """
+
+    def __init__(self, simulation, jobs, state=None):
+        """
+        Args:
+            simulation (ProductionDaySimulation): Simulation, deren Logs und Ausgaben befüllt werden
+            jobs (list): [(job_id, [op_id, ...]), ...] wie von ProductionDaySimulation._init_jobs
+            state (dict, optional): mit state() gesicherter Zustand, der statt der ersten Ankünfte übernommen wird
+        """
+        self.simulation = simulation
+        self.store = simulation.store
+        self.jobs = jobs
+        self.now = 0
+
+        # Spalten des OperationStore als Listen (schneller Einzelzugriff im Hot Path)
+        self.machine_names = self.store.machines.tolist()
+        self.machine_index = {name: code for code, name in enumerate(self.machine_names)}
+        self.op_machine = self.store.machine_codes.tolist()
+        self.planned_start = self.store.planned_start.tolist()
+        self.planned_duration = self.store.planned_duration.tolist()
+        self.sim_duration = self.store.sim_duration.tolist()
+
+        n_machines = len(self.machine_names)
+        self.op_index = [0] * len(jobs)
+        self.busy = [False] * n_machines
+        self.busy_until = [0] * n_machines  # Ende der zuletzt begonnenen Operation
+        self.queue_keys = [simulation.queue_keys.get(name) for name in self.machine_names]
+        self.queues = [deque() if key is None else [] for key in self.queue_keys]
+        self.queue_order = count()  # Anfragereihenfolge (Gleichstand in Heap-Warteschlangen)
+        self.blocked_until = {}  # Maschinen-Code -> Ende des laufenden Ausfalls
+        self.priority_jobs = set()  # Job-Indizes, die sich in Warteschlangen vorne einreihen
+
+        self.heap = []
+        self.ready = deque()  # (Art, Ziel) zum Zeitpunkt now, in Reihenfolge der Einplanung
+        self.sequence = count()
+        self.processed = 0
+
+        if state is not None:
+            self.restore(state)
+            return
+
+        # Entspricht der Initialisierung der SimPy-Prozesse (in Job-Reihenfolge)
+        for job_idx, (_, op_ids) in enumerate(jobs):
+            if op_ids:
+                self._push(max(self.planned_start[op_ids[0]] - self.now, 0), ARRIVE, job_idx)
+        self._init_routes()
+
+    def _init_routes(self):
+        """Job-Ids, Routen und aktuelle Operation je Job als Listen (bleiben über mehrere run() erhalten)."""
+        self.job_ids = [job_id for job_id, _ in self.jobs]
+        self.routes = [op_ids for _, op_ids in self.jobs]
+        # aktuelle Operation je Job (route[op_index]; nach dem Routenende die letzte)
+        self.current_op = [op_ids[min(index, len(op_ids) - 1)] if op_ids else -1
+                           for index, op_ids in zip(self.op_index, self.routes)]
+
+    def _push(self, delay, kind, target):
+        time_stamp = self.now + delay
+        if time_stamp == self.now:
+            self.ready.append((kind, target))
+        else:
+            heapq.heappush(self.heap, (time_stamp, next(self.sequence), kind, target))
+
+    def events_processed(self):
+        """Anzahl der bisher verarbeiteten Ereignisse."""
+        return self.processed
+
+    def run(self, until, stop=None):
+        """
+        Verarbeitet alle Ereignisse mit Zeitpunkt < until (wie env.run(until=until)).
+        Mit stop < until wird vorher angehalten; ein weiterer Aufruf setzt den Lauf unverändert fort.
+        """
+        stop = until if stop is None else min(stop, until)
+        started_ops, started_times, finished_ops, finished_times = [], [], [], []
+        try:
+            self._run(until, stop, started_ops, started_times, finished_ops, finished_times)
+        finally:
+            self._write_results(started_ops, started_times, finished_ops, finished_times)
+
+    def _write_results(self, started_ops, started_times, finished_ops, finished_times):
+        """Schreibt die gesammelten Starts und Enden (ungerundet, in Reihenfolge) in den OperationStore."""
+        self.store.mark_started_many(started_ops, started_times)
+        self.store.mark_finished_many(finished_ops, finished_times)
+
+    def _interrupt(self, op_id, time_stamp):
+        """Start der Operation zu time_stamp abgelehnt (Abbruchregel)."""
+        self.store.mark_interrupted(op_id)
+
+    def _run(self, until, stop, started_ops, started_times, finished_ops, finished_times):
+        simulation = self.simulation
+        metrics = simulation.metrics
+        machines = [simulation.machines[name] for name in self.machine_names]
+        emit = bool(simulation.sinks)  # ohne Sinks keine Aufrufe im Hot Path
+        job_ids = self.job_ids
+        routes = self.routes
+        machine_names = self.machine_names
+        op_machine = self.op_machine
+        planned_start = self.planned_start
+        planned_duration = self.planned_duration
+        sim_durations = self.sim_duration
+        op_index = self.op_index
+        current_op = self.current_op
+        busy = self.busy
+        busy_until = self.busy_until
+        latest_start = simulation.latest_start
+        prune_machine = simulation.prune == "machine"
+        queues = self.queues
+        queue_keys = self.queue_keys
+        queue_order = self.queue_order
+        priority_jobs = self.priority_jobs
+        heap = self.heap
+        ready = self.ready
+        sequence = self.sequence
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        popleft = ready.popleft
+        append_ready = ready.append
+        start_op = started_ops.append
+        start_time = started_times.append
+        finish_op = finished_ops.append
+        finish_time = finished_times.append
+        now = self.now
+        processed = 0
+        inline = False  # kind/target enthalten bereits das nächste Ereignis (wäre ohnehin als Nächstes dran)
+        # Heap enthält noch Ereignisse zum Zeitpunkt now (neue Heap-Einträge liegen immer nach now)
+        heap_now = bool(heap) and heap[0][0] <= now
+
+        try:
+            while True:
+                # Reihenfolge (Zeit, Sequenznummer): erst der Heap zum Zeitpunkt now, dann die FIFO-Liste
+                if inline:
+                    inline = False
+                elif heap_now:
+                    _, _, kind, target = heappop(heap)
+                    heap_now = heap[0][0] <= now if heap else False
+                elif ready:
+                    kind, target = popleft()
+                elif heap and heap[0][0] < stop:
+                    now, _, kind, target = heappop(heap)
+                    heap_now = heap[0][0] <= now if heap else False
+                else:
+                    break
+                processed += 1
+
+                if kind == RELEASE:
+                    queue = queues[target]
+                    if not busy[target] and queue:
+                        busy[target] = True
+                        next_job = queue.popleft() if queue_keys[target] is None else heappop(queue)[2]
+                        if ready or heap_now:
+                            append_ready((GRANT, next_job))
+                        else:
+                            kind, target, inline = GRANT, next_job, True
+                    continue
+                if kind > RELEASE:
+                    self.now = now
+                    self._handle_block(kind, target)
+                    continue
+
+                op_id = current_op[target]
+                machine = op_machine[op_id]
+
+                if kind == ARRIVE:
+                    if latest_start is not None and (max(now, busy_until[machine]) if prune_machine
+                                                     else now) > latest_start[op_id]:
+                        # prune: Rest des Jobs aufgeben, ohne die Maschine anzufragen
+                        simulation.prune_job(now, job_ids[target], machines[machine], routes[target][op_index[target]:])
+                        continue
+
+                    # machine.request(): bei freier Maschine erhält der erste Wartende den Zuschlag
+                    if metrics is not None:
+                        metrics.request(now, job_ids[target], machine_names[machine])
+                    if busy[machine]:
+                        queue = queues[machine]
+                        if queue_keys[machine] is not None:
+                            key = -math.inf if priority_jobs and target in priority_jobs else queue_keys[machine](op_id, now)
+                            heappush(queue, (key, next(queue_order), target))
+                        elif priority_jobs and target in priority_jobs:
+                            queue.appendleft(target)
+                        else:
+                            queue.append(target)
+                        continue
+
+                    busy[machine] = True
+                    queue = queues[machine]
+                    next_job = target
+                    if queue_keys[machine] is not None:
+                        # Heap-Warteschlange: bei freier Maschine erhält der kleinste Schlüssel den Zuschlag
+                        key = -math.inf if priority_jobs and target in priority_jobs else queue_keys[machine](op_id, now)
+                        heappush(queue, (key, next(queue_order), target))
+                        next_job = heappop(queue)[2]
+                    elif queue and not (priority_jobs and target in priority_jobs):
+                        next_job = queue.popleft()
+                        queue.append(target)
+                    if ready or heap_now:
+                        append_ready((GRANT, next_job))
+                        continue
+                    kind, inline = GRANT, True
+                    if next_job == target:
+                        # gleiche Operation: direkt weiter mit der Zuteilung
+                        inline = False
+                        processed += 1
+                    else:
+                        target = next_job
+                        continue
+
+                if kind == GRANT:
+                    duration = planned_duration[op_id]
+                    if metrics is not None:
+                        metrics.grant(now, job_ids[target], machine_names[machine])
+                    if now + duration > until and simulation.job_cannot_finish_on_time(
+                            job_ids[target], machines[machine], now, duration):
+                        # GANZEN JOB abbrechen, Maschine wird sofort wieder freigegeben
+                        self._interrupt(op_id, now)
+                        if metrics is not None:
+                            metrics.abort(now, job_ids[target], machine_names[machine])
+                        busy[machine] = False
+                        if queues[machine]:
+                            append_ready((RELEASE, machine))
+                        continue
+
+                    if emit:
+                        simulation.job_started_on_machine(now, job_ids[target], machines[machine])
+                    start_op(op_id)
+                    start_time(now)
+                    if metrics is not None:
+                        metrics.start(now, job_ids[target], machine_names[machine])
+                    end = busy_until[machine] = now + sim_durations[op_id]
+                    if end == now:
+                        append_ready((FINISH, target))
+                    else:
+                        heappush(heap, (end, next(sequence), FINISH, target))
+                    continue
+
+                # FINISH
+                if emit:
+                    simulation.job_finished_on_machine(now, job_ids[target], machines[machine], sim_durations[op_id])
+
+                # Freigabe ohne Wartende bewirkt nichts und wird daher nicht eingeplant;
+                # wäre sie das nächste Ereignis, geht die Maschine direkt an den ersten Wartenden
+                busy[machine] = False
+                queue = queues[machine]
+                hand_over = False
+                if queue:
+                    if ready or heap_now:
+                        append_ready((RELEASE, machine))
+                    else:
+                        hand_over = True
+                        processed += 1  # die übergangene Freigabe zählt als Ereignis
+                        busy[machine] = True
+
+                finish_op(op_id)
+                finish_time(now)
+                if metrics is not None:
+                    metrics.finish(now, job_ids[target], machine_names[machine])
+
+                route = routes[target]
+                index = op_index[target] = op_index[target] + 1
+                arrive_now = False
+                if index < len(route):
+                    op_id = current_op[target] = route[index]
+                    next_time = now + max(planned_start[op_id] - now, 0)
+                    if next_time != now:
+                        heappush(heap, (next_time, next(sequence), ARRIVE, target))
+                    elif ready or heap_now:
+                        append_ready((ARRIVE, target))
+                    else:
+                        arrive_now = True
+
+                if hand_over:
+                    # Zuteilung der Freigabe nach der Ankunft einplanen (Reihenfolge wie SimPy)
+                    next_job = queue.popleft() if queue_keys[machine] is None else heappop(queue)[2]
+                    if arrive_now:
+                        append_ready((GRANT, next_job))
+                        kind, inline = ARRIVE, True
+                    else:
+                        kind, target, inline = GRANT, next_job, True
+                elif arrive_now:
+                    kind, inline = ARRIVE, True
+        finally:
+            self.now = now
+            self.processed += processed
+
+    # Was-wäre-wenn: Zustand sichern/wiederherstellen und Eingriffe ---------------------
+    def state(self):
+        """Kopie des Kernel-Zustands (Heap, Maschinenbelegung, Warteschlangen, Fortschritt je Job)."""
+        return {
+            "now": self.now,
+            "heap": list(self.heap),
+            "ready": tuple(self.ready),
+            "sequence": next(self.sequence),
+            "processed": self.processed,
+            "op_index": list(self.op_index),
+            "busy": list(self.busy),
+            "busy_until": list(self.busy_until),
+            "queues": [tuple(queue) for queue in self.queues],
+            "queue_order": next(self.queue_order),
+            "blocked_until": dict(self.blocked_until),
+            "priority_jobs": set(self.priority_jobs),
+        }
+
+    def restore(self, state):
+        """Übernimmt einen mit state() gesicherten Zustand (der OperationStore wird separat kopiert)."""
+        self.now = state["now"]
+        self.heap = list(state["heap"])
+        self.ready = deque(state["ready"])
+        self.sequence = count(state["sequence"])
+        self.processed = state["processed"]
+        self.op_index = list(state["op_index"])
+        self._init_routes()
+        self.busy = list(state["busy"])
+        self.busy_until = list(state["busy_until"])
+        self.queues = [deque(queue) if key is None else list(queue)
+                       for key, queue in zip(self.queue_keys, state["queues"])]
+        self.queue_order = count(state["queue_order"])
+        self.blocked_until = dict(state["blocked_until"])
+        self.priority_jobs = set(state["priority_jobs"])
+
+    def block_machine(self, machine_name, start, end):
+        """
+        Plant einen Ausfall der Maschine im Zeitraum [start, end) ein.
+        Eine zu Beginn laufende Operation wird nicht unterbrochen, der Ausfall beginnt nach ihrem Ende.
+        """
+        if machine_name not in self.machine_index:
+            raise ValueError(f"Unbekannte Maschine '{machine_name}'")
+        start = max(start, self.now)
+        if end > start:
+            heapq.heappush(self.heap, (start, next(self.sequence), BLOCK, (self.machine_index[machine_name], end)))
+
+    def prioritise_job(self, job_id):
+        """Job reiht sich ab sofort in jeder Warteschlange vorne ein (auch in der aktuellen)."""
+        job_idx = next((idx for idx, (job, _) in enumerate(self.jobs) if job == job_id), None)
+        if job_idx is None:
+            raise ValueError(f"Unbekannter Job '{job_id}'")
+        self.priority_jobs.add(job_idx)
+        for queue_key, queue in zip(self.queue_keys, self.queues):
+            if queue_key is not None:
+                queue[:] = [(-math.inf, order, job) if job == job_idx else (key, order, job)
+                            for key, order, job in queue]
+                heapq.heapify(queue)
+            elif job_idx in queue:
+                queue.remove(job_idx)
+                queue.appendleft(job_idx)
+
+    def _handle_block(self, kind, target):
+        machine, end = target
+        if kind == UNBLOCK:
+            self.busy[machine] = False
+            del self.blocked_until[machine]
+            if self.queues[machine]:
+                self._push(0, RELEASE, machine)
+            return
+
+        if self.now >= end:
+            return
+        if not self.busy[machine]:
+            self.busy[machine] = True
+            self.blocked_until[machine] = end
+            self._push(end - self.now, UNBLOCK, target)
+            return
+
+        # Maschine belegt: erneut versuchen, sobald sie frei wird
+        ready = self.blocked_until.get(machine)
+        if ready is None:
+            ready = self._finish_time(machine)
+        self._push(max(ready - self.now, 0), BLOCK, target)
+
+    def _finish_time(self, machine):
+        """Ende der laufenden Operation auf der Maschine (steht die Zuteilung noch aus: jetzt)."""
+        pending = [(self.now, kind, target) for kind, target in self.ready]
+        for time_stamp, kind, target in pending + [(t, kind, target) for t, _, kind, target in self.heap]:
+            if kind == FINISH:
+                _, op_ids = self.jobs[target]
+                if self.op_machine[op_ids[self.op_index[target]]] == machine:
+                    return time_stamp
+        return self.now
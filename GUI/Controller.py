@@ -1,8 +1,14 @@
+import queue
+from collections import deque
+
+from EventSink import FINISHED, STARTED, EventSink
 from GUI.Operation import Operation
 from Job import Job
 from Machine import Machine
 
-class Controller:
+TIMEOUT = "timeout"
+
+class Controller(EventSink):
     def __init__(self, gui_view=None):
         self.gui_view = gui_view
         self.simulation = None
@@ -11,12 +17,59 @@ class Controller:
         self.job_color_idx = 0
         self.operations = {}  # <-- Ergänzt: Dictionary für aktive Operationen (optional, für Zugriff später)
 
-    def job_started_on_machine(self, time_stamp, job_id, machine):
+        # Ereignisse aus dem Simulations-Thread (thread-sicher), abgearbeitet im Tk-Thread
+        self.event_queue = queue.Queue()
+        self.pending_events = deque()
+
+    # EventSink (Simulations-Thread: nur einreihen, keine Tk-Aufrufe) ----------------
+    def job_started(self, time_stamp, job_id, machine_name):
+        if self.gui_view:
+            self.event_queue.put((time_stamp, STARTED, job_id, machine_name, None))
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        if self.gui_view:
+            self.event_queue.put((time_stamp, FINISHED, job_id, machine_name, sim_duration))
+
+    def process_events(self, max_time=None, max_events=None):
+        """
+        Arbeitet eingereihte Ereignisse im GUI-Thread ab.
+
+        Args:
+            max_time (float, optional): nur Ereignisse bis zu dieser Simulationszeit (Wiedergabe-Uhr)
+            max_events (int, optional): höchstens so viele Ereignisse pro Aufruf
+
+        Returns:
+            int: Anzahl abgearbeiteter Ereignisse
+        """
+        while True:
+            try:
+                self.pending_events.append(self.event_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        processed = 0
+        while self.pending_events and (max_events is None or processed < max_events):
+            time_stamp, event, job_id, machine_name, value = self.pending_events[0]
+            if max_time is not None and time_stamp > max_time:
+                break
+            self.pending_events.popleft()
+
+            if event == STARTED:
+                self.job_started_on_machine(time_stamp, job_id, machine_name)
+            elif event == FINISHED:
+                self.job_finished_on_machine(time_stamp, job_id, machine_name, value)
+            else:
+                self.job_time_out(job_id, machine_name)
+            processed += 1
+        return processed
+
+    # GUI-Aktualisierung (Tk-Thread) -------------------------------------------------
+    def job_started_on_machine(self, time_stamp, job_id, machine_name):
         job = self.jobs[job_id]
-        operation = Operation(job, machine.name, time_stamp, None)
+        operation = Operation(job, machine_name, time_stamp, None)
 
         # Merke dir die Operation unter (job_id, machine_name)
-        self.operations[(job_id, machine.name)] = operation
+        self.operations[(job_id, machine_name)] = operation
 
         # Hier: Color holen aus dem Job
         color = job.color
@@ -24,8 +77,8 @@ class Controller:
         if self.gui_view:
             self.gui_view.add_operation(operation, color)
 
-    def job_finished_on_machine(self, time_stamp, job_id, machine, sim_duration):
-        key = (job_id, machine.name)
+    def job_finished_on_machine(self, time_stamp, job_id, machine_name, sim_duration):
+        key = (job_id, machine_name)
         if key in self.operations: # wozu???
             operation = self.operations[key]
             operation.duration = sim_duration
@@ -36,7 +89,7 @@ class Controller:
         color = self.jobs[job_id].color
 
         if self.gui_view:
-            self.gui_view.finish_operation(job_id, machine.name, time_stamp, color)
+            self.gui_view.finish_operation(job_id, machine_name, time_stamp, color)
 
 
     def job_time_out(self, job_id, machine_name):
@@ -71,10 +124,9 @@ class Controller:
         for job_id in jobs_to_remove:
             del self.jobs[job_id]
 
-    def handle_undone(self, df_undone):
-        for _, row in df_undone[df_undone["Start"].notna()].iterrows():
-            job_id = row["Job"]
-            machine = row["Machine"]
-            self.job_time_out(job_id, machine)
+    def handle_undone(self, df_undone, time_stamp=1440):
+        """Markiert begonnene, aber nicht beendete Operationen (darf aus dem Simulations-Thread kommen)."""
+        for job_id, machine in df_undone.loc[df_undone["Start"].notna(), ["Job", "Machine"]].itertuples(index=False):
+            self.event_queue.put((time_stamp, TIMEOUT, job_id, machine, None))
 
 
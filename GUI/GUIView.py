@@ -1,13 +1,33 @@
+import argparse
+import time
 import tkinter as tk
-import pandas as pd
 from Controller import Controller
+from EventSink import get_time_str
+from Job import Job
+from PlanIO import load_plan
 from ProductionDaySimulation import ProductionDaySimulation, get_jssp_from_schedule
 
 from GanttCanvas import GanttCanvas  # NEU!
 
 class GUIView:
-    def __init__(self, root):
+    def __init__(self, root, speed=60, interval_ms=40, max_events_per_tick=2000):
+        """
+        Args:
+            root (tk.Tk): Tk-Hauptfenster
+            speed (float | None): Wiedergabe in Simulationsminuten pro Sekunde (None -> so schnell wie möglich)
+            interval_ms (int): Abstand der Aktualisierungen in Millisekunden
+            max_events_per_tick (int): höchstens so viele Ereignisse pro Aktualisierung (GUI bleibt bedienbar)
+        """
         self.root = root
+        self.speed = speed
+        self.interval_ms = interval_ms
+        self.max_events_per_tick = max_events_per_tick
+
+        self.controller = None
+        self.playback_time = 0
+        self.last_tick = None
+        self.slider = None  # Zeitregler der Offline-Wiedergabe (show_results)
+        self.status_label = None
 
         # --- Haupt-Frame ---
         self.main_frame = tk.Frame(root)
@@ -21,6 +41,48 @@ class GUIView:
         self.legend_canvas = tk.Canvas(self.main_frame, width=128, height=648, bg="white")
         self.legend_canvas.pack(side="left")
 
+    # Wiedergabe: Ereignisse aus der Queue des Controllers im Tk-Thread abarbeiten
+    def start_playback(self, controller):
+        self.controller = controller
+        self.last_tick = time.perf_counter()
+        self.root.after(self.interval_ms, self._playback_tick)
+
+    def _playback_tick(self):
+        now = time.perf_counter()
+        if self.speed is None:
+            max_time = None
+        else:
+            self.playback_time += (now - self.last_tick) * self.speed
+            max_time = self.playback_time
+        self.last_tick = now
+
+        self.controller.process_events(max_time=max_time, max_events=self.max_events_per_tick)
+        self.root.after(self.interval_ms, self._playback_tick)
+
+    # Offline-Wiedergabe: gespeicherte Ergebnisse auf einmal zeichnen, Zeitregler statt Wartezeiten
+    def show_results(self, df_execution, df_undone=None):
+        job_ids = set(df_execution["Job"].astype(str))
+        if df_undone is not None:
+            job_ids |= set(df_undone["Job"].astype(str))
+        jobs = {job_id: Job(job_id, idx) for idx, job_id in enumerate(sorted(job_ids))}
+
+        self.gantt_canvas.load_results(df_execution, df_undone, colors={job_id: job.color for job_id, job in jobs.items()})
+        self.draw_legend(jobs)
+
+        total = self.gantt_canvas.total_minutes
+        self.status_label = tk.Label(self.root, anchor="w")
+        self.status_label.pack(fill="x")
+        self.slider = tk.Scale(self.root, from_=0, to=total, orient="horizontal", resolution=1,
+                               showvalue=False, command=self._on_scrub)
+        self.slider.pack(fill="x")
+        self.slider.set(total)
+
+    def _on_scrub(self, value):
+        minutes = float(value)
+        self.gantt_canvas.set_replay_time(minutes)
+        running, finished = self.gantt_canvas.replay_counts(minutes)
+        self.status_label.config(text=f"{get_time_str(minutes)}  |  {running} laufend, {finished} fertig")
+
     def setup_machines(self, machines):
         self.gantt_canvas.setup_machines(machines)
 
@@ -57,15 +119,32 @@ class GUIView:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live-Gantt der Simulation oder Wiedergabe gespeicherter Ergebnisse")
+    parser.add_argument("--replay", nargs="+", metavar="CSV", help="execution.csv [undone.csv] (auch ResultWriter-Dateien)")
+    parser.add_argument("--replication", type=int, default=None, help="nur diese Replikation wiedergeben")
+    args = parser.parse_args()
+
+    if args.replay:
+        from ResultWriter import read_results
+
+        root = tk.Tk()
+        root.title("Gantt Replay - Production Simulation")
+        where = None if args.replication is None else {"Replication": args.replication}
+        gui_view = GUIView(root)
+        gui_view.show_results(read_results(args.replay[0], where=where),
+                              read_results(args.replay[1], where=where) if len(args.replay) > 1 else None)
+        root.mainloop()
+        raise SystemExit
+
     root = tk.Tk()
     root.title("Live Gantt Chart - Production Simulation")
 
     # Lade Tagesplan
 
-    df_schedule_plan = pd.read_csv("../data/04_schedule_plan_firstday.csv")
+    df_schedule_plan = load_plan("../data/04_schedule_plan_firstday.csv")
 
     # Setze alles zusammen
-    gui_view = GUIView(root)
+    gui_view = GUIView(root, speed=60)  # 60 Simulationsminuten pro Sekunde, None -> so schnell wie möglich
     controller = Controller(gui_view)
     simulation = ProductionDaySimulation(df_schedule_plan, vc=0.25)
     simulation.set_controller(controller)
@@ -85,7 +164,9 @@ if __name__ == "__main__":
             print(j + ": " + str(val))
 
 
-    sim_thread = threading.Thread(target=run_simulation)
+    # Die Simulation läuft ungebremst; der Tk-Thread holt die Ereignisse gebündelt ab
+    sim_thread = threading.Thread(target=run_simulation, daemon=True)
     sim_thread.start()
+    gui_view.start_playback(controller)
 
     root.mainloop()
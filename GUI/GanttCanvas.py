@@ -1,8 +1,31 @@
+import bisect
 import tkinter as tk
 
+import numpy as np
+import pandas as pd
+
+from Job import get_color
+
+# Felder eines Operations-Eintrags im Intervall-Index
+START, END, JOB, COLOR, TIMEOUT, ITEM, HATCH = range(7)
+
+RUNNING_WIDTH = 5  # Breite (Pixel) einer noch laufenden Operation
+TICK_STEPS = (5, 10, 15, 30, 60, 120, 180, 240, 360)  # mögliche Abstände der Zeitachse in Minuten
+
 
 class GanttCanvas(tk.Canvas):
-    def __init__(self, parent, total_minutes=1440, width=1024, height=576, **kwargs):
+    """
+    Gantt-Diagramm mit Level-of-Detail:
+    - Operationen liegen je Maschine in einem nach Start sortierten Intervall-Index
+    - Canvas-Elemente werden nur für das sichtbare Zeit-/Maschinenfenster erzeugt
+    - Zoom (Mausrad) und Verschieben (Ziehen mit linker Maustaste) über die Zeitachse
+    - Zeitüberschreitungen werden mit einem einzigen schraffierten (stipple) Element markiert
+    - Offline-Wiedergabe: load_results() übernimmt gespeicherte Ergebnisse in einem Durchgang,
+      set_replay_time() zeigt den Stand zu einer beliebigen Minute (Suche per bisect)
+    """
+
+    def __init__(self, parent, total_minutes=1440, width=1024, height=576,
+                 max_row_spacing=50, min_row_spacing=12, **kwargs):
         super().__init__(parent, width=width, height=height, bg="white", **kwargs)
         self.total_minutes = total_minutes
         self.width = width
@@ -10,86 +33,323 @@ class GanttCanvas(tk.Canvas):
 
         self.x_offset = 80  # Verschiebung nach rechts für Maschinen-Namen
         self.right_padding = 40  # Rechts Platz lassen für "24h" Schrift
+        self.initial_offset = 60  # Abstand der ersten Maschine
+        self.max_row_spacing = max_row_spacing
+        self.min_row_spacing = min_row_spacing
+        self.row_spacing = max_row_spacing
         self.operation_half_height = 14  # Höhe der Operationen nach oben und unten
 
         self.usable_width = self.width - self.x_offset - self.right_padding  # NEU: feste usable_width
 
-        self.machine_positions = {}
-        self.operations = {}
+        # Sichtbares Fenster
+        self.view_start = 0
+        self.view_end = total_minutes
+        self.first_row = 0
+
+        self.machine_positions = {}  # Maschine -> Zeilenindex
+        self.machine_order = []
+        self.starts = {}  # Maschine -> sortierte Startzeiten
+        self.intervals = {}  # Maschine -> Einträge [start, end, job, color, timeout, item, hatch] (gleiche Reihenfolge)
+        self.max_duration = {}  # Maschine -> längste fertige Operation (für Überlappungsabfrage)
+        self.running = {}  # Maschine -> noch laufende Einträge (live, enden bei current_time)
+        self.operations = {}  # (job_id, machine_name) -> Eintrag
+        self.current_time = 0
+        self.drawn_entries = []  # Einträge mit aktuell vorhandenen Canvas-Elementen
+
+        # Offline-Wiedergabe: None -> alles zeigen, sonst Stand zu dieser Minute
+        self.replay_time = None
+        self.replay_starts = []  # alle Startzeiten, sortiert
+        self.replay_ends = []  # alle Endzeiten fertiger Operationen, sortiert
+
+        self._render_pending = False
+        self._drag_origin = None
+
+        self.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.bind("<Button-4>", lambda event: self.zoom(1 / 1.25, event.x))
+        self.bind("<Button-5>", lambda event: self.zoom(1.25, event.x))
+        self.bind("<ButtonPress-1>", self._on_drag_start)
+        self.bind("<B1-Motion>", self._on_drag)
 
         # self.draw_time_axis()
 
+    # Koordinaten -------------------------------------------------------------------
+    def pixels_per_minute(self):
+        return self.usable_width / (self.view_end - self.view_start)
+
+    def x_of(self, minutes):
+        return self.x_offset + (minutes - self.view_start) * self.pixels_per_minute()
+
+    def minutes_of(self, x):
+        return self.view_start + (x - self.x_offset) / self.pixels_per_minute()
+
+    def visible_rows(self):
+        return max(1, int((self.height - self.initial_offset) // self.row_spacing) + 1)
+
+    def y_of(self, machine_name):
+        row = self.machine_positions[machine_name] - self.first_row
+        if row < 0 or row >= self.visible_rows():
+            return None
+        return self.initial_offset + row * self.row_spacing
+
+    # Achse und Maschinen -------------------------------------------------------------
     def draw_time_axis(self):
-        """Zeichnet die Zeitachse (oben) von 0 bis total_minutes."""
-        num_ticks = 12  # z.B. alle 2 Stunden
-        interval = self.total_minutes // num_ticks
-        pixels_per_minute = self.usable_width / self.total_minutes
+        """Zeichnet die Zeitachse (oben) für das sichtbare Zeitfenster."""
+        span = self.view_end - self.view_start
+        interval = next((step for step in TICK_STEPS if span / step <= 12), TICK_STEPS[-1])
+        first_tick = -(-self.view_start // interval) * interval
 
-        for i in range(num_ticks + 1):
-            minutes = i * interval
-            x = self.x_offset + minutes * pixels_per_minute
+        minutes = first_tick
+        while minutes <= self.view_end:
+            x = self.x_of(minutes)
 
             # Kurzer Strich oben
-            self.create_line(x, 0, x, 10, fill="black")
+            self.create_line(x, 0, x, 10, fill="black", tags="axis")
 
             # Zeitbeschriftung
-            hours = minutes // 60
-            self.create_text(x + 5, 12, text=f"{hours}h", anchor="nw", font=("Arial", 8))
+            hours, rest = divmod(int(minutes), 60)
+            label = f"{hours}h" if rest == 0 else f"{hours}h{rest:02}"
+            self.create_text(x + 5, 12, text=label, anchor="nw", font=("Arial", 8), tags="axis")
 
             # Gestrichelte Linie nach unten
-            self.create_line(x, 20, x, self.height, fill="gray", dash=(2, 4))
+            self.create_line(x, 20, x, self.height, fill="gray", dash=(2, 4), tags="axis")
+            minutes += interval
 
     def setup_machines(self, machines):
-        initial_offset = 60  # Abstand der ersten Maschine
-        spacing = 50  # Abstand zwischen den Maschinen
-        num_machines = len(machines)
-        new_height = max(initial_offset + (num_machines - 1) * spacing + 20, int(self.height))
+        self.machine_order = sorted(machines)
+        num_machines = len(self.machine_order)
+
+        # Zeilenabstand an die Maschinenanzahl anpassen (bei Bedarf vertikal verschieben)
+        available = self.height - self.initial_offset - 20
+        spacing = available / max(num_machines - 1, 1)
+        self.row_spacing = max(self.min_row_spacing, min(self.max_row_spacing, spacing))
+        self.operation_half_height = max(2, int(self.row_spacing * 0.28))
+
+        for idx, machine in enumerate(self.machine_order):
+            self.machine_positions[machine] = idx
+            self.starts.setdefault(machine, [])
+            self.intervals.setdefault(machine, [])
+            self.max_duration.setdefault(machine, 0)
+
+        self.render()
+
+    def _draw_machine_labels(self):
+        size = 12 if self.row_spacing >= 30 else max(6, int(self.row_spacing * 0.5))
+        last = min(len(self.machine_order), self.first_row + self.visible_rows())
+        for machine in self.machine_order[self.first_row:last]:
+            self.create_text(20, self.y_of(machine), text=machine, anchor="w",
+                             font=("Helvetica", size, "bold"), tags="label")
+
+    # Intervall-Index -----------------------------------------------------------------
+    def _insert(self, machine_name, entry):
+        starts = self.starts[machine_name]
+        idx = bisect.bisect_right(starts, entry[START])
+        starts.insert(idx, entry[START])
+        self.intervals[machine_name].insert(idx, entry)
+
+    def visible_entries(self, machine_name):
+        """Einträge der Maschine, die das sichtbare Zeitfenster überlappen."""
+        starts = self.starts[machine_name]
+        entries = self.intervals[machine_name]
+        view_end = self.view_end if self.replay_time is None else min(self.view_end, self.replay_time)
+        earliest = self.view_start - self.max_duration[machine_name]
+        running = self.running.get(machine_name)
+        if running:
+            earliest = min(earliest, min(entry[START] for entry in running))
+        low = bisect.bisect_left(starts, earliest)
+        high = bisect.bisect_right(starts, view_end)
+        for entry in entries[low:high]:
+            if self._shown_end(entry) >= self.view_start:
+                yield entry
+
+    def _entry_end(self, entry):
+        """Ende, wie es zur Wiedergabezeit sichtbar ist (None -> läuft noch)."""
+        if self.replay_time is not None and (entry[END] is None or entry[END] > self.replay_time):
+            return None
+        return entry[END]
+
+    def _shown_end(self, entry):
+        """Ende, bis zu dem der Eintrag gezeichnet wird (laufende bis zur Wiedergabe- bzw. aktuellen Minute)."""
+        end = self._entry_end(entry)
+        if end is None:
+            return self.current_time if self.replay_time is None else self.replay_time
+        return end
+
+    # Zeichnen ------------------------------------------------------------------------
+    def request_render(self):
+        """Fasst mehrere Änderungen am Sichtfenster zu einem Neuzeichnen zusammen."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self.render)
+
+    def render(self):
+        self._render_pending = False
+        self.delete("all")
+        for entry in self.drawn_entries:
+            entry[ITEM] = entry[HATCH] = None
+        self.drawn_entries = []
 
-        self.config(height=new_height)
-        self.height = new_height
         self.draw_time_axis()
+        self._draw_machine_labels()
 
-        for idx, machine in enumerate(sorted(machines)):
-            y = initial_offset + idx * spacing
-            self.machine_positions[machine] = y
-            self.create_text(20, y, text=machine, anchor="w", font=("Helvetica", 12, "bold"))
+        last = min(len(self.machine_order), self.first_row + self.visible_rows())
+        for machine in self.machine_order[self.first_row:last]:
+            covered_until = None  # LOD: Operationen unter einem Pixel nicht übereinander zeichnen
+            for entry in self.visible_entries(machine):
+                x_start, x_end = self._x_range(entry)
+                if covered_until is not None and x_end <= covered_until:
+                    continue
+                self._draw_entry(machine, entry)
+                covered_until = max(x_end, x_start + 1)
 
+    def _x_range(self, entry):
+        x_start = self.x_of(entry[START])
+        end = self._entry_end(entry)
+        if end is None:
+            return x_start, max(self.x_of(self._shown_end(entry)), x_start + RUNNING_WIDTH)
+        return x_start, self.x_of(end)
 
-    def add_operation(self, operation, color="blue"):
-        y = self.machine_positions[operation.machine_name]
-        pixels_per_minute = self.usable_width / self.total_minutes
-        x_start = self.x_offset + operation.start_time * pixels_per_minute
+    def _draw_entry(self, machine_name, entry):
+        y = self.y_of(machine_name)
+        if y is None:
+            return
+        x_start, x_end = self._x_range(entry)
+        x_start = max(x_start, self.x_offset)
+        x_end = min(x_end, self.x_offset + self.usable_width)
+        if x_end < x_start:
+            return
 
-        rect = self.create_rectangle(
+        entry[ITEM] = self.create_rectangle(
             x_start, y - self.operation_half_height,
-            x_start + 5, y + self.operation_half_height,
-            fill=color,
-            outline=color
+            x_end, y + self.operation_half_height,
+            fill=entry[COLOR],
+            outline=entry[COLOR],
+            tags="op"
         )
-        self.operations[(operation.job.job_id, operation.machine_name)] = (operation, rect)
+        self.drawn_entries.append(entry)
+        if entry[TIMEOUT] and self._entry_end(entry) is not None:
+            entry[HATCH] = self.create_rectangle(
+                x_start, y - self.operation_half_height,
+                x_end, y + self.operation_half_height,
+                fill="red", outline="", stipple="gray25", tags="op"
+            )
+
+    # Live-Aktualisierung -------------------------------------------------------------
+    def add_operation(self, operation, color="blue"):
+        machine_name = operation.machine_name
+        entry = [operation.start_time, None, operation.job.job_id, color, False, None, None]
+        self._insert(machine_name, entry)
+        self.operations[(operation.job.job_id, machine_name)] = entry
+        self.running.setdefault(machine_name, []).append(entry)
+        self.current_time = max(self.current_time, operation.start_time)
+
+        if self.view_start <= entry[START] <= self.view_end:
+            self._draw_entry(machine_name, entry)
 
     def finish_operation(self, job_id, machine_name, time_stamp, color, timeout_bool=False):
         key = (job_id, machine_name)
-        if key in self.operations:
-            operation, rect = self.operations[key]
-            pixels_per_minute = self.usable_width / self.total_minutes
-            x_start = self.x_offset + operation.start_time * pixels_per_minute
-            x_end = self.x_offset + time_stamp * pixels_per_minute
-            y = self.machine_positions[machine_name]
-
-            self.coords(rect, x_start, y - self.operation_half_height, x_end, y + self.operation_half_height)
-            self.itemconfig(rect, fill=color)
-
-            if timeout_bool:
-                for offset in range(int(x_start), int(x_end+2), 6):
-                    self.create_line(
-                        offset + 6 , y - self.operation_half_height,
-                        offset - 3, y + self.operation_half_height,
-                        fill="red", width=1
-                    )
+        if key not in self.operations:
+            return
+        entry = self.operations[key]
+        if entry[END] is None:
+            self.running[machine_name].remove(entry)
+        entry[END] = time_stamp
+        entry[COLOR] = color
+        entry[TIMEOUT] = timeout_bool
+        self.max_duration[machine_name] = max(self.max_duration[machine_name], time_stamp - entry[START])
+        self.current_time = max(self.current_time, time_stamp)
+
+        for item in (entry[ITEM], entry[HATCH]):
+            if item is not None:
+                self.delete(item)
+        entry[ITEM] = entry[HATCH] = None
+
+        if entry[START] <= self.view_end and time_stamp >= self.view_start:
+            self._draw_entry(machine_name, entry)
 
     def break_operation(self, job_id, machine_name):
         key = (job_id, machine_name)
         if key in self.operations:
-            _, rect = self.operations[key]
-            self.itemconfig(rect, fill="red")
+            entry = self.operations[key]
+            entry[COLOR] = "red"
+            if entry[ITEM] is not None:
+                self.itemconfig(entry[ITEM], fill="red")
+
+    # Offline-Wiedergabe -------------------------------------------------------------
+    def load_results(self, df_execution, df_undone=None, colors=None):
+        """
+        Übernimmt gespeicherte Ergebnisse (z. B. aus ProductionDaySimulation.run oder
+        ResultWriter) und zeichnet sie einmal, ohne Ereignisse einzeln abzuspielen.
+        Begonnene, aber nicht fertige Operationen aus df_undone enden schraffiert bei total_minutes.
+
+        Args:
+            df_execution (DataFrame): 'Job', 'Machine', 'Start', 'End'
+            df_undone (DataFrame, optional): 'Job', 'Machine', 'Start' (NaN -> nie begonnen)
+            colors (dict, optional): Job -> Farbe (Standard: Farben wie Controller, nach Job sortiert)
+        """
+        frames = [df_execution[["Job", "Machine", "Start", "End"]].assign(Timeout=False)]
+        if df_undone is not None:
+            started = df_undone.loc[df_undone["Start"].notna(), ["Job", "Machine", "Start"]]
+            frames.append(started.assign(End=float(self.total_minutes), Timeout=True))
+        rows = pd.concat(frames, ignore_index=True).astype({"Job": str, "Machine": str})
+        rows = rows.sort_values(["Machine", "Start"], kind="stable")
+
+        if colors is None:
+            colors = {job_id: get_color(idx) for idx, job_id in enumerate(sorted(rows["Job"].unique()))}
+
+        self.starts, self.intervals, self.max_duration, self.operations, self.running = {}, {}, {}, {}, {}
+        for machine_name, group in rows.groupby("Machine", sort=False):
+            entries = [[start, end, job_id, colors.get(job_id, "blue"), timeout, None, None]
+                       for job_id, start, end, timeout in group[["Job", "Start", "End", "Timeout"]].itertuples(index=False)]
+            self.starts[machine_name] = group["Start"].tolist()
+            self.intervals[machine_name] = entries
+            self.max_duration[machine_name] = float((group["End"] - group["Start"]).max())
+            for entry in entries:
+                self.operations[(entry[JOB], machine_name)] = entry
+
+        self.replay_starts = np.sort(rows["Start"].to_numpy(dtype=float))
+        self.replay_ends = np.sort(rows.loc[~rows["Timeout"], "End"].to_numpy(dtype=float))
+        self.current_time = float(rows["End"].max()) if len(rows) else 0
+        self.drawn_entries = []
+        self.machine_positions = {}
+        self.setup_machines(set(self.machine_order) | set(self.starts))  # zeichnet neu
+
+    def set_replay_time(self, time_stamp):
+        """Zeigt den Stand zur Minute time_stamp (None -> alle Operationen)."""
+        self.replay_time = None if time_stamp is None else float(time_stamp)
+        self.request_render()
+
+    def replay_counts(self, time_stamp):
+        """(laufend, fertig) zur Minute time_stamp, je eine Binärsuche über die sortierten Zeiten."""
+        started = int(np.searchsorted(self.replay_starts, time_stamp, side="right"))
+        finished = int(np.searchsorted(self.replay_ends, time_stamp, side="right"))
+        return started - finished, finished
+
+    # Zoom und Verschieben ------------------------------------------------------------
+    def set_view(self, view_start, view_end, first_row=None):
+        """Setzt das sichtbare Zeitfenster (Minuten) und optional die erste sichtbare Maschine."""
+        span = min(max(view_end - view_start, 10), self.total_minutes)
+        view_start = min(max(view_start, 0), self.total_minutes - span)
+        self.view_start, self.view_end = view_start, view_start + span
+
+        if first_row is not None:
+            max_first_row = max(0, len(self.machine_order) - self.visible_rows())
+            self.first_row = min(max(int(first_row), 0), max_first_row)
+        self.request_render()
+
+    def zoom(self, factor, x=None):
+        """Zoomt um factor (<1 hinein, >1 heraus) um die Bildschirmposition x."""
+        center = self.minutes_of(x) if x is not None else (self.view_start + self.view_end) / 2
+        self.set_view(center - (center - self.view_start) * factor,
+                      center + (self.view_end - center) * factor)
+
+    def _on_mouse_wheel(self, event):
+        self.zoom(1 / 1.25 if event.delta > 0 else 1.25, event.x)
+
+    def _on_drag_start(self, event):
+        self._drag_origin = (event.x, event.y, self.view_start, self.view_end, self.first_row)
+
+    def _on_drag(self, event):
+        x0, y0, view_start, view_end, first_row = self._drag_origin
+        shift = (x0 - event.x) * (view_end - view_start) / self.usable_width
+        rows = (y0 - event.y) / self.row_spacing
+        self.set_view(view_start + shift, view_end + shift, first_row + rows)
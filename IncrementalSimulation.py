@@ -0,0 +1,612 @@
+import copy
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from FastEngine import ARRIVE, RELEASE, FastEngine
+from OperationStore import DONE, INTERRUPTED, PLANNED, PRUNED, RUNNING
+from ProductionDaySimulation import ProductionDaySimulation
+
+# sim_end im OperationStore ist auf 2 Stellen gerundet: Checkpoints mit Abstand wählen
+RESTART_MARGIN = 0.01
+# Anteil der ab dem Checkpoint offenen Operationen, den die Kegel-Läufe zusammen höchstens simulieren,
+# bevor einfach alle Jobs ab dem Checkpoint neu simuliert werden
+CONE_LIMIT = 0.25
+
+# Ereignisarten beim Abgleich gleichzeitiger Ereignisse (Abbruch = Zuteilung mit sofortiger Freigabe)
+EVENT_ARRIVE, EVENT_GRANT, EVENT_FINISH, EVENT_ABORT = range(4)
+
+
+class IncrementalSimulation:
+    """
+    Simuliert einen Tagesplan (engine="fast") und rechnet nach Planänderungen nur den
+    betroffenen Kegel neu: die geänderten Jobs und alles, was sie über gemeinsame Maschinen
+    erreichen. Alle anderen Operationen behalten ihre bisherigen Ergebnisse.
+
+    update() vergleicht alten und neuen Plan und bestimmt je Job den frühesten Zeitpunkt, zu dem
+    der alte Lauf geänderte Plandaten gelesen hat. Ab dem letzten Checkpoint davor werden nur die
+    Jobs des Kegels simuliert; fremde Operationen, die auf denselben Maschinen zur selben Zeit
+    anwesend sind (zusammenhängende Belegungsphase), laufen als einzelne Operationen mit ihrer
+    bisherigen Ankunftszeit mit. Der Kegel wächst, bis er in sich geschlossen ist:
+    - eine mitlaufende fremde Operation erhält andere Zeiten als bisher -> ihr Job gehört zum Kegel
+    - eine Belegungsphase mit Kegel-Operationen enthält eine noch nicht mitlaufende Operation
+    - Ereignisse beider Gruppen fallen so zusammen, dass ihre Reihenfolge (Sequenznummern)
+      das Ergebnis beeinflussen könnte -> die fremden Jobs dieses Zeitpunkts gehören zum Kegel
+    Müssten die Kegel-Läufe zusammen mehr als CONE_LIMIT der offenen Operationen simulieren (auch
+    absehbar, weil der Kegel von Lauf zu Lauf stark wächst), werden alle Jobs ab dem Checkpoint neu
+    simuliert. Die Dauern hängen wie bei draw_durations an (Job, Machine) und demselben
+    Zufallsstrom; das Ergebnis ist identisch mit einem vollständigen Lauf des neuen Plans
+    mit demselben Seed.
+
+    Checkpoints (SimulationSnapshot) entstehen nur bei vollständigen Läufen; nach einer
+    Kegel-Rechnung bleiben die Checkpoints bis zu ihrem Startzeitpunkt gültig.
+    """
+
+    def __init__(self, df_plan, vc=0.2, seed=None, until=1440, sampler=None, discipline=None, prune=None,
+                 checkpoint_interval=60):
+        """
+        Args:
+            df_plan (DataFrame): Tagesplan ('Job', 'Machine', 'Start', 'Duration', 'End'),
+                (Job, Machine) eindeutig (siehe PlanValidator)
+            vc, sampler, discipline, prune: wie ProductionDaySimulation
+            seed (int | numpy.random.Generator, optional): Seed bzw. Zufallsstrom (für alle Läufe derselbe)
+            until (float): Simulationsende in Minuten
+            checkpoint_interval (float): Abstand der Checkpoints in Minuten
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval muss größer als 0 sein")
+
+        self.params = {"vc": vc, "sampler": sampler, "discipline": discipline, "prune": prune}
+        rng = np.random.default_rng(seed)
+        self.bit_generator = type(rng.bit_generator)
+        self.rng_state = copy.deepcopy(rng.bit_generator.state)
+        self.until = min(until, 1440)
+        self.checkpoint_times = np.arange(checkpoint_interval, self.until, checkpoint_interval).tolist()
+
+        self.df_plan = None
+        self.store = None
+        # ungerundete Zeiten des letzten Ergebnisses je Operation (Zuteilung = Start bzw. Abbruch)
+        self.grant_time = None
+        self.end_time = None
+        self.checkpoints = []  # [(Zeit, SimulationSnapshot), ...] aufsteigend
+        self.restart_time = None  # Zeitpunkt, ab dem der letzte Lauf neu gerechnet wurde
+        self.recomputed_jobs = None  # Anzahl der Jobs, die der letzte Lauf neu simuliert hat
+
+        simulation = self._new_simulation(df_plan)
+        self.results = self._simulate(simulation, simulation._init_jobs(), restart=None)
+
+    def _new_simulation(self, df_plan):
+        if df_plan.duplicated(["Job", "Machine"]).any():
+            raise ValueError("(Job, Machine) muss im Plan eindeutig sein")
+        simulation = ProductionDaySimulation(df_plan, engine="fast", sinks=[], **self.params)
+        simulation.until = self.until
+        simulation.rng = np.random.Generator(self.bit_generator())
+        simulation.rng.bit_generator.state = copy.deepcopy(self.rng_state)
+        return simulation
+
+    def update(self, df_plan):
+        """
+        Übernimmt einen geänderten Plan und liefert dessen Ergebnis.
+
+        Returns:
+            (DataFrame, DataFrame): df_execution und df_undone wie ProductionDaySimulation.run()
+        """
+        simulation = self._new_simulation(df_plan)
+        jobs = simulation._init_jobs()
+        affected = self._affected_times(simulation)
+        if affected is None:
+            self.results = self._simulate(simulation, jobs, restart=None)
+            return self.results
+
+        restart = None
+        for time_stamp, checkpoint in self.checkpoints:
+            if time_stamp > affected.min() - RESTART_MARGIN:
+                break
+            restart = (time_stamp, checkpoint)
+        mapping = _operation_mapping(self.store, simulation.store)
+        self.results = self._simulate_cone(simulation, jobs, restart, np.isfinite(affected), mapping)
+        return self.results
+
+    def _simulate(self, simulation, jobs, restart, mapping=None):
+        """
+        Alle Jobs ab dem Checkpoint (None: ab Tagesbeginn) neu simulieren und dabei Checkpoints ablegen
+        (mapping: Operationen des bisherigen Laufs je Operation, siehe _operation_mapping).
+        """
+        store = simulation.store
+        if restart is None:
+            self.restart_time = 0
+            self.checkpoints = []
+            grant_time, end_time = np.full(len(store), np.nan), np.full(len(store), np.nan)
+            engine = _TracingEngine(simulation, jobs, grant_time, end_time)
+        else:
+            self.restart_time, checkpoint = restart
+            _copy_progress(checkpoint.store, store)
+            engine = _TracingEngine(simulation, jobs, *self._times_before_restart(store, mapping))
+            engine.restore(checkpoint.engine_state)
+            self.checkpoints = [(t, c) for t, c in self.checkpoints if t <= self.restart_time]
+        simulation.fast_engine = engine
+        simulation.started = True
+
+        for time_stamp in self.checkpoint_times:
+            if time_stamp > self.restart_time:
+                self.checkpoints.append((time_stamp, simulation.snapshot_at(time_stamp)))
+
+        results = simulation.resume()
+        self.df_plan = simulation.dframe_schedule_plan
+        self.store = store
+        self.grant_time = engine.grant_time
+        self.end_time = engine.end_time
+        self.recomputed_jobs = len(jobs)
+        return results
+
+    def _simulate_cone(self, simulation, jobs, restart, cone, mapping):
+        """
+        Simuliert ab dem Checkpoint nur die Jobs des Kegels (cone: bool je Job-Code) samt der
+        fremden Operationen in ihren Belegungsphasen und erweitert den Kegel, bis er geschlossen ist.
+        """
+        base = simulation.store
+        if restart is None:
+            restart_time = 0
+            state = FastEngine(simulation, jobs).state()
+        else:
+            restart_time, checkpoint = restart
+            _copy_progress(checkpoint.store, base)
+            state = checkpoint.engine_state
+        start_grant, start_end = self._times_before_restart(base, mapping)
+        predecessor = _predecessors(base)
+        open_ops = (base.status == PLANNED) | (base.status == RUNNING)
+        budget = CONE_LIMIT * np.count_nonzero(open_ops)
+
+        # aktuelle Operation je Job zum Checkpoint (-1: Route abgeschlossen)
+        route_length = np.array([len(op_ids) for _, op_ids in jobs])
+        op_index = np.array(state["op_index"])
+        current_op = np.full(len(jobs), -1)
+        on_route = np.flatnonzero(op_index < route_length)
+        current_op[on_route] = [jobs[job_idx][1][op_index[job_idx]] for job_idx in on_route.tolist()]
+
+        # Bisheriges Ergebnis auf den neuen Plan übertragen (gilt für Operationen außerhalb des Kegels)
+        previous = self.store
+        known = mapping >= 0
+        old_status = np.full(len(base), PLANNED, dtype=previous.status.dtype)
+        old_status[known] = previous.status[mapping[known]]
+        old_grant, old_end = np.full(len(base), np.nan), np.full(len(base), np.nan)
+        old_grant[known] = self.grant_time[mapping[known]]
+        old_end[known] = self.end_time[mapping[known]]
+        old_arrival = _arrivals(predecessor, base.planned_start, old_status, old_end, self.until)
+        old_exit = _exits(old_status, old_arrival, old_grant, old_end)
+        finish_rank = np.full(len(previous), -1)
+        finish_rank[previous.finish_order[:previous.finished_count]] = np.arange(previous.finished_count)
+        old_rank = np.full(len(base), -1)
+        old_rank[known] = finish_rank[mapping[known]]
+
+        # Bisheriger Lauf im alten Plan (Anwesenheit und Ereignisse der bisherigen Kegel-Operationen)
+        previous_arrival = _arrivals(_predecessors(previous), previous.planned_start, previous.status, self.end_time,
+                                     self.until)
+        previous_exit = _exits(previous.status, previous_arrival, self.grant_time, self.end_time)
+        previous_events = _events(previous, previous.status, previous_arrival, self.grant_time, self.end_time,
+                                  restart_time)
+        current = (previous_exit >= restart_time) & ~np.isnan(previous_arrival)
+
+        prototype = _TracingEngine(simulation, jobs, start_grant, start_end, state=state)
+        cone = cone.copy()
+        pseudo = np.zeros(len(base), dtype=bool)  # fremde Operationen, die im Kegel mitlaufen
+        simulated = 0  # Operationen, die die bisherigen Kegel-Läufe zusammen simuliert haben
+        last_step = np.inf  # Operationen des vorigen Kegel-Laufs (für das absehbare Wachstum)
+        while True:
+            cone_ops = cone[base.job_codes]
+            previous_cone = current & cone[previous.job_codes]
+            if not pseudo.any():
+                # Startwert: Belegungsphasen der bisherigen Kegel-Operationen
+                pseudo = _frozen_in_phases(base, ~cone_ops, old_arrival, old_exit, restart_time,
+                                           previous.machine_codes[previous_cone], previous_arrival[previous_cone],
+                                           previous_exit[previous_cone])
+
+            step = np.count_nonzero(cone_ops & open_ops) + np.count_nonzero(pseudo)
+            simulated += step
+            if simulated + step * step / last_step > budget:
+                # Kegel zu groß (oder wächst so schnell, dass er es im nächsten Lauf wird):
+                # alle Jobs ab dem Checkpoint sind günstiger
+                simulation.store = base
+                return self._simulate(simulation, jobs, restart, mapping)
+
+            simulation.store = base.copy()
+            engine = self._cone_engine(prototype, jobs, state, current_op, cone, pseudo, predecessor, old_arrival,
+                                       old_rank)
+            engine.run(self.until)
+            store = simulation.store
+
+            status = np.where(cone_ops, store.status, old_status)
+            grant_time = np.where(cone_ops, engine.grant_time, old_grant)
+            end_time = np.where(cone_ops, engine.end_time, old_end)
+            arrival = _arrivals(predecessor, base.planned_start, status, end_time, self.until)
+            exits = _exits(status, arrival, grant_time, end_time)
+
+            # Mitlaufende fremde Operationen mit abweichenden Zeiten
+            differs = pseudo & ~cone_ops & ~((store.status == old_status) & _same(engine.grant_time, old_grant) &
+                                             _same(engine.end_time, old_end))
+            added = set(base.job_codes[differs].tolist())
+
+            # Zusammenfallende Ereignisse im neuen und im bisherigen Lauf
+            added |= _tied_jobs(*_events(base, status, arrival, grant_time, end_time, restart_time), cone)
+            added |= _tied_jobs(*previous_events, cone)
+
+            # Belegungsphasen, in denen Kegel-Operationen (neu oder bisher) anwesend sind
+            new_cone = cone_ops & ~np.isnan(arrival) & (exits >= restart_time)
+            in_phase = _frozen_in_phases(
+                base, ~cone_ops, old_arrival, old_exit, restart_time,
+                np.concatenate((base.machine_codes[new_cone], previous.machine_codes[previous_cone])),
+                np.concatenate((arrival[new_cone], previous_arrival[previous_cone])),
+                np.concatenate((exits[new_cone], previous_exit[previous_cone])))
+            missing = in_phase & ~pseudo
+
+            if not added and not missing.any():
+                break
+            cone[list(added)] = True
+            pseudo |= missing
+            last_step = step
+
+        # Ergebnis: Kegel aus der Simulation, alles andere aus dem bisherigen Lauf
+        frozen = ~cone_ops
+        store.status[frozen] = old_status[frozen]
+        store.sim_start[frozen] = np.nan
+        store.sim_end[frozen] = np.nan
+        store.sim_start[frozen & known] = previous.sim_start[mapping[frozen & known]]
+        store.sim_end[frozen & known] = previous.sim_end[mapping[frozen & known]]
+
+        # Fertigstellungsreihenfolge ab dem Checkpoint: beide Gruppen nach Endzeit zusammenführen. Gleichzeitige
+        # Enden folgen der Reihenfolge ihrer Zuteilung (Sequenznummern); gleiche Zuteilungszeiten beider Gruppen
+        # sind ausgeschlossen (siehe _tied_jobs)
+        restart_count = base.finished_count
+        inverse = np.full(len(previous), -1)
+        inverse[mapping[known]] = np.flatnonzero(known)
+        frozen_finished = inverse[previous.finish_order[restart_count:previous.finished_count]]
+        frozen_finished = frozen_finished[frozen[frozen_finished]]
+        cone_finished = store.finish_order[restart_count:store.finished_count]
+        cone_finished = cone_finished[cone_ops[cone_finished]]
+        finished = np.concatenate((frozen_finished, cone_finished))
+        order = np.lexsort((grant_time[finished], end_time[finished]))
+        store.finish_order[restart_count:restart_count + len(finished)] = finished[order]
+        store.finished_count = restart_count + len(finished)
+
+        self.restart_time = restart_time
+        self.checkpoints = [(t, c) for t, c in self.checkpoints if t <= restart_time]
+        self.df_plan = simulation.dframe_schedule_plan
+        self.store = store
+        self.grant_time = grant_time
+        self.end_time = end_time
+        self.recomputed_jobs = int(cone.sum())
+        return store.execution_frame(), store.undone_frame()
+
+    def _cone_engine(self, prototype, jobs, state, current_op, cone, pseudo, predecessor, arrival, finish_rank):
+        """
+        FastEngine im Zustand des Checkpoints, reduziert auf den Kegel: Jobs des Kegels mit ganzer Route,
+        mitlaufende fremde Operationen als Jobs mit nur dieser Operation, alle übrigen Ereignisse entfernt.
+        """
+        store = prototype.simulation.store
+        # Fremde Jobs behalten ihre Ereignisse nur, wenn ihre aktuelle Operation mitläuft (ohne Rest der Route)
+        keep = cone | ((current_op >= 0) & pseudo[current_op])
+        cone_jobs = list(jobs)
+        for job_idx in np.flatnonzero(keep & ~cone).tolist():
+            job_id, op_ids = jobs[job_idx]
+            cone_jobs[job_idx] = (job_id, op_ids[:state["op_index"][job_idx] + 1])
+
+        busy = list(state["busy"])
+        removed = current_op[~keep & (current_op >= 0)]
+        for machine in store.machine_codes[removed[store.status[removed] == RUNNING]].tolist():
+            busy[machine] = False
+
+        keep = keep.tolist()
+        heap = [entry for entry in state["heap"] if entry[2] >= RELEASE or keep[entry[3]]]
+        ready = [entry for entry in state["ready"] if entry[0] >= RELEASE or keep[entry[1]]]
+        queues = []
+        for queue in state["queues"]:
+            if queue and isinstance(queue[0], tuple):
+                queue = [entry for entry in queue if keep[entry[2]]]
+                heapq.heapify(queue)
+            else:
+                queue = [job_idx for job_idx in queue if keep[job_idx]]
+            queues.append(queue)
+
+        # Weitere mitlaufende Operationen kommen zur bisherigen Ankunftszeit an, bei Gleichstand in der
+        # Reihenfolge, in der ihre Ankünfte eingeplant wurden (finish_rank des Vorgängers im bisherigen Lauf)
+        single = pseudo & ~cone[store.job_codes]
+        single[current_op[current_op >= 0]] = False
+        single_ops = np.flatnonzero(single)
+        single_ops = single_ops[np.lexsort((finish_rank[predecessor[single_ops]], arrival[single_ops]))]
+
+        op_index = list(state["op_index"])
+        sequence = state["sequence"]
+        for op_id, time_stamp in zip(single_ops.tolist(), arrival[single_ops].tolist()):
+            job_id, _ = jobs[store.job_codes[op_id]]
+            if time_stamp == state["now"]:
+                ready.append((ARRIVE, len(cone_jobs)))
+            else:
+                heap.append((time_stamp, sequence, ARRIVE, len(cone_jobs)))
+                sequence += 1
+            cone_jobs.append((job_id, [op_id]))
+            op_index.append(0)
+        heapq.heapify(heap)
+
+        return prototype.reduced(cone_jobs, dict(state, heap=heap, ready=tuple(ready), sequence=sequence,
+                                                 op_index=op_index, busy=busy, queues=queues))
+
+    def _times_before_restart(self, store, mapping):
+        """Ungerundete Zeiten des bisherigen Ergebnisses für store, soweit sie laut Status vor dem Checkpoint liegen."""
+        known = mapping >= 0
+        grant_time, end_time = np.full(len(store), np.nan), np.full(len(store), np.nan)
+        grant_time[known] = self.grant_time[mapping[known]]
+        end_time[known] = self.end_time[mapping[known]]
+        grant_time[store.status == PLANNED] = np.nan
+        end_time[store.status != DONE] = np.nan
+        grant_time[store.status == PRUNED] = np.nan
+        return grant_time, end_time
+
+    def _affected_times(self, simulation):
+        """
+        Frühester Zeitpunkt je Job-Code, zu dem der bisherige Lauf Plandaten gelesen hat, die sich
+        geändert haben (inf: nicht betroffen); None, wenn sich Jobs oder Maschinen geändert haben.
+
+        Je Job wird die Route (nach geplantem Start) positionsweise verglichen. Ab der ersten
+        abweichenden Position p zählt der Zeitpunkt, zu dem die Ankunft an Position p eingeplant
+        wurde: Ende der Operation p-1 (bzw. 0 für p = 0, nie falls p-1 nicht fertig wurde).
+        Hängen Warteschlangen-Schlüssel oder prune von der ganzen Route ab, zählt zusätzlich
+        die erste Ankunft des Jobs.
+        """
+        old = self.store
+        new = simulation.store
+        if not (np.array_equal(np.asarray(old.jobs), np.asarray(new.jobs)) and
+                np.array_equal(np.asarray(old.machines), np.asarray(new.machines))):
+            return None
+
+        # Routen beider Pläne mit Schlüssel (Job, Position) -> job * n_positions + Position, aufsteigend
+        n_positions = max(len(old), len(new)) + 1
+        old_order, old_keys = _route_keys(old, n_positions)
+        new_order, new_keys = _route_keys(new, n_positions)
+        match = np.searchsorted(old_keys, new_keys).clip(max=len(old_keys) - 1)
+        matched = old_keys[match] == new_keys
+        changed = ~matched
+        for old_column, new_column in ((old.machine_codes, new.machine_codes), (old.planned_start, new.planned_start),
+                                       (old.planned_duration, new.planned_duration), (old.sim_duration, new.sim_duration)):
+            changed |= old_column[old_order[match]] != new_column[new_order]
+
+        # Operationen, die im neuen Plan weggefallen sind, zählen ebenfalls als Änderung
+        removed = np.ones(len(old_keys), dtype=bool)
+        removed[match[matched]] = False
+        changed_keys = np.concatenate((new_keys[changed], old_keys[removed]))
+        affected = np.full(len(new.jobs), np.inf)
+        if len(changed_keys) == 0:
+            return affected
+
+        first_changed = np.full(len(old.jobs), n_positions)
+        np.minimum.at(first_changed, changed_keys // n_positions, changed_keys % n_positions)
+        jobs = np.flatnonzero(first_changed < n_positions)
+        positions = first_changed[jobs]
+
+        # Ende der Vorgänger-Operation im bisherigen Lauf (nie eingeplant, falls nicht fertig)
+        previous = np.searchsorted(old_keys, jobs * n_positions + positions - 1).clip(max=len(old_keys) - 1)
+        times = np.where(positions == 0, 0.0, old.sim_end[old_order[previous]])
+        times = np.where(np.isnan(times), np.inf, times)
+
+        local = self.params["prune"] is None and all(
+            machine.discipline is None or machine.discipline.local for machine in simulation.machines.values())
+        if not local:
+            first_arrival = old.planned_start[old_order[np.searchsorted(old_keys, jobs * n_positions)]]
+            times = np.minimum(times, np.maximum(first_arrival, 0))
+        affected[jobs] = times
+        return affected
+
+
+class _TracingEngine(FastEngine):
+    """FastEngine, die zusätzlich die ungerundeten Zuteilungs- und Endzeiten je Operation festhält."""
+
+    def __init__(self, simulation, jobs, grant_time, end_time, state=None):
+        super().__init__(simulation, jobs, state)
+        self.grant_time = grant_time
+        self.end_time = end_time
+
+    def _write_results(self, started_ops, started_times, finished_ops, finished_times):
+        super()._write_results(started_ops, started_times, finished_ops, finished_times)
+        self.grant_time[started_ops] = started_times
+        self.end_time[finished_ops] = finished_times
+
+    def _interrupt(self, op_id, time_stamp):
+        super()._interrupt(op_id, time_stamp)
+        self.grant_time[op_id] = time_stamp
+
+    def reduced(self, jobs, state):
+        """
+        Unabhängige Kopie für andere Jobs im Zustand state, die in den aktuellen OperationStore der
+        Simulation schreibt (Planspalten als Listen werden geteilt, die Zeiten kopiert).
+        """
+        engine = copy.copy(self)
+        engine.store = self.simulation.store
+        engine.jobs = jobs
+        engine.grant_time = self.grant_time.copy()
+        engine.end_time = self.end_time.copy()
+        engine.restore(state)
+        return engine
+
+
+# --- Hilfsfunktionen ---
+
+def _route_keys(store, n_positions):
+    """Routenreihenfolge (wie OperationStore.routes) und aufsteigende Schlüssel job_code * n_positions + Position."""
+    order = np.lexsort((store.planned_start, store.job_codes))
+    job_codes = store.job_codes[order].astype(np.int64)
+    positions = np.arange(len(order)) - np.searchsorted(job_codes, job_codes, side="left")
+    return order, job_codes * n_positions + positions
+
+
+def _operation_keys(store, n_machines):
+    return store.job_codes.astype(np.int64) * n_machines + store.machine_codes
+
+
+def _operation_mapping(source, target):
+    """Operations-Id in source je Operation von target über (Job, Machine), -1 falls es sie in source nicht gibt."""
+    n_machines = len(target.machines)
+    source_keys = _operation_keys(source, n_machines)
+    target_keys = _operation_keys(target, n_machines)
+    if len(source_keys) == 0:
+        return np.full(len(target_keys), -1)
+    order = np.argsort(source_keys)
+    mapping = order[np.searchsorted(source_keys, target_keys, sorter=order).clip(max=len(order) - 1)]
+    return np.where(source_keys[mapping] == target_keys, mapping, -1)
+
+
+def _copy_progress(source, target):
+    """
+    Überträgt Starts, Enden, Status und Fertigstellungsreihenfolge über (Job, Machine) auf
+    einen anderen Plan mit denselben Jobs und Maschinen (gleiche Codes).
+    """
+    n_machines = len(target.machines)
+    target_keys = _operation_keys(target, n_machines)
+    target_order = np.argsort(target_keys)
+
+    touched = np.flatnonzero(source.status != PLANNED)
+    source_keys = _operation_keys(source, n_machines)[touched]
+    mapping = target_order[np.searchsorted(target_keys, source_keys, sorter=target_order)]
+    target.sim_start[mapping] = source.sim_start[touched]
+    target.sim_end[mapping] = source.sim_end[touched]
+    target.status[mapping] = source.status[touched]
+
+    position = np.full(len(source), -1)
+    position[touched] = mapping
+    target.finish_order[:source.finished_count] = position[source.finish_order[:source.finished_count]]
+    target.finished_count = source.finished_count
+
+
+def _predecessors(store):
+    """Vorgänger je Operation in der Route ihres Jobs (-1 für die erste Operation)."""
+    order = np.lexsort((store.planned_start, store.job_codes))
+    jobs = store.job_codes[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = jobs[1:] != jobs[:-1]
+    result = np.empty(len(order), dtype=np.int64)
+    result[order] = np.where(first, -1, np.roll(order, 1))
+    return result
+
+
+def _arrivals(predecessor, planned_start, status, end_time, until):
+    """
+    Ankunftszeit je Operation, gerechnet wie in der FastEngine (Ende des Vorgängers, frühestens
+    geplanter Start); nan, wenn die Ankunft bis until nicht stattfand.
+    """
+    first = predecessor < 0
+    previous_end = np.where(first, 0.0, end_time[predecessor])
+    arrival = previous_end + np.maximum(planned_start - previous_end, 0)
+    reached = (first | (status[predecessor] == DONE)) & (arrival < until)
+    return np.where(reached, arrival, np.nan)
+
+
+def _exits(status, arrival, grant_time, end_time):
+    """Ende der Anwesenheit an der Maschine je angekommener Operation (inf: bis Simulationsende)."""
+    exits = np.full(len(status), np.inf)
+    exits[status == DONE] = end_time[status == DONE]
+    exits[status == INTERRUPTED] = grant_time[status == INTERRUPTED]
+    pruned = status == PRUNED  # aufgegeben bei der Ankunft (die übrigen aufgegebenen kommen nie an)
+    exits[pruned] = arrival[pruned]
+    exits[np.isnan(arrival)] = np.nan
+    return exits
+
+
+def _events(store, status, arrival, grant_time, end_time, start_time):
+    """Ereignisse ab start_time als Arrays (Zeit, Art, Maschinen-Code, Job-Code, Zuteilung bei Enden sonst nan)."""
+    arrived = np.flatnonzero(~np.isnan(arrival))
+    granted = np.flatnonzero((status == RUNNING) | (status == DONE) | (status == INTERRUPTED))
+    done = np.flatnonzero(status == DONE)
+    times = np.concatenate((arrival[arrived], grant_time[granted], end_time[done]))
+    kinds = np.concatenate((np.full(len(arrived), EVENT_ARRIVE),
+                            np.where(status[granted] == INTERRUPTED, EVENT_ABORT, EVENT_GRANT),
+                            np.full(len(done), EVENT_FINISH)))
+    ops = np.concatenate((arrived, granted, done))
+    started = np.concatenate((np.full(len(arrived) + len(granted), np.nan), grant_time[done]))
+    keep = times >= start_time
+    return times[keep], kinds[keep], store.machine_codes[ops[keep]], store.job_codes[ops[keep]], started[keep]
+
+
+def _tied_jobs(times, kinds, machines, jobs, started, cone):
+    """
+    Job-Codes außerhalb des Kegels mit Ereignissen zu Zeitpunkten, an denen auch der Kegel Ereignisse
+    hat und deren Reihenfolge das Ergebnis beeinflussen könnte.
+
+    Die Reihenfolge gleichzeitiger Ereignisse folgt den Sequenznummern, die im reduzierten Lauf anders
+    vergeben werden. Unkritisch ist nur: beide Gruppen handeln auf verschiedenen Maschinen und
+    beenden keine Operationen mit gleicher Zuteilungszeit (sonst ist die Reihenfolge in df_execution
+    offen, siehe _simulate_cone), oder auf einer gemeinsamen Maschine
+    übergibt eine Gruppe mit ihrem einzigen Ereignis dort (Ende bzw. Abbruch) an die andere, deren
+    einziges Ereignis zu diesem Zeitpunkt die Zuteilung dieser Maschine ist.
+    """
+    in_cone = cone[jobs]
+    instants, inverse = np.unique(times, return_inverse=True)
+    n_instants = len(instants)
+    count = {group: np.bincount(inverse, in_cone == group, n_instants) for group in (True, False)}
+    critical = (count[True] > 0) & (count[False] > 0)
+    if not critical.any():
+        return set()
+    # nur Ereignisse zu Zeitpunkten mit beiden Gruppen betrachten
+    selected = critical[inverse]
+    instant, kinds, machines, own_cone, started = (inverse[selected], kinds[selected], machines[selected],
+                                                   in_cone[selected], started[selected])
+    critical = np.zeros(n_instants, dtype=bool)
+
+    # Enden beider Gruppen zum selben Zeitpunkt mit derselben Zuteilungszeit
+    finish = np.flatnonzero(kinds == EVENT_FINISH)
+    finish = finish[np.lexsort((started[finish], instant[finish]))]
+    new_run = np.ones(len(finish), dtype=bool)
+    new_run[1:] = (instant[finish][1:] != instant[finish][:-1]) | (started[finish][1:] != started[finish][:-1])
+    run = np.cumsum(new_run) - 1
+    n_runs = run[-1] + 1 if len(run) else 0
+    both = (np.bincount(run, own_cone[finish], n_runs) > 0) & (np.bincount(run, ~own_cone[finish], n_runs) > 0)
+    critical[instant[finish][both[run]]] = True
+
+    # Gemeinsame Maschinen je Zeitpunkt: nur Übergaben sind erlaubt
+    n_machines = int(machines.max()) + 1
+    pairs, pair_inverse = np.unique(instant.astype(np.int64) * n_machines + machines, return_inverse=True)
+    pair_instant = pairs // n_machines
+    release = (kinds == EVENT_FINISH) | (kinds == EVENT_ABORT)
+    grant = (kinds == EVENT_GRANT) | (kinds == EVENT_ABORT)
+    events, releases, grants = {}, {}, {}
+    for group in (True, False):
+        own = own_cone == group
+        events[group] = np.bincount(pair_inverse, own, len(pairs))
+        releases[group] = np.bincount(pair_inverse, own & release, len(pairs))
+        grants[group] = np.bincount(pair_inverse, own & grant, len(pairs))
+    shared = (events[True] > 0) & (events[False] > 0)
+    hand_over = np.zeros(len(pairs), dtype=bool)
+    for giving, receiving in ((True, False), (False, True)):
+        hand_over |= (events[giving] == 1) & (releases[giving] == 1) & \
+            (count[receiving][pair_instant] == 1) & (grants[receiving] == 1)
+    critical[pair_instant[shared & ~hand_over]] = True
+
+    return set(jobs[critical[inverse] & ~in_cone].tolist())
+
+
+def _frozen_in_phases(store, frozen, arrival, exits, start_time, cone_machines, cone_arrival, cone_exits):
+    """
+    Fremde Operationen (frozen), deren Anwesenheit [Ankunft, Verlassen] ab start_time in einer
+    zusammenhängenden Belegungsphase ihrer Maschine mit einer Kegel-Operation liegt (Berührung zählt).
+    """
+    own = np.flatnonzero(frozen & ~np.isnan(arrival) & (exits >= start_time))
+    machines = np.concatenate((store.machine_codes[own], cone_machines))
+    starts = np.concatenate((arrival[own], cone_arrival))
+    ends = np.concatenate((exits[own], cone_exits))
+    marked = np.concatenate((np.zeros(len(own), dtype=bool), np.ones(len(cone_machines), dtype=bool)))
+
+    order = np.lexsort((starts, machines))
+    machines, starts, ends, marked = machines[order], starts[order], ends[order], marked[order]
+    reach = pd.Series(ends).groupby(machines).cummax().to_numpy()
+    new_phase = np.ones(len(order), dtype=bool)
+    new_phase[1:] = (machines[1:] != machines[:-1]) | (starts[1:] > reach[:-1])
+    phase = np.cumsum(new_phase) - 1
+    with_cone = np.bincount(phase, marked, phase[-1] + 1 if len(phase) else 0) > 0
+
+    result = np.zeros(len(frozen), dtype=bool)
+    in_phase = with_cone[phase] & ~marked
+    result[own[order[in_phase]]] = True
+    return result
+
+
+def _same(first, second):
+    """Elementweise gleich, nan gilt als gleich nan."""
+    return (first == second) | (np.isnan(first) & np.isnan(second))
@@ -0,0 +1,76 @@
+import numpy as np
+
+from DispatchScheduler import dispatch_schedule
+
+# Höchstzahl der Stauchungen, bis der erzeugte Plan in den Horizont passt
+MAX_RESCALES = 20
+
+
+# --- Synthetische JSSP-Instanzen (Taillard-Stil) ---
+
+def generate_jssp(n_jobs, n_machines, seed=None, low=1, high=99, day=0):
+    """
+    Erzeugt eine Taillard-artige Instanz: jeder Job besucht jede Maschine genau einmal
+    in zufälliger Reihenfolge, Bearbeitungszeiten gleichverteilt ganzzahlig in [low, high].
+
+    Returns:
+        dict: {job: [[machine, duration], ...]} wie von get_jssp_from_schedule
+    """
+    rng = np.random.default_rng(seed)
+    routes = rng.permuted(np.tile(np.arange(n_machines), (n_jobs, 1)), axis=1)
+    durations = rng.integers(low, high + 1, size=(n_jobs, n_machines))
+    return {
+        f"Job {day:02}_{job}": [[int(m), int(d)] for m, d in zip(routes[job], durations[job])]
+        for job in range(n_jobs)
+    }
+
+
+def generate_day_plan(n_jobs, n_machines, utilization=0.8, horizon=1440, seed=None, rule="SPT", day=0,
+                      resolution=None):
+    """
+    Erzeugt einen zulässigen Tagesplan (Job, Machine, Start, Duration, End), der innerhalb des Horizonts endet.
+
+    Die Bearbeitungszeiten werden so skaliert, dass die gesamte Arbeit utilization * n_machines * horizon
+    entspricht, danach plant dispatch_schedule die Instanz ohne Überlappungen ein. Endet der Plan nach
+    dem Horizont, werden alle Dauern im Verhältnis horizon / Planende gestaucht und neu eingeplant; die
+    Auslastung liegt dann unter utilization (z. B. wenn wenige Jobs mit langen Routen den Plan bestimmen).
+
+    Args:
+        n_jobs (int): Anzahl Jobs
+        n_machines (int): Anzahl Maschinen (= Operationen je Job)
+        utilization (float): angestrebte Maschinenauslastung über den Horizont
+        horizon (float): Länge des Tages in Minuten
+        seed (int, optional): Seed für reproduzierbare Instanzen
+        rule (str): Prioritätsregel für dispatch_schedule
+        day (int): Tag für die Job-Namen ("Job <Tag>_<Nr>")
+        resolution (float, optional): Raster der Dauern in Minuten (mindestens ein Rasterschritt),
+            z. B. 1 für ganzzahlige Dauern mit vielen Gleichständen; None -> ungerundete Dauern
+
+    Raises:
+        ValueError: wenn der Plan auch mit den kürzesten Dauern des Rasters nicht in den Horizont passt
+    """
+    jssp = generate_jssp(n_jobs, n_machines, seed=seed, day=day)
+    if resolution is not None and max(n_jobs, n_machines) * resolution > horizon:
+        # Schon mit einem Rasterschritt je Operation zu viel Arbeit je Maschine bzw. je Job
+        raise ValueError(f"{n_jobs} Jobs x {n_machines} Maschinen passen mit resolution={resolution} "
+                         f"nicht in den Horizont von {horizon} Minuten")
+
+    total_work = sum(duration for operations in jssp.values() for _, duration in operations)
+    scale = utilization * n_machines * horizon / total_work
+    for _ in range(MAX_RESCALES):
+        scaled = {job: [[machine, _on_grid(duration * scale, resolution)] for machine, duration in operations]
+                  for job, operations in jssp.items()}
+        df_plan = dispatch_schedule(scaled, rule=rule)
+        makespan = df_plan["End"].max()
+        if makespan <= horizon:
+            return df_plan
+        # Giffler-Thompson ist skaleninvariant: gestauchte Dauern ergeben ein entsprechend kürzeres Planende
+        scale *= min(horizon / makespan, 1 - 1e-9)
+    raise ValueError(f"{n_jobs} Jobs x {n_machines} Maschinen passen mit resolution={resolution} "
+                     f"nicht in den Horizont von {horizon} Minuten")
+
+
+def _on_grid(duration, resolution):
+    if resolution is None:
+        return duration
+    return max(1, round(duration / resolution)) * resolution
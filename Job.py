@@ -1,34 +1,27 @@
-from matplotlib import pyplot as plt
+# Vorberechnete Farben (matplotlib "tab20" ohne Index 6/Rot, das für Abbrüche reserviert ist),
+# je 16 Farben in drei Varianten: Original, grünlich aufgehellt, rötlich/bläulich verschoben.
+# So braucht die Simulation zur Laufzeit kein matplotlib.
+JOB_COLORS = (
+    '#1f77b4', '#aec7e8', '#ff7f0e', '#ffbb78', '#2ca02c', '#98df8a', '#ff9896', '#9467bd',
+    '#c5b0d5', '#8c564b', '#c49c94', '#e377c2', '#f7b6d2', '#7f7f7f', '#c7c7c7', '#bcbd22',
+    '#1ba6a2', '#9cffd0', '#e5b10c', '#e5ff6c', '#27df27', '#88ff7c', '#e5d487', '#8590aa',
+    '#b1f6bf', '#7e7843', '#b0da85', '#cca6ae', '#defebd', '#72b172', '#b3ffb3', '#a9ff1e',
+    '#2365cf', '#c8a9ff', '#ff6b10', '#ff9e8a', '#328832', '#aebd9e', '#ff81ac', '#aa57d9',
+    '#e295f4', '#a14956', '#e184aa', '#ff65df', '#ff9af1', '#926b92', '#e4a9e4', '#d8a027',
+)
 
-tab20 = plt.get_cmap("tab20")
 
 def get_color(idx):
     base_idx = idx % 16
     layer = idx // 16
 
-    # --- Anpassung: überspringe Index 6 ---
-    if base_idx >= 6:
-        base_idx += 1  # 6 wird übersprungen
-
-    rgba = tab20(base_idx / 20)  # Skaliere auf 20 Farben
-    r, g, b, _ = rgba
-    if layer == 1:
-        r = max(0.0, r * 0.9)
-        g = min(1.0, g * 1.4)
-        b = max(0.0, b * 0.9)
-    elif layer == 2:
-        r = min(1.0, r * 1.15)
-        g = max(0.0, g * 0.85)
-        b = min(1.0, b * 1.15)
-
-    r = int(r * 255)
-    g = int(g * 255)
-    b = int(b * 255)
-    return f'#{r:02x}{g:02x}{b:02x}'
+    # Ab der vierten Runde wieder die Originalfarben
+    if layer > 2:
+        layer = 0
+    return JOB_COLORS[layer * 16 + base_idx]
 
 
 class Job:
     def __init__(self, job_id, color_idx):
         self.job_id = job_id
         self.color = get_color(color_idx)
-
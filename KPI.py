@@ -0,0 +1,159 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+KPI_COLUMNS = ["Makespan", "Completed Jobs", "Unfinished Jobs", "Tardy Jobs", "Total Tardiness",
+               "Mean Tardiness", "Mean Flow Time", "Mean Start Deviation", "Mean Abs Start Deviation",
+               "Utilization", "Carry-over Share", "Carry-over Work Share"]
+
+
+# --- KPIs je Replikation ---
+
+def compute_kpis(df_plan, df_execution, df_undone, until=1440, replication_column="Replication"):
+    """
+    Berechnet die Kennzahlen aller Replikationen in gruppierten, vektorisierten Durchläufen:
+    - Makespan: spätestes Ende einer ausgeführten Operation
+    - Completed/Unfinished Jobs: Jobs mit allen bzw. nicht allen Operationen fertig
+    - Tardiness: Fertigstellung eines fertigen Jobs minus geplantes Job-Ende (max. 'End' im Plan), mindestens 0
+    - Flow Time: Fertigstellung eines fertigen Jobs minus geplanter Job-Beginn (min. 'Start' im Plan)
+    - Start Deviation: tatsächlicher minus geplanter Start je ausgeführter Operation
+    - Utilization: bearbeitete Zeit (inkl. laufender Operationen bis until) je Maschine und Tag
+    - Carry-over Share: Anteil offener Operationen bzw. offener geplanter Arbeit
+
+    Args:
+        df_plan (DataFrame): Tagesplan mit 'Job', 'Machine', 'Start', 'Duration', 'End'
+        df_execution (DataFrame): ausgeführte Operationen aller Replikationen (z. B. aus run_replications)
+        df_undone (DataFrame): offene Operationen aller Replikationen
+        until (float): Simulationsende in Minuten
+        replication_column (str): Spalte mit der Replikations-Id (fehlt sie, gilt alles als eine Replikation)
+
+    Returns:
+        DataFrame: eine Zeile je Replikation (Index: Replikations-Id), Spalten KPI_COLUMNS
+    """
+    job_codes, jobs = pd.factorize(df_plan["Job"])
+    machine_codes, machines = pd.factorize(df_plan["Machine"])
+    n_jobs, n_machines = len(jobs), len(machines)
+
+    plan_keys = job_codes.astype(np.int64) * n_machines + machine_codes
+    key_order = np.argsort(plan_keys, kind="stable")
+    sorted_keys = plan_keys[key_order]
+    planned_start = df_plan["Start"].to_numpy(dtype=float)
+    planned_duration = df_plan["Duration"].to_numpy(dtype=float)
+
+    ops_per_job = np.bincount(job_codes, minlength=n_jobs)
+    planned_job_end = pd.Series(df_plan["End"].to_numpy(dtype=float)).groupby(job_codes).max() \
+        .reindex(range(n_jobs)).to_numpy()
+    planned_job_start = pd.Series(planned_start).groupby(job_codes).min().reindex(range(n_jobs)).to_numpy()
+
+    exec_reps = _replications(df_execution, replication_column)
+    undone_reps = _replications(df_undone, replication_column)
+    replication_ids = pd.Index(np.union1d(exec_reps, undone_reps))
+    exec_rep_codes = replication_ids.get_indexer(exec_reps)
+    undone_rep_codes = replication_ids.get_indexer(undone_reps)
+    n_reps = len(replication_ids)
+
+    # Ausgeführte Operationen den Planzeilen zuordnen (ganzzahliger Schlüssel wie in get_undone_operations_df)
+    exec_job_codes = jobs.get_indexer(df_execution["Job"]).astype(np.int64)
+    exec_machine_codes = machines.get_indexer(df_execution["Machine"])
+    exec_keys = exec_job_codes * n_machines + exec_machine_codes
+    plan_rows = key_order[np.minimum(np.searchsorted(sorted_keys, exec_keys), len(sorted_keys) - 1)]
+    known = (exec_job_codes >= 0) & (exec_machine_codes >= 0) & (plan_keys[plan_rows] == exec_keys)
+    if not known.all():
+        raise ValueError("df_execution enthält Operationen, die nicht im Plan stehen")
+
+    exec_start = df_execution["Start"].to_numpy(dtype=float)
+    exec_end = df_execution["End"].to_numpy(dtype=float)
+    exec_duration = df_execution["Duration"].to_numpy(dtype=float)
+
+    makespan = np.full(n_reps, np.nan)
+    np.fmax.at(makespan, exec_rep_codes, exec_end)
+
+    start_deviation = exec_start - planned_start[plan_rows]
+    executed = np.bincount(exec_rep_codes, minlength=n_reps)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_deviation = np.bincount(exec_rep_codes, start_deviation, n_reps) / executed
+        mean_abs_deviation = np.bincount(exec_rep_codes, np.abs(start_deviation), n_reps) / executed
+
+    # Jobs je Replikation: Anzahl fertiger Operationen und letzte Fertigstellung
+    rep_job = exec_rep_codes.astype(np.int64) * n_jobs + exec_job_codes
+    done_ops = np.bincount(rep_job, minlength=n_reps * n_jobs).reshape(n_reps, n_jobs)
+    completion = np.full(n_reps * n_jobs, -np.inf)
+    np.maximum.at(completion, rep_job, exec_end)
+    completion = completion.reshape(n_reps, n_jobs)
+
+    completed = done_ops == ops_per_job
+    tardiness = np.where(completed, np.maximum(completion - planned_job_end, 0), 0.0)
+    n_completed = completed.sum(axis=1)
+    flow_time = np.where(completed, completion - planned_job_start, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_tardiness = tardiness.sum(axis=1) / n_completed
+        mean_flow_time = flow_time.sum(axis=1) / n_completed
+
+    # Belegung: fertige Operationen plus laufende Operationen bis Tagesende
+    busy = np.bincount(exec_rep_codes, exec_duration, n_reps)
+    if "Start" in df_undone.columns:
+        running_since = df_undone["Start"].to_numpy(dtype=float)
+        running = ~np.isnan(running_since)
+        busy += np.bincount(undone_rep_codes[running], until - running_since[running], n_reps)
+
+    undone_planned = df_undone["Planned Duration"].to_numpy(dtype=float)
+
+    df_kpis = pd.DataFrame({
+        "Makespan": makespan,
+        "Completed Jobs": n_completed,
+        "Unfinished Jobs": n_jobs - n_completed,
+        "Tardy Jobs": (tardiness > 0).sum(axis=1),
+        "Total Tardiness": tardiness.sum(axis=1),
+        "Mean Tardiness": mean_tardiness,
+        "Mean Flow Time": mean_flow_time,
+        "Mean Start Deviation": mean_deviation,
+        "Mean Abs Start Deviation": mean_abs_deviation,
+        "Utilization": busy / (n_machines * until),
+        "Carry-over Share": np.bincount(undone_rep_codes, minlength=n_reps) / len(df_plan),
+        "Carry-over Work Share": np.bincount(undone_rep_codes, undone_planned, n_reps) / planned_duration.sum(),
+    }, index=replication_ids.rename(replication_column), columns=KPI_COLUMNS)
+    return df_kpis
+
+
+def _replications(dframe, replication_column):
+    if replication_column in dframe.columns:
+        return dframe[replication_column].to_numpy()
+    return np.zeros(len(dframe), dtype=np.int64)
+
+
+# --- Zusammenfassung über alle Replikationen ---
+
+def summarize_kpis(df_kpis, confidence=0.95):
+    """
+    Mittelwert, Standardabweichung und Konfidenzintervall je KPI über alle Replikationen.
+    Das Intervall nutzt die Normalapproximation (mean ± z * s / sqrt(n)), bei wenigen
+    Replikationen ist es daher etwas zu eng.
+
+    Returns:
+        DataFrame: eine Zeile je KPI mit 'N', 'Mean', 'Std', 'CI Low', 'CI High'
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    n = df_kpis.count()
+    mean = df_kpis.mean()
+    std = df_kpis.std(ddof=1)
+    half_width = z * std / np.sqrt(n.where(n > 0))
+    return pd.DataFrame({
+        "N": n,
+        "Mean": mean,
+        "Std": std,
+        "CI Low": mean - half_width,
+        "CI High": mean + half_width,
+    })
+
+
+if __name__ == "__main__":
+    from PlanIO import load_plan
+    from Replications import run_replications
+
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")
+    df_execution, df_undone = run_replications(df_schedule_plan, n=200, vc=0.25, seeds=42)
+
+    df_kpis = compute_kpis(df_schedule_plan, df_execution, df_undone)
+    print(summarize_kpis(df_kpis).to_string(float_format=lambda v: f"{v:10.3f}"))
+    print(f"(Konfidenzniveau 95 %, {len(df_kpis)} Replikationen)")
@@ -1,7 +1,62 @@
+import heapq
+from itertools import count
+
 import simpy
+from simpy.resources.resource import Request
 
 
 class Machine(simpy.Resource):
-    def __init__(self, env, name):
+    def __init__(self, env, name, discipline=None):
+        """
+        Args:
+            env (simpy.Environment): Simulationsumgebung
+            name (str): Maschinenname, z. B. "M3"
+            discipline (QueueDiscipline, optional): Reihenfolge der Wartenden (None/FIFO -> simpy.Resource unverändert)
+        """
         super().__init__(env, capacity=1)
-        self.name = name
\ No newline at end of file
+        self.name = name
+        self.busy_until = 0  # Ende der zuletzt begonnenen Operation (Schranke für prune="machine")
+        self.discipline = None if discipline is None or discipline.fifo else discipline
+
+        if self.discipline is not None:
+            # Wartende als Heap nach (Schlüssel, Anfragereihenfolge)
+            self.put_queue = HeapQueue()
+            self.request_order = count()
+            self.request = self._keyed_request
+
+    def _keyed_request(self, key):
+        return MachineRequest(self, key)
+
+
+class MachineRequest(Request):
+    """Anfrage mit Prioritätsschlüssel; Gleichstand nach Anfragereihenfolge (FIFO)."""
+
+    def __init__(self, resource, key):
+        self.key = key
+        self.order = next(resource.request_order)
+        super().__init__(resource)
+
+    def __lt__(self, other):
+        return (self.key, self.order) < (other.key, other.order)
+
+
+class HeapQueue(list):
+    """
+    put_queue für simpy-Ressourcen als binärer Heap: Element 0 ist stets der nächste
+    Wartende. SimPy nutzt nur append, [0], pop(0) und remove; alle bleiben O(log n)
+    (remove beim Abbruch einer wartenden Anfrage O(n)).
+    """
+
+    def append(self, item):
+        heapq.heappush(self, item)
+
+    def pop(self, index=-1):
+        if index == 0:
+            return heapq.heappop(self)
+        item = super().pop(index)
+        heapq.heapify(self)
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        heapq.heapify(self)
@@ -0,0 +1,148 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+# Status je Operation
+PLANNED = 0      # noch nicht begonnen
+RUNNING = 1      # begonnen, aber (noch) nicht fertig
+DONE = 2         # fertig bearbeitet
+INTERRUPTED = 3  # Start abgelehnt (hätte nicht mehr innerhalb des Tages geendet)
+PRUNED = 4       # vorzeitig aufgegeben (Job kann laut Schranke nicht mehr rechtzeitig fertig werden)
+
+
+class OperationStore:
+    """
+    Spaltenorientierter Zustand aller Operationen eines Tagesplans.
+
+    Alle Arrays sind vorab in Planlänge angelegt und über die Operations-Id
+    (= Zeilenposition im Plan) indiziert; die Engines schreiben nur in sie hinein.
+    df_execution und df_undone werden erst beim Abruf aus den Arrays gebildet.
+    """
+
+    def __init__(self, dframe_plan, sim_durations):
+        """
+        Args:
+            dframe_plan (DataFrame): Tagesplan mit 'Job', 'Machine', 'Start', 'Duration'
+            sim_durations (ndarray): vorab gezogene simulierte Dauern je Planzeile
+        """
+        n = len(dframe_plan)
+        self.job_codes, self.jobs = pd.factorize(dframe_plan["Job"], sort=True)
+        self.machine_codes, self.machines = pd.factorize(dframe_plan["Machine"], sort=True)
+        self.planned_start = dframe_plan["Start"].to_numpy(dtype=float)
+        self.planned_duration = dframe_plan["Duration"].to_numpy()
+
+        self.sim_start = np.full(n, np.nan)
+        self.sim_duration = np.asarray(sim_durations, dtype=float)
+        self.sim_end = np.full(n, np.nan)
+        self.status = np.zeros(n, dtype=np.int8)
+
+        # Reihenfolge der Fertigstellung (Zeilenreihenfolge von df_execution)
+        self.finish_order = np.empty(n, dtype=np.int64)
+        self.finished_count = 0
+
+    def __len__(self):
+        return len(self.status)
+
+    def copy(self):
+        """Unabhängige Kopie der veränderlichen Arrays (Plan-Spalten werden geteilt)."""
+        other = copy.copy(self)
+        for name in ("sim_start", "sim_duration", "sim_end", "status", "finish_order"):
+            setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def routes(self):
+        """Operations-Ids je Job (Jobs sortiert, Operationen nach geplantem Start)."""
+        if len(self) == 0:
+            return []
+        order = np.lexsort((self.planned_start, self.job_codes))
+        bounds = (np.flatnonzero(np.diff(self.job_codes[order])) + 1).tolist()
+        job_ids = self.jobs.take(self.job_codes[order[[0] + bounds]]).tolist()
+        ids = order.tolist()
+        return [(job_id, ids[start:end]) for job_id, start, end in zip(job_ids, [0] + bounds, bounds + [len(ids)])]
+
+    def latest_starts(self, until):
+        """
+        Spätester Start je Operation, mit dem der Rest ihrer Route die Abbruchregel
+        (Start + geplante Dauer <= until) noch bestehen kann; -inf, falls das nicht mehr möglich ist.
+
+        Rückwärts entlang der Route: L_i = min(until - p_i, L_i+1 - d_i) mit geplanter Dauer p
+        und (vorab gezogener) simulierter Dauer d; liegt der geplante Start einer späteren
+        Operation nach deren spätestem Start, ist der Job schon vorher verloren.
+        """
+        # Je Job von der letzten zur ersten Operation (umgekehrte Reihenfolge von routes())
+        order = np.lexsort((self.planned_start, self.job_codes))[::-1]
+        jobs = self.job_codes[order]
+
+        # L_i = min über k >= i von (until - p_k + S_k) - S_i mit S = simulierte Restdauer ab i
+        remaining = pd.Series(self.sim_duration[order]).groupby(jobs).cumsum().to_numpy()
+        slack = pd.Series(until - self.planned_duration[order] + remaining)
+        latest = slack.groupby(jobs).cummin().to_numpy() - remaining
+
+        too_late = (self.planned_start[order] > latest).astype(np.int64)
+        later_too_late = pd.Series(too_late).groupby(jobs).cumsum().to_numpy() - too_late
+        latest[later_too_late > 0] = -np.inf
+
+        result = np.empty(len(self))
+        result[order] = latest
+        return result
+
+    # Schreibzugriffe der Engines ----------------------------------------------------
+    def mark_started(self, op_id, time_stamp):
+        self.sim_start[op_id] = round(time_stamp, 2)
+        self.status[op_id] = RUNNING
+
+    def mark_finished(self, op_id, time_stamp):
+        self.sim_end[op_id] = round(time_stamp, 2)
+        self.status[op_id] = DONE
+        self.finish_order[self.finished_count] = op_id
+        self.finished_count += 1
+
+    def mark_started_many(self, op_ids, time_stamps):
+        """Wie mark_started für mehrere Operationen (FastEngine schreibt gesammelt am Ende eines Laufs)."""
+        self.sim_start[op_ids] = [round(time_stamp, 2) for time_stamp in time_stamps]
+        self.status[op_ids] = RUNNING
+
+    def mark_finished_many(self, op_ids, time_stamps):
+        """Wie mark_finished für mehrere Operationen in Reihenfolge der Fertigstellung."""
+        self.sim_end[op_ids] = [round(time_stamp, 2) for time_stamp in time_stamps]
+        self.status[op_ids] = DONE
+        self.finish_order[self.finished_count:self.finished_count + len(op_ids)] = op_ids
+        self.finished_count += len(op_ids)
+
+    def mark_interrupted(self, op_id):
+        self.status[op_id] = INTERRUPTED
+
+    def mark_pruned(self, op_ids):
+        self.status[op_ids] = PRUNED
+
+    # Ergebnisse ---------------------------------------------------------------------
+    def execution_frame(self):
+        """Ausgeführte Operationen in Reihenfolge der Fertigstellung (Job, Machine, Start, Duration, End)."""
+        ids = self.finish_order[:self.finished_count]
+        return pd.DataFrame({
+            "Job": self.jobs.take(self.job_codes[ids]),
+            "Machine": self.machines.take(self.machine_codes[ids]),
+            "Start": self.sim_start[ids],
+            "Duration": self.sim_duration[ids],
+            "End": self.sim_end[ids],
+        })
+
+    def undone_frame(self):
+        """
+        Nicht fertig gewordene Operationen in Planreihenfolge (Job, Machine, Planned Duration, Start).
+        Start ist nur für begonnene (RUNNING) Operationen gesetzt.
+        """
+        ids = np.flatnonzero(self.status != DONE)
+        return pd.DataFrame({
+            "Job": self.jobs.take(self.job_codes[ids]),
+            "Machine": self.machines.take(self.machine_codes[ids]),
+            "Planned Duration": self.planned_duration[ids],
+            "Start": np.where(self.status[ids] == RUNNING, self.sim_start[ids], np.nan),
+        })
+
+    def running_operations(self):
+        """{(job_id, machine_name): Start} aller begonnenen, nicht fertigen Operationen."""
+        ids = np.flatnonzero(self.status == RUNNING)
+        return {(self.jobs[self.job_codes[i]], self.machines[self.machine_codes[i]]): self.sim_start[i]
+                for i in ids}
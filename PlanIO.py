@@ -0,0 +1,140 @@
+import glob
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+PLAN_COLUMNS = ["Job", "Machine", "Start", "Duration", "End"]
+
+
+# --- Maschinen-Codes ---
+
+def get_machine_codes(machines):
+    """
+    Liefert die ganzzahligen Maschinen-Codes ("M3" -> 3) als Array.
+    Bei kategorialen Spalten wird nur einmal je Kategorie geparst, nicht je Zeile.
+    """
+    if not isinstance(machines.dtype, pd.CategoricalDtype):
+        machines = machines.astype("category")
+    category_codes = machines.cat.categories.str.extract(r"M(\d+)", expand=False).astype(int).to_numpy()
+    return category_codes[machines.cat.codes.to_numpy()]
+
+
+def _machine_sort_key(machines):
+    return machines.str.extract(r"M(\d+)", expand=False).astype(int)
+
+
+# --- Plan laden ---
+
+def load_plan(path, cache=True):
+    """
+    Lädt einen Tagesplan (CSV) typisiert und geprüft:
+    - Pflichtspalten 'Job', 'Machine', 'Start', 'Duration', 'End' (sonst ValueError)
+    - unbenannte Indexspalten werden verworfen
+    - 'Job' und 'Machine' kategorial, Maschinen nach ihrem Code (M0, M1, ..., M10) sortiert,
+      zusätzlich 'Machine Code' als Ganzzahl
+
+    Mit cache=True wird neben der CSV eine .npz-Datei abgelegt, deren Name den Hash des
+    CSV-Inhalts enthält. Geänderte CSVs erzeugen so automatisch einen neuen Cache.
+
+    Args:
+        path (str): Pfad zur CSV-Datei
+        cache (bool): Binär-Cache verwenden bzw. anlegen
+
+    Returns:
+        DataFrame: geprüfter Plan
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha1(content).hexdigest()[:16]
+    cache_path = f"{path}.{digest}.npz"
+
+    if cache and os.path.exists(cache_path):
+        return _read_npz(cache_path)
+
+    dframe_plan = pd.read_csv(path, dtype={"Job": str, "Machine": str, "Start": float, "End": float})
+    dframe_plan = dframe_plan.loc[:, ~dframe_plan.columns.str.startswith("Unnamed")]
+    validate_plan_columns(dframe_plan)
+    dframe_plan = to_typed_plan(dframe_plan)
+
+    if cache:
+        for stale_path in glob.glob(f"{glob.escape(path)}.*.npz"):
+            os.remove(stale_path)
+        _write_npz(cache_path, dframe_plan)
+    return dframe_plan
+
+
+def validate_plan_columns(dframe_plan):
+    missing = [column for column in PLAN_COLUMNS if column not in dframe_plan.columns]
+    if missing:
+        raise ValueError(f"Plan ohne Pflichtspalte(n): {', '.join(missing)}")
+    if dframe_plan[["Start", "Duration", "End"]].isna().any().any():
+        raise ValueError("Plan enthält fehlende Werte in 'Start', 'Duration' oder 'End'")
+    if not dframe_plan["Machine"].astype(str).str.fullmatch(r"M\d+").all():
+        raise ValueError("Maschinen müssen als 'M<Nummer>' angegeben sein")
+
+
+def to_typed_plan(dframe_plan):
+    """Wandelt Job/Machine in Kategorien um und ergänzt 'Machine Code'."""
+    dframe_plan = dframe_plan.copy()
+    dframe_plan["Job"] = dframe_plan["Job"].astype("category")
+
+    machines = pd.Series(dframe_plan["Machine"].astype(str).unique())
+    categories = machines.iloc[np.argsort(_machine_sort_key(machines).to_numpy(), kind="stable")]
+    dframe_plan["Machine"] = pd.Categorical(dframe_plan["Machine"], categories=categories)
+    dframe_plan["Machine Code"] = get_machine_codes(dframe_plan["Machine"]).astype(np.int32)
+    return dframe_plan
+
+
+# --- Binär-Cache (.npz) ---
+
+def frame_to_arrays(dframe, prefix=""):
+    """
+    Spaltenweise Kodierung eines DataFrames als Arrays (ohne Pickle):
+    Kategorien und Text-Spalten als Codes + Werte, Zahlen unverändert.
+    """
+    arrays = {f"{prefix}__columns__": np.array(dframe.columns, dtype=str)}
+    for column in dframe.columns:
+        values = dframe[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            arrays[f"{prefix}{column}::codes"] = values.cat.codes.to_numpy()
+            arrays[f"{prefix}{column}::categories"] = values.cat.categories.to_numpy(dtype=str)
+        elif values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+            codes, labels = pd.factorize(values)
+            arrays[f"{prefix}{column}::labelcodes"] = codes
+            arrays[f"{prefix}{column}::labels"] = labels.to_numpy(dtype=str)
+        else:
+            arrays[f"{prefix}{column}::values"] = values.to_numpy()
+    return arrays
+
+
+def frame_from_arrays(arrays, prefix=""):
+    """Gegenstück zu frame_to_arrays (arrays: dict oder geöffnete .npz-Datei)."""
+    columns = {}
+    for column in arrays[f"{prefix}__columns__"]:
+        key = f"{prefix}{column}"
+        if f"{key}::codes" in arrays:
+            columns[column] = pd.Categorical.from_codes(arrays[f"{key}::codes"],
+                                                        categories=arrays[f"{key}::categories"].astype(object))
+        elif f"{key}::labelcodes" in arrays:
+            columns[column] = arrays[f"{key}::labels"].astype(object)[arrays[f"{key}::labelcodes"]]
+        else:
+            columns[column] = arrays[f"{key}::values"]
+    return pd.DataFrame(columns, columns=list(arrays[f"{prefix}__columns__"]))
+
+
+def write_npz(path, arrays, compressed=False):
+    # Erst vollständig schreiben, dann umbenennen (kein halber Cache bei Abbruch)
+    tmp_path = f"{path}.tmp.npz"
+    (np.savez_compressed if compressed else np.savez)(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _write_npz(path, dframe):
+    write_npz(path, frame_to_arrays(dframe))
+
+
+def _read_npz(path):
+    with np.load(path, allow_pickle=False) as arrays:
+        return frame_from_arrays(arrays)
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from PlanIO import PLAN_COLUMNS
+
+CHECKS = ("missing", "duration", "machine_overlap", "job_precedence", "revisit")
+
+
+# --- Prüfungen (Sortieren und Differenzen über NumPy-Arrays) ---
+
+def validate_plan(df_plan, tolerance=1e-6):
+    """
+    Prüft einen Plan ('Job', 'Machine', 'Start', 'Duration', 'End') auf Konsistenz:
+    - missing: fehlende Werte
+    - duration: End != Start + Duration oder negative Dauer
+    - machine_overlap: Operation beginnt, bevor eine frühere auf derselben Maschine endet
+    - job_precedence: Operation beginnt, bevor die vorige Operation desselben Jobs endet
+    - revisit: Job besucht eine Maschine mehrfach (Schlüssel (Job, Machine) nicht eindeutig)
+
+    Args:
+        df_plan (DataFrame): zu prüfender Plan
+        tolerance (float): erlaubte Rundungsabweichung in Minuten
+
+    Returns:
+        dict: {Prüfung: DataFrame der fehlerhaften Zeilen (leer, wenn in Ordnung)};
+        bei Überschneidungen mit zusätzlicher Spalte 'Previous End'
+    """
+    missing_columns = [c for c in PLAN_COLUMNS if c not in df_plan.columns]
+    if missing_columns:
+        raise ValueError(f"Plan ohne Spalten: {', '.join(missing_columns)}")
+
+    start = df_plan["Start"].to_numpy(dtype=float)
+    duration = df_plan["Duration"].to_numpy(dtype=float)
+    end = df_plan["End"].to_numpy(dtype=float)
+    job_codes, _ = pd.factorize(df_plan["Job"])
+    machine_codes, machines = pd.factorize(df_plan["Machine"])
+
+    missing = df_plan[PLAN_COLUMNS].isna().to_numpy().any(axis=1)
+    bad_duration = (np.abs(start + duration - end) > tolerance) | (duration < 0)
+
+    # Job-Maschinen-Paare als eine Zahl, Duplikate nach Sortierung benachbart
+    pairs = job_codes.astype(np.int64) * max(len(machines), 1) + machine_codes
+    order = np.argsort(pairs, kind="stable")
+    duplicate = pairs[order][1:] == pairs[order][:-1]
+    revisit = np.zeros(len(pairs), dtype=bool)
+    revisit[order[1:][duplicate]] = True
+    revisit[order[:-1][duplicate]] = True
+
+    return {
+        "missing": df_plan[missing],
+        "duration": df_plan[bad_duration & ~missing],
+        "machine_overlap": _overlaps(df_plan, machine_codes, start, end, tolerance),
+        "job_precedence": _overlaps(df_plan, job_codes, start, end, tolerance),
+        "revisit": df_plan[revisit],
+    }
+
+
+def _overlaps(df_plan, group_codes, start, end, tolerance):
+    """
+    Zeilen, die innerhalb ihrer Gruppe beginnen, bevor eine frühere Zeile endet.
+    Vergleich mit dem laufenden Maximum der Enden, damit auch Überschneidungen mit
+    nicht direkt vorangehenden (längeren) Operationen gefunden werden.
+    """
+    order = np.lexsort((end, start, group_codes))
+    groups = group_codes[order]
+    starts = start[order]
+    ends = end[order]
+
+    # Laufendes Maximum je Gruppe: Gruppen um einen Versatz größer als die Spannweite auseinanderziehen
+    finite = np.isfinite(ends)
+    span = (np.nanmax(ends[finite]) - np.nanmin(ends[finite]) + 1) if finite.any() else 1.0
+    shifted = np.where(finite, ends, -np.inf) + groups * span
+    previous_end = np.maximum.accumulate(shifted)[:-1] - groups[1:] * span
+
+    conflict = (groups[1:] == groups[:-1]) & (starts[1:] < previous_end - tolerance)
+    rows = order[1:][conflict]
+    return df_plan.iloc[np.sort(rows)].assign(**{"Previous End": previous_end[conflict][np.argsort(rows)]})
+
+
+def assert_valid_plan(df_plan, tolerance=1e-6, max_rows=5):
+    """Wie validate_plan, wirft aber ValueError mit den ersten fehlerhaften Zeilen je Prüfung."""
+    problems = {name: rows for name, rows in validate_plan(df_plan, tolerance).items() if len(rows)}
+    if problems:
+        lines = [f"Ungültiger Plan ({len(df_plan)} Operationen):"]
+        for name, rows in problems.items():
+            lines.append(f"- {name}: {len(rows)} Zeilen")
+            lines.append(rows.head(max_rows).to_string())
+        raise ValueError("\n".join(lines))
+
+
+if __name__ == "__main__":
+    from PlanIO import load_plan
+
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")
+    for check, offending in validate_plan(df_schedule_plan).items():
+        print(f"{check}: {len(offending)} fehlerhafte Zeilen")
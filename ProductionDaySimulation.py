@@ -1,167 +1,301 @@
-import math
-import random
-import time
+from contextlib import nullcontext
 
+import numpy as np
 import simpy
 import pandas as pd
 
-from GUI.Controller import Controller
+from DurationSampler import LogNormalSampler, draw_durations
+from EventSink import ConsoleSink, NullSink
+from EventSink import get_duration, get_time_str  # noqa: F401 (Re-Export für bisherige Importe aus diesem Modul)
+from FastEngine import FastEngine
 from Machine import Machine
+from OperationStore import OperationStore
+from PlanIO import get_machine_codes, load_plan
+from QueueDiscipline import get_discipline
+from Snapshot import SimulationSnapshot
 
+ENGINES = ("simpy", "fast")
+PRUNE_MODES = (None, "route", "machine")
+PRUNE_TOLERANCE = 1e-6  # Rundung der aufsummierten Zeiten: im Zweifel nicht aufgeben
+ENGINE_VERSION = 2  # bei Änderungen, die Simulationsergebnisse verändern, erhöhen (macht ResultCache ungültig)
 
-# --- Hilfsfunktionen ---
-
-def get_time_str(minutes_in):
-    """Wandle Minuten in HH:MM:SS um, einfach basierend auf Minuten."""
-    minutes_total = int(minutes_in)
-    seconds = int((minutes_in - minutes_total) * 60)
-    hours = minutes_total // 60
-    minutes = minutes_total % 60
-    return f"{hours:02}:{minutes:02}:{seconds:02}"
-
-
-def get_duration(minutes_in):
-    minutes = int(minutes_in)
-    seconds = int(round((minutes_in - minutes) * 60))
-    parts = []
-    if minutes:
-        parts.append(f"{minutes:02} minute{'s' if minutes != 1 else ''}")
-    if seconds:
-        parts.append(f"{seconds:02} second{'s' if seconds != 1 else ''}")
-
-    return " ".join(parts) if parts else ""
 
-
-def duration_log_normal(duration, vc=0.2):
-    """
-    Liefert eine Lognormal-verteilte Zufallsdauer basierend auf:
-    - duration: gewünschter Mittelwert
-    - vc: Variationskoeffizient
-    Achtung: Erwartungswert liegt oberhalb von duration.
-    """
-    sigma = vc
-    mu = math.log(duration)
-    result = random.lognormvariate(mu, sigma)
-    return round(result, 2)
+# --- Hilfsfunktionen ---
 
 def get_undone_operations_df(df_plan, df_exec):
     """
     Bestimmt alle Operationen aus df_plan, deren (Job, Machine)-Paar
     nicht in df_exec vorhanden ist, und benennt 'Duration' zu 'Planned Duration' um.
+
+    Index-basiert: Job und Machine werden auf die Kategorien des Plans codiert,
+    daraus ergibt sich je Planzeile ein ganzzahliger Schlüssel und eine "erledigt"-Maske.
+    Setzt eindeutige (Job, Machine)-Paare im Plan voraus.
     """
-    df_diff = pd.merge(
-        df_plan[["Job", "Machine"]],
-        df_exec[["Job", "Machine"]],
-        how='outer',
-        indicator=True
-    ).query('_merge == "left_only"').drop(columns=['_merge'])
-
-    df_result = df_plan[["Job", "Machine", "Duration"]].merge(
-        df_diff,
-        on=["Job", "Machine"],
-        how="inner"
-    )
+    job_codes, job_categories = pd.factorize(df_plan["Job"])
+    machine_codes, machine_categories = pd.factorize(df_plan["Machine"])
+    n_machines = len(machine_categories)
+    plan_keys = job_codes.astype(np.int64) * n_machines + machine_codes
+
+    # Unbekannte Jobs/Maschinen (Code -1) erhalten einen Schlüssel, der im Plan nicht vorkommt
+    exec_job_codes = job_categories.get_indexer(df_exec["Job"]).astype(np.int64)
+    exec_machine_codes = machine_categories.get_indexer(df_exec["Machine"])
+    exec_keys = np.where((exec_job_codes < 0) | (exec_machine_codes < 0), -1,
+                         exec_job_codes * n_machines + exec_machine_codes)
+
+    done = np.isin(plan_keys, exec_keys)
 
+    df_result = df_plan.loc[~done, ["Job", "Machine", "Duration"]].reset_index(drop=True)
     return df_result.rename(columns={"Duration": "Planned Duration"})
 
 
 # --- Hauptklasse: Tagesproduktion simulieren ---
 class ProductionDaySimulation:
-    def __init__(self, dframe_schedule_plan, vc=0.2):
+    def __init__(self, dframe_schedule_plan, vc=0.2, seed=None, engine="simpy", sampler=None, sinks=None,
+                 metrics=None, discipline=None, prune=None):
         """
         Args:
             dframe_schedule_plan (DataFrame): Geplanter Tagesplan mit Spalten wie 'Job', 'Machine', 'Start', 'Duration', 'End'
             vc (float): Variationskoeffizient für Lognormalverteilung
+            seed (int | numpy.random.Generator, optional): Seed oder eigener Zufallsstrom (reproduzierbare Läufe)
+            engine (str): "simpy" (Standard) oder "fast" (eigener Heap-Kernel, gleiche Ergebnisse)
+            sampler (DurationSampler, optional): Verteilung der Dauern (Standard: LogNormalSampler(vc))
+            sinks (list, optional): Empfänger der Ereignisse (Standard: [ConsoleSink()], [] -> keine Ausgabe)
+            metrics (SimulationMetrics, optional): sammelt Zähler, Warteschlangen- und Phasenzeiten je Lauf
+            discipline (str | QueueDiscipline | dict, optional): Reihenfolge der Wartenden an den Maschinen
+                ("FIFO" (Standard), "PlannedStart", "SPT", "EDD", "CR"), als dict je Maschine
+            prune (str, optional): Jobs vorzeitig aufgeben, sobald eine Schranke zeigt, dass sie
+                nicht mehr bis until fertig werden (ihre restlichen Operationen gelten als offen):
+                None (Standard, exakt bisheriges Verhalten), "route" (Restarbeit der Route) oder
+                "machine" (zusätzlich Belegung der angefragten Maschine)
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unbekannte Engine '{engine}', erlaubt: {', '.join(ENGINES)}")
+        if prune not in PRUNE_MODES:
+            raise ValueError(f"Unbekannter Pruning-Modus '{prune}', erlaubt: None, 'route', 'machine'")
+
         self.controller = None
+        self.engine = engine
         self.until = 1440
 
         self.dframe_schedule_plan = dframe_schedule_plan
         self.vc = vc
-        self.env = simpy.Environment()
-        #self.env = simpy.rt.RealtimeEnvironment(factor=1/12)  # 1/12 -> langsam; 1/18 -> mittel; 1/22 -> schnell
+        self.rng = np.random.default_rng(seed)
+        self.sampler = sampler if sampler is not None else LogNormalSampler(vc)
+        self.discipline = discipline
+        self.prune = prune
+        self.env = simpy.Environment()  # Echtzeit-Wiedergabe: siehe RealtimeStream
         self.machines = self._init_machines()
 
-        self.starting_times_dict= {}
-        self.finished_log = []
+        self.sinks = []
+        for sink in ([ConsoleSink()] if sinks is None else sinks):
+            self.add_sink(sink)
+
+        self.store = None  # OperationStore, wird in run() angelegt
+        self.queue_keys = {}  # Maschine -> key(op_id, now) bzw. None (FIFO), wird in run() angelegt
+        self.latest_start = None  # spätester Start je Operation (nur mit prune), wird in run() angelegt
+        self.metrics = metrics
+        self.fast_engine = None  # angehaltene FastEngine (snapshot_at, Forks)
+        self.started = False  # schrittweiser Lauf über advance() begonnen
 
     def _init_machines(self):
         unique_machines = self.dframe_schedule_plan["Machine"].unique()
-        return {m: Machine(self.env, m) for m in unique_machines}
-
-    def job_process(self, job_id, job_operations):
-        for op in job_operations:
-            machine = self.machines[op["Machine"]]
-            planned_start = op["Start"]
-            planned_duration = op["Duration"]
-
-            sim_duration = duration_log_normal(planned_duration, vc=self.vc)
+        if isinstance(self.discipline, dict):
+            return {m: Machine(self.env, m, get_discipline(self.discipline.get(m))) for m in unique_machines}
+        discipline = get_discipline(self.discipline)
+        return {m: Machine(self.env, m, discipline) for m in unique_machines}
+
+    def _init_queue_keys(self):
+        """Schlüsselfunktionen der Warteschlangen-Regeln für den aktuellen OperationStore."""
+        self.queue_keys = {name: machine.discipline.key_function(self.store) if machine.discipline else None
+                           for name, machine in self.machines.items()}
+
+    def _init_pruning(self):
+        """Späteste Starts je Operation für den aktuellen OperationStore (nur mit prune)."""
+        if self.prune is None:
+            self.latest_start = None
+        else:
+            self.latest_start = (self.store.latest_starts(self.until) + PRUNE_TOLERANCE).tolist()
+
+    def sample_durations(self):
+        """Zieht die simulierten Dauern aller Operationen (je Planzeile) aus self.rng."""
+        return draw_durations(self.dframe_schedule_plan, self.sampler, self.rng)
+
+    def _init_jobs(self, durations=None):
+        """
+        Legt den OperationStore an und liefert [(job_id, [op_id, ...]), ...]
+        mit nach Start sortierten Operationen je Job.
+        Die simulierten Dauern stehen vorab fest, beide Engines verbrauchen sie nur noch.
+        """
+        if durations is None:
+            durations = self.sample_durations()
+        self.store = OperationStore(self.dframe_schedule_plan, durations)
+        self._init_queue_keys()
+        self._init_pruning()
+        return self.store.routes()
+
+    @property
+    def starting_times_dict(self):
+        """{(job_id, machine_name): Start} der begonnenen, aber nicht fertigen Operationen."""
+        return self.store.running_operations() if self.store is not None else {}
+
+    @property
+    def finished_log(self):
+        return self.store.execution_frame().to_dict("records") if self.store is not None else []
+
+    def _phase(self, name):
+        return self.metrics.phase(name) if self.metrics is not None else nullcontext()
+
+    def job_process(self, job_id, op_ids):
+        store = self.store
+        metrics = self.metrics
+        for index, op_id in enumerate(op_ids):
+            machine = self.machines[store.machines[store.machine_codes[op_id]]]
+            planned_start = store.planned_start[op_id]
+            planned_duration = store.planned_duration[op_id]
+            sim_duration = store.sim_duration[op_id]
 
             # Warten bis zum geplanten Start (wenn nötig)
             delay = max(planned_start - self.env.now, 0)
             yield self.env.timeout(delay)
 
-            with machine.request() as req:
+            if self.latest_start is not None and self.job_cannot_finish_route(op_id, self.env.now, machine.busy_until):
+                self.prune_job(self.env.now, job_id, machine, op_ids[index:])
+                return  # Rest des Jobs aufgeben, ohne die Maschine anzufragen
+
+            queue_key = self.queue_keys[machine.name]
+            with (machine.request() if queue_key is None else machine.request(queue_key(op_id, self.env.now))) as req:
+                if metrics is not None:
+                    metrics.request(self.env.now, job_id, machine.name)
                 yield req
                 sim_start = self.env.now
+                if metrics is not None:
+                    metrics.grant(sim_start, job_id, machine.name)
 
                 if self.job_cannot_finish_on_time(job_id, machine, sim_start, planned_duration):
+                    store.mark_interrupted(op_id)
+                    if metrics is not None:
+                        metrics.abort(sim_start, job_id, machine.name)
                     return  # GANZEN JOB abbrechen
 
                 self.job_started_on_machine(sim_start, job_id, machine)
-                self.starting_times_dict[(job_id, machine.name)] = round(sim_start, 2)
+                store.mark_started(op_id, sim_start)
+                machine.busy_until = sim_start + sim_duration
+                if metrics is not None:
+                    metrics.start(sim_start, job_id, machine.name)
 
                 yield self.env.timeout(sim_duration)
                 sim_end = self.env.now
                 self.job_finished_on_machine(sim_end, job_id, machine, sim_duration)
+                if metrics is not None:
+                    metrics.finish(sim_end, job_id, machine.name)
 
-            self.finished_log.append({ "Job": job_id, "Machine": machine.name, "Start": round(sim_start, 2),
-                                        "Duration": sim_duration, "End": round(sim_end, 2)
-                                        })
-            # Fertige Operationen werden aus der starting_times Dictionary entfernt
-            if (job_id, machine.name) in self.starting_times_dict:
-                del self.starting_times_dict[(job_id, machine.name)]
+            store.mark_finished(op_id, sim_end)
 
-    def run(self, until=None):
+    def run(self, until=None, durations=None):
         """
-        Startet die Simpy-Simulation und gibt zwei DataFrames zurück:
+        Startet die Simulation (SimPy oder FastEngine) und gibt zwei DataFrames zurück:
         - df_execution: tatsächlich ausgeführte Operationen
         - df_late: Operationen, die nicht ausgeführt wurden
-        """
-        if until is not None:
-            self.until = min(until, 1440)
-        jobs_grouped = self.dframe_schedule_plan.groupby("Job")
-
 
-        for job_id, group in jobs_grouped:
-            # --- Sortiere Operationen nach geplanter Startzeit ---
-            operations = group.sort_values("Start").to_dict("records")
-            self.env.process(self.job_process(job_id, operations))
-
-        self.env.run(until=self.until)
+        durations (optional): vorab gezogene Dauern je Planzeile (z. B. aus draw_durations
+        für einen ganzen Replikations-Batch), sonst werden sie aus self.rng gezogen.
+        """
+        self.simulate(until, durations)
 
-        dframe_execution = pd.DataFrame(self.finished_log)
-        dframe_undone = get_undone_operations_df(self.dframe_schedule_plan, dframe_execution)
+        # Start der offenen Operationen ist nur gesetzt, falls gestartet, aber nicht fertig geworden
+        with self._phase("postprocess"):
+            return self.store.execution_frame(), self.store.undone_frame()
 
-        # Hinzufügen des Starts (falls gestartet, aber nicht fertig geworden)
-        dframe_undone["Start"] = dframe_undone.apply(
-            lambda row: self.starting_times_dict.get((row["Job"], row["Machine"])),
-            axis=1
-        )
-        return dframe_execution, dframe_undone
+    def simulate(self, until=None, durations=None):
+        """
+        Wie run(), baut aber keine DataFrames: Ergebnisse stehen in self.store bzw. gehen
+        nur an die Sinks (z. B. ExecutionStreamSink für das blockweise Schreiben).
+        """
+        if until is not None:
+            self.until = min(until, 1440)
+        if self.metrics is not None:
+            self.metrics.reset(self.machines)
+
+        with self._phase("setup"):
+            jobs = self._init_jobs(durations)
+
+        with self._phase("run"):
+            if self.engine == "fast":
+                engine = FastEngine(self, jobs)
+                engine.run(self.until)
+                events = engine.events_processed()
+            else:
+                for job_id, operations in jobs:
+                    self.env.process(self.job_process(job_id, operations))
+                events = self._run_env()
+
+        if self.metrics is not None:
+            self.metrics.close(self.until, events)
+
+    def advance(self, time_stamp):
+        """
+        Simuliert schrittweise alle Ereignisse vor time_stamp (beide Engines).
+        Weitere Aufrufe mit späterem time_stamp bzw. resume() setzen denselben Lauf fort,
+        das Ergebnis entspricht dem eines durchgehenden run().
+        """
+        if not self.started:
+            jobs = self._init_jobs()
+            if self.engine == "fast":
+                self.fast_engine = FastEngine(self, jobs)
+            else:
+                for job_id, operations in jobs:
+                    self.env.process(self.job_process(job_id, operations))
+            self.started = True
+
+        time_stamp = min(time_stamp, self.until)
+        if self.engine == "fast":
+            self.fast_engine.run(self.until, stop=time_stamp)
+        elif time_stamp > self.env.now:
+            self.env.run(until=time_stamp)
+
+    def snapshot_at(self, time_stamp):
+        """
+        Simuliert (nur engine="fast") bis time_stamp und liefert einen SimulationSnapshot,
+        aus dem sich beliebig viele Fortsetzungen ab diesem Zeitpunkt forken lassen.
+        Mehrfache Aufrufe mit steigendem time_stamp setzen denselben Lauf fort.
+        """
+        if self.engine != "fast":
+            raise ValueError("Snapshots werden nur mit engine='fast' unterstützt")
+        if self.started and time_stamp < self.fast_engine.now:
+            raise ValueError(f"Simulation ist bereits bei {self.fast_engine.now}, Snapshot bei {time_stamp} nicht möglich")
+        self.advance(time_stamp)
+        return SimulationSnapshot(self, time_stamp)
+
+    def resume(self):
+        """Setzt einen schrittweisen Lauf (advance, snapshot_at oder Fork) bis Tagesende fort."""
+        self.advance(self.until)
+        return self.store.execution_frame(), self.store.undone_frame()
+
+    def _run_env(self):
+        """env.run(until) bzw. mit Metrics schrittweise, um die verarbeiteten Ereignisse zu zählen."""
+        if self.metrics is None:
+            self.env.run(until=self.until)
+            return None
+
+        events = 0
+        while self.env.peek() < self.until:
+            self.env.step()
+            events += 1
+        return events
 
     # Ausgaben ------------------------------------------------------------------
+    def add_sink(self, sink):
+        """Registriert einen EventSink (NullSink wird ignoriert, damit er nichts kostet)."""
+        if not isinstance(sink, NullSink):
+            self.sinks.append(sink)
+
     def job_started_on_machine(self, time_stamp, job_id, machine):
-        print(f"[{get_time_str(time_stamp)}] {job_id} started on {machine.name}")
-        if self.controller:
-            self.controller.job_started_on_machine(time_stamp, job_id, machine)
-            time.sleep(0.04)
+        for sink in self.sinks:
+            sink.job_started(time_stamp, job_id, machine.name)
 
     def job_finished_on_machine(self, time_stamp, job_id, machine, sim_duration):
-        print(f"[{get_time_str(time_stamp)}] {job_id} finished on {machine.name} (after {get_duration(sim_duration)})")
-        if self.controller:
-            self.controller.job_finished_on_machine(time_stamp, job_id, machine, sim_duration)
-            time.sleep(0.12)
+        for sink in self.sinks:
+            sink.job_finished(time_stamp, job_id, machine.name, sim_duration)
 
     def job_cannot_finish_on_time(self, job_id, machine, time_stamp, planned_duration):
         """
@@ -169,16 +303,34 @@ class ProductionDaySimulation:
         sodass sie nicht mehr innerhalb des Tages abgeschlossen werden kann.
         """
         if time_stamp + planned_duration > self.until:
-            print(
-                f"[{get_time_str(time_stamp)}] {job_id} interrupted before machine "
-                f"{machine.name} — would finish too late at {get_time_str(time_stamp + planned_duration)}"
-            )
+            for sink in self.sinks:
+                sink.job_interrupted(time_stamp, job_id, machine.name, time_stamp + planned_duration)
             return True
         return False
 
-    # Controller
+    def job_cannot_finish_route(self, op_id, time_stamp, busy_until=0):
+        """
+        Schranke für prune: Selbst ohne Wartezeiten würde eine Operation der restlichen Route
+        (ab op_id, Anfrage zu time_stamp) an der Abbruchregel scheitern.
+        busy_until (Ende der laufenden Operation auf der Maschine) zählt nur mit prune="machine".
+        """
+        if self.prune == "machine":
+            time_stamp = max(time_stamp, busy_until)
+        return time_stamp > self.latest_start[op_id]
+
+    def prune_job(self, time_stamp, job_id, machine, op_ids):
+        """Gibt die restlichen Operationen eines Jobs auf (Ereignis wie bei einem Abbruch)."""
+        self.store.mark_pruned(op_ids)
+        planned_duration = self.store.planned_duration[op_ids[0]]
+        for sink in self.sinks:
+            sink.job_interrupted(time_stamp, job_id, machine.name, time_stamp + planned_duration)
+        if self.metrics is not None:
+            self.metrics.abort(time_stamp, job_id, machine.name)
+
+    # Controller (ein weiterer EventSink)
     def set_controller(self, controller):
         self.controller = controller
+        self.add_sink(controller)
         self.controller.add_machines(*self.machines.values())
 
         job_ids = job_ids = sorted(self.dframe_schedule_plan["Job"].unique())
@@ -191,11 +343,14 @@ class ProductionDaySimulation:
 def get_jssp_from_schedule(df_schedule: pd.DataFrame, duration_column: str = "Duration") -> dict:
     job_dict = {}
 
-    df_schedule = df_schedule.copy()
-    df_schedule["Machine"] = df_schedule["Machine"].str.extract(r"M(\d+)").astype(int)
-    df_schedule[duration_column] = df_schedule[duration_column].astype(int)
+    # Maschinen-Codes einmal je Kategorie bestimmen statt Regex je Zeile
+    if "Machine Code" in df_schedule.columns:
+        machines = df_schedule["Machine Code"].to_numpy().tolist()
+    else:
+        machines = get_machine_codes(df_schedule["Machine"]).tolist()
+    durations = df_schedule[duration_column].to_numpy().astype(int).tolist()
 
-    for job, machine, duration in zip(df_schedule["Job"], df_schedule["Machine"], df_schedule[duration_column]):
+    for job, machine, duration in zip(df_schedule["Job"], machines, durations):
         if job not in job_dict:
             job_dict[job] = []
         job_dict[job].append([machine, duration])
@@ -204,7 +359,7 @@ def get_jssp_from_schedule(df_schedule: pd.DataFrame, duration_column: str = "Du
 
 
 if __name__ == "__main__":
-    df_schedule_plan = pd.read_csv("data/04_schedule_plan_firstday.csv")  # dein geplanter Tagesplan
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")  # dein geplanter Tagesplan
     simulation = ProductionDaySimulation(df_schedule_plan, vc=0.25)
     df_execution, df_undone = simulation.run(until=1440)
 
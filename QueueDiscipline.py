@@ -0,0 +1,134 @@
+import numpy as np
+
+
+# --- Warteschlangen-Strategien je Maschine ---
+
+class QueueDiscipline:
+    """
+    Strategie, in welcher Reihenfolge eine Machine wartende Jobs bedient.
+
+    key_function(store) liefert eine Funktion key(op_id, now), die beim Anstellen eines
+    Jobs aufgerufen wird; der kleinste Schlüssel wird zuerst bedient, bei Gleichstand
+    gilt die Reihenfolge der Anfragen. FIFO (fifo = True) nutzt die unveränderte
+    SimPy-Warteschlange. local = True heißt: der Schlüssel hängt nur von den Plandaten
+    der Operation selbst ab (nicht von anderen Operationen ihres Jobs).
+    """
+
+    name = None
+    fifo = False
+    local = False
+
+    def key_function(self, store):
+        """
+        Args:
+            store (OperationStore): Operationen des aktuellen Laufs
+
+        Returns:
+            callable: key(op_id, now) -> Zahl
+        """
+        raise NotImplementedError
+
+
+class FIFO(QueueDiscipline):
+    """Reihenfolge der Anfragen (Standard, Verhalten von simpy.Resource)."""
+
+    name = "FIFO"
+    fifo = True
+    local = True
+
+    def key_function(self, store):
+        return None
+
+
+class PlannedStart(QueueDiscipline):
+    """Früheste geplante Startzeit der Operation zuerst."""
+
+    name = "PlannedStart"
+    local = True
+
+    def key_function(self, store):
+        return _lookup(store.planned_start)
+
+
+class SPT(QueueDiscipline):
+    """Kürzeste geplante Bearbeitungszeit zuerst."""
+
+    name = "SPT"
+    local = True
+
+    def key_function(self, store):
+        return _lookup(store.planned_duration)
+
+
+class EDD(QueueDiscipline):
+    """Frühester Liefertermin zuerst (geplantes Ende der letzten Operation des Jobs)."""
+
+    name = "EDD"
+
+    def key_function(self, store):
+        return _lookup(job_due_dates(store)[store.job_codes])
+
+
+class CR(QueueDiscipline):
+    """
+    Kleinstes kritisches Verhältnis (Liefertermin - jetzt) / geplante Restarbeit zuerst.
+    Das Verhältnis wird beim Anstellen berechnet (Heap mit festen Schlüsseln).
+    """
+
+    name = "CR"
+
+    def key_function(self, store):
+        due = job_due_dates(store)[store.job_codes].tolist()
+        remaining = remaining_work(store).tolist()
+
+        def key(op_id, now):
+            return (due[op_id] - now) / remaining[op_id] if remaining[op_id] > 0 else -np.inf
+        return key
+
+
+DISCIPLINES = {cls.name: cls for cls in (FIFO, PlannedStart, SPT, EDD, CR)}
+
+
+def get_discipline(discipline):
+    """QueueDiscipline aus Instanz, Name ("FIFO", "PlannedStart", "SPT", "EDD", "CR") oder None (-> FIFO)."""
+    if discipline is None:
+        return FIFO()
+    if isinstance(discipline, QueueDiscipline):
+        return discipline
+    if discipline not in DISCIPLINES:
+        raise ValueError(f"Unbekannte Warteschlangen-Regel '{discipline}', erlaubt: {', '.join(DISCIPLINES)}")
+    return DISCIPLINES[discipline]()
+
+
+# --- Hilfsfunktionen ---
+
+def _lookup(values):
+    values = np.asarray(values, dtype=float).tolist()
+
+    def key(op_id, now):
+        return values[op_id]
+    return key
+
+
+def job_due_dates(store):
+    """Geplantes Ende (Start + Dauer) der letzten Operation je Job-Code."""
+    due = np.full(len(store.jobs), -np.inf)
+    np.maximum.at(due, store.job_codes, store.planned_start + store.planned_duration)
+    return due
+
+
+def remaining_work(store):
+    """Geplante Restarbeit je Operation inkl. der Operation selbst (Route nach geplantem Start)."""
+    order = np.lexsort((store.planned_start, store.job_codes))
+    durations = np.asarray(store.planned_duration, dtype=float)[order]
+    jobs = store.job_codes[order]
+
+    # Suffixsummen je Job: Gesamtsumme des Jobs minus kumulierte Summe davor
+    cumulative = np.cumsum(durations)
+    job_totals = np.zeros(len(store.jobs))
+    np.add.at(job_totals, jobs, durations)
+    job_before = np.concatenate(([0.0], cumulative))[np.searchsorted(jobs, jobs, side="left")]
+
+    result = np.empty(len(order))
+    result[order] = job_totals[jobs] - (cumulative - durations - job_before)
+    return result
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+from EventSink import RECORD_FIELDS, RingBufferSink
+
+
+class RealtimeStream:
+    """
+    Beschleunigte Echtzeit-Wiedergabe einer ProductionDaySimulation als asyncio-Iterator:
+
+        async for event in RealtimeStream(simulation, speed=60):
+            ...  # {"Event": "started", "Time": 12.5, "Job": ..., "Machine": ..., "Value": ...}
+
+    Die Simulation wird in kleinen Zeitscheiben über advance() gerechnet (blockiert
+    die Event-Loop nur kurz), die Ereignisse werden dann nach einem absoluten
+    Wanduhr-Fahrplan (Start + Simulationszeit / speed) ausgegeben. Ungenaue Wartezeiten
+    summieren sich so nicht auf (Drift-Kompensation). Liegt die Wiedergabe hinter dem
+    Fahrplan, werden die Ereignisse sofort nachgeholt statt abzubrechen; die größte
+    Verspätung steht in max_lag.
+    """
+
+    def __init__(self, simulation, speed=60, slice_minutes=1.0):
+        """
+        Args:
+            simulation (ProductionDaySimulation): noch nicht gestartete Simulation (beide Engines)
+            speed (float | None): Simulationsminuten pro Sekunde Wanduhr (None -> so schnell wie möglich)
+            slice_minutes (float): Simulationszeit, die jeweils am Stück gerechnet wird
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed muss positiv sein (oder None für ungebremst)")
+        if slice_minutes <= 0:
+            raise ValueError("slice_minutes muss positiv sein")
+
+        self.simulation = simulation
+        self.speed = speed
+        self.slice_minutes = slice_minutes
+        self.max_lag = 0.0  # größte Verspätung gegenüber dem Fahrplan in Sekunden
+        self.sink = RingBufferSink(capacity=None)
+        simulation.add_sink(self.sink)
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        loop = asyncio.get_running_loop()
+        simulation = self.simulation
+        buffer = self.sink.buffer
+        wall_start = loop.time()
+
+        sim_time = 0
+        while sim_time < simulation.until:
+            sim_time = min(sim_time + self.slice_minutes, simulation.until)
+            simulation.advance(sim_time)
+
+            while buffer:
+                record = buffer.popleft()
+                if self.speed is not None:
+                    delay = wall_start + record[1] / self.speed - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        self.max_lag = max(self.max_lag, -delay)
+                yield dict(zip(RECORD_FIELDS, record))
+
+            # Auch ohne Ereignisse die Event-Loop nicht aushungern
+            if self.speed is None:
+                await asyncio.sleep(0)
+            else:
+                delay = wall_start + sim_time / self.speed - loop.time()
+                await asyncio.sleep(max(delay, 0))
+
+    def result(self):
+        """df_execution und df_undone nach Ende des Streams."""
+        return self.simulation.store.execution_frame(), self.simulation.store.undone_frame()
+
+
+# --- Lokaler Stand-in-Server (JSON Lines über TCP) ---
+
+async def serve_stream(stream, host="127.0.0.1", port=8765, on_ready=None):
+    """
+    Verteilt die Ereignisse eines RealtimeStream als JSON-Zeilen an alle verbundenen
+    TCP-Clients (z. B. ein Dashboard oder ein Websocket-Proxy). Später verbundene
+    Clients erhalten die Ereignisse ab ihrem Verbindungszeitpunkt. Clients, die die
+    Verbindung schließen, werden entfernt, ohne den Stream aufzuhalten.
+
+    Args:
+        stream (RealtimeStream): Quelle der Ereignisse
+        host (str): Adresse (Standard: nur lokal)
+        port (int): TCP-Port (0 -> freien Port wählen)
+        on_ready (callable, optional): wird mit (host, port) aufgerufen, sobald der Server lauscht
+    """
+    clients = set()
+
+    async def register(reader, writer):
+        clients.add(writer)
+
+    server = await asyncio.start_server(register, host, port)
+    if on_ready is not None:
+        on_ready(*server.sockets[0].getsockname()[:2])
+
+    async def send(writer, line):
+        try:
+            writer.write(line)
+            await writer.drain()
+        except (ConnectionError, RuntimeError):
+            clients.discard(writer)
+
+    async with server:
+        async for event in stream:
+            line = (json.dumps(event) + "\n").encode("utf-8")
+            await asyncio.gather(*(send(writer, line) for writer in list(clients)))
+
+        for writer in list(clients):
+            writer.close()
+
+
+if __name__ == "__main__":
+    from PlanIO import load_plan
+    from ProductionDaySimulation import ProductionDaySimulation
+
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")
+    simulation = ProductionDaySimulation(df_schedule_plan, vc=0.25, engine="fast", sinks=[])
+    realtime_stream = RealtimeStream(simulation, speed=60)  # 60 Simulationsminuten pro Sekunde
+
+    asyncio.run(serve_stream(realtime_stream, on_ready=lambda host, port: print(f"Ereignisse auf {host}:{port} (JSON Lines)")))
@@ -0,0 +1,152 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from DurationSampler import SCHEMES, LogNormalSampler, draw_durations
+from KPI import compute_kpis, summarize_kpis
+from PlanIO import load_plan
+from PlanValidator import assert_valid_plan
+from ProductionDaySimulation import ProductionDaySimulation
+from WorkerPool import map_in_pool, worker_state
+
+
+# --- Seeds ---
+
+def get_replication_seeds(n, seeds=None):
+    """
+    Liefert n reproduzierbare Seeds für die Replikationen.
+    - seeds=None: zufälliger Basis-Seed (nicht reproduzierbar)
+    - seeds=int: Basis-Seed, daraus werden n unabhängige Seeds abgeleitet
+    - seeds=Liste: wird direkt verwendet (Länge muss n sein)
+    """
+    if seeds is None or isinstance(seeds, (int, np.integer)):
+        return [int(s) for s in np.random.SeedSequence(seeds).generate_state(n)]
+
+    seeds = [int(s) for s in seeds]
+    if len(seeds) != n:
+        raise ValueError(f"Es werden {n} Seeds benötigt, erhalten: {len(seeds)}")
+    return seeds
+
+
+# --- Worker (ein Prozess pro Kern, siehe WorkerPool) ---
+
+def _run_replication(task):
+    replication_id, seed, durations = task
+    state = worker_state()
+    simulation = ProductionDaySimulation(state["plan"], vc=state["vc"], seed=seed, engine=state["engine"],
+                                         sampler=state["sampler"], sinks=[], prune=state["prune"])
+    df_execution, df_undone = simulation.run(until=state["until"], durations=durations)
+    return replication_id, df_execution, df_undone
+
+
+# --- Replikationen ---
+
+def run_replications(df_plan, n, vc=0.2, seeds=None, workers=None, until=1440, sampler=None, sampling="iid",
+                     writer=None, validate=False, prune=None, engine="simpy"):
+    """
+    Führt n unabhängige Replikationen des Tagesplans parallel in einem Prozess-Pool aus.
+
+    Args:
+        df_plan (DataFrame): Geplanter Tagesplan ('Job', 'Machine', 'Start', 'Duration', 'End')
+        n (int): Anzahl der Replikationen
+        vc (float): Variationskoeffizient für Lognormalverteilung
+        seeds (int | list, optional): Basis-Seed oder ein Seed je Replikation
+        workers (int, optional): Anzahl Prozesse (None -> alle Kerne, 1 -> ohne Pool)
+        until (float): Simulationsende in Minuten
+        sampler (DurationSampler, optional): Verteilung der Dauern (Standard: LogNormalSampler(vc))
+        sampling (str): Varianzreduktion über die Replikationen hinweg:
+            "iid" (unabhängige Replikationen), "antithetic" (Paare u / 1-u, n gerade) oder
+            "lhs" (Latin Hypercube je Operation). Die Randverteilung je Operation bleibt gleich.
+        writer (ResultWriter, optional): Ergebnisse je Replikation sofort blockweise schreiben,
+            statt alle Replikationen im Speicher zu sammeln
+        validate (bool): Plan vorab mit assert_valid_plan prüfen (ValueError bei Fehlern)
+        prune (str, optional): Jobs vorzeitig aufgeben ("route", "machine"), siehe ProductionDaySimulation
+        engine (str): "simpy" (Standard) oder "fast", siehe ProductionDaySimulation
+
+    Returns:
+        (DataFrame, DataFrame): df_execution und df_undone aller Replikationen,
+        jeweils mit zusätzlicher Spalte 'Replication'
+        (mit writer: Pfade der Tabellen "execution" und "undone")
+    """
+    if sampling not in SCHEMES:
+        raise ValueError(f"Unbekanntes Schema '{sampling}', erlaubt: {', '.join(SCHEMES)}")
+    if validate:
+        assert_valid_plan(df_plan)
+
+    replication_seeds = get_replication_seeds(n, seeds)
+    if sampling == "iid":
+        durations = [None] * n
+    else:
+        # Abhängige Ziehungen entstehen gemeinsam für alle Replikationen, die Worker erhalten nur ihre Zeile
+        durations = draw_durations(df_plan, sampler if sampler is not None else LogNormalSampler(vc),
+                                   np.random.default_rng(replication_seeds), size=n, scheme=sampling)
+    tasks = [(replication_id, seed, durations[replication_id])
+             for replication_id, seed in enumerate(replication_seeds)]
+
+    state = {"plan": df_plan, "vc": vc, "until": until, "sampler": sampler, "prune": prune, "engine": engine}
+    # Mehrere Replikationen pro Auftrag, damit der IPC-Overhead klein bleibt
+    chunksize = max(1, n // ((workers or os.cpu_count() or 1) * 4))
+    return _collect_replications(map_in_pool(_run_replication, tasks, state, workers, chunksize), writer)
+
+
+def _collect_replications(results, writer=None):
+    """Ergebnisse in Reihenfolge der Replikationen zusammenfügen bzw. (mit writer) sofort schreiben."""
+    if writer is not None:
+        for replication_id, df_execution, df_undone in results:
+            writer.write("execution", df_execution, Replication=replication_id)
+            writer.write("undone", df_undone, Replication=replication_id)
+        writer.flush()
+        return writer.path("execution"), writer.path("undone")
+
+    executions = []
+    undones = []
+    for replication_id, df_execution, df_undone in results:
+        executions.append(df_execution.assign(Replication=replication_id))
+        undones.append(df_undone.assign(Replication=replication_id))
+
+    dframe_execution = _concat_replications(executions)
+    dframe_undone = _concat_replications(undones)
+    return dframe_execution, dframe_undone
+
+
+# --- Vergleich zweier Pläne ---
+
+def compare_plans(df_plan_a, df_plan_b, n, vc=0.2, seeds=None, workers=None, until=1440, sampler=None,
+                  sampling="iid", confidence=0.95, engine="simpy"):
+    """
+    Vergleicht zwei Pläne mit Common Random Numbers: beide laufen mit denselben Seeds bzw.
+    Ziehungen, die Differenzen der KPIs (B - A) werden je Replikation gebildet. Die
+    Störungen hängen an (Job, Machine), nicht an der Zeilenreihenfolge; enthalten beide Pläne
+    dieselben Operationen (z. B. nur umsortiert), erhält jede Operation in beiden Plänen
+    dieselbe Dauer und das Konfidenzintervall der Differenz wird deutlich schmaler.
+
+    Returns:
+        (DataFrame, DataFrame, DataFrame): Zusammenfassung der Differenzen (summarize_kpis),
+        KPIs je Replikation für Plan A und für Plan B
+    """
+    replication_seeds = get_replication_seeds(n, seeds)
+    kpis = []
+    for df_plan in (df_plan_a, df_plan_b):
+        df_execution, df_undone = run_replications(df_plan, n, vc=vc, seeds=replication_seeds, workers=workers,
+                                                   until=until, sampler=sampler, sampling=sampling, engine=engine)
+        kpis.append(compute_kpis(df_plan, df_execution, df_undone, until=until))
+    df_kpis_a, df_kpis_b = kpis
+    return summarize_kpis(df_kpis_b - df_kpis_a, confidence), df_kpis_a, df_kpis_b
+
+
+def _concat_replications(frames):
+    dframe = pd.concat(frames, ignore_index=True)
+    columns = ["Replication"] + [c for c in dframe.columns if c != "Replication"]
+    return dframe[columns]
+
+
+if __name__ == "__main__":
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")
+    df_execution, df_undone = run_replications(df_schedule_plan, n=100, vc=0.25, seeds=42)
+
+    print("=== Abgeschlossene Operationen je Replikation ===")
+    print(df_execution.groupby("Replication").size().describe())
+
+    print("\n=== Offene Operationen je Replikation ===")
+    print(df_undone.groupby("Replication").size().describe())
@@ -0,0 +1,177 @@
+import glob
+import hashlib
+import itertools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from PlanIO import PLAN_COLUMNS, frame_from_arrays, frame_to_arrays, write_npz
+from PlanValidator import assert_valid_plan
+from ProductionDaySimulation import ENGINE_VERSION, ProductionDaySimulation
+from WorkerPool import map_in_pool, worker_state
+
+
+# --- Schlüssel ---
+
+def plan_digest(df_plan):
+    """Hash des Planinhalts ('Job', 'Machine', 'Start', 'Duration', 'End'), unabhängig von dtypes und Index."""
+    dframe = df_plan[PLAN_COLUMNS].reset_index(drop=True)
+    dframe = dframe.astype({"Job": str, "Machine": str, "Start": float, "Duration": float, "End": float})
+    hashes = pd.util.hash_pandas_object(dframe, index=False).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()
+
+
+def result_key(digest, vc, until, seed, engine="fast"):
+    """Schlüssel eines Laufs: Plan-Hash, Parameter, Engine-Version und Seed."""
+    params = {"plan": digest, "vc": float(vc), "until": float(until), "seed": int(seed),
+              "engine": engine, "engine_version": ENGINE_VERSION}
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# --- Cache ---
+
+class ResultCache:
+    """
+    Inhaltsadressierter Ergebnis-Cache auf der Platte: je Lauf eine komprimierte .npz-Datei
+    mit df_execution und df_undone. Die Größe ist begrenzt; bei Überschreitung werden die
+    am längsten nicht benutzten Einträge gelöscht (LRU über die Änderungszeit der Dateien).
+    """
+
+    def __init__(self, directory, max_bytes=1024 ** 3):
+        """
+        Args:
+            directory (str): Verzeichnis des Caches (wird angelegt)
+            max_bytes (int): maximale Gesamtgröße aller Einträge in Bytes
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def get(self, key):
+        """(df_execution, df_undone) oder None, falls nicht vorhanden."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                result = frame_from_arrays(arrays, "execution/"), frame_from_arrays(arrays, "undone/")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(path)  # zuletzt benutzt
+        self.hits += 1
+        return result
+
+    def put(self, key, df_execution, df_undone):
+        arrays = {**frame_to_arrays(df_execution, "execution/"), **frame_to_arrays(df_undone, "undone/")}
+        write_npz(self._path(key), arrays, compressed=True)
+        self.evict()
+
+    def size(self):
+        return sum(os.path.getsize(path) for path in glob.glob(os.path.join(self.directory, "*.npz")))
+
+    def evict(self):
+        """Löscht die ältesten Einträge, bis die Gesamtgröße unter max_bytes liegt."""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "*.npz")):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for path in glob.glob(os.path.join(self.directory, "*.npz")):
+            os.remove(path)
+
+
+# --- Parameterstudien ---
+
+def _run_cell(cell):
+    vc, until, seed = cell
+    state = worker_state()
+    simulation = ProductionDaySimulation(state["plan"], vc=vc, seed=seed, engine=state["engine"], sinks=[])
+    return simulation.run(until=until)
+
+
+def run_sweep(df_plan, vcs, untils=(1440,), seeds=(0,), cache=None, engine="fast", workers=None, validate=False):
+    """
+    Simuliert alle Kombinationen aus vcs x untils x seeds. Bereits im Cache vorhandene
+    Gitterpunkte werden nur geladen, gerechnet werden nur die fehlenden (bei Bedarf parallel).
+
+    Args:
+        df_plan (DataFrame): Tagesplan
+        vcs (iterable): Variationskoeffizienten
+        untils (iterable): Simulationsenden in Minuten
+        seeds (iterable): ganzzahlige Seeds (reproduzierbar, Teil des Schlüssels)
+        cache (ResultCache, optional): Ergebnis-Cache (None -> alles rechnen)
+        engine (str): "fast" oder "simpy"
+        workers (int, optional): Anzahl Prozesse (None -> alle Kerne, 1 -> ohne Pool)
+        validate (bool): Plan vorab mit assert_valid_plan prüfen (ValueError bei Fehlern)
+
+    Returns:
+        (DataFrame, DataFrame): df_execution und df_undone aller Gitterpunkte,
+        jeweils mit zusätzlichen Spalten 'VC', 'Until' und 'Seed'
+    """
+    cells = list(itertools.product(vcs, untils, seeds))
+    if any(not isinstance(seed, (int, np.integer)) for _, _, seed in cells):
+        raise ValueError("Parameterstudien benötigen ganzzahlige Seeds")
+    if validate:
+        assert_valid_plan(df_plan)
+
+    digest = plan_digest(df_plan) if cache is not None else None
+    results = {}
+    missing = []
+    for cell in cells:
+        cached = cache.get(result_key(digest, *cell, engine=engine)) if cache is not None else None
+        if cached is None:
+            missing.append(cell)
+        else:
+            results[cell] = cached
+
+    if missing:
+        computed = list(map_in_pool(_run_cell, missing, {"plan": df_plan, "engine": engine},
+                                    workers=1 if len(missing) == 1 else workers))
+
+        for cell, (df_execution, df_undone) in zip(missing, computed):
+            results[cell] = df_execution, df_undone
+            if cache is not None:
+                cache.put(result_key(digest, *cell, engine=engine), df_execution, df_undone)
+
+    executions = []
+    undones = []
+    for vc, until, seed in cells:
+        df_execution, df_undone = results[(vc, until, seed)]
+        labels = {"VC": vc, "Until": until, "Seed": seed}
+        executions.append(df_execution.assign(**labels))
+        undones.append(df_undone.assign(**labels))
+    return _concat_cells(executions), _concat_cells(undones)
+
+
+def _concat_cells(frames):
+    dframe = pd.concat(frames, ignore_index=True)
+    columns = ["VC", "Until", "Seed"] + [c for c in dframe.columns if c not in ("VC", "Until", "Seed")]
+    return dframe[columns]
+
+
+if __name__ == "__main__":
+    from PlanIO import load_plan
+
+    df_schedule_plan = load_plan("data/04_schedule_plan_firstday.csv")
+    result_cache = ResultCache(".result_cache", max_bytes=256 * 1024 ** 2)
+
+    df_execution, df_undone = run_sweep(df_schedule_plan, vcs=[0.1, 0.2, 0.3], untils=[960, 1440],
+                                        seeds=range(10), cache=result_cache)
+    print(f"Cache: {result_cache.hits} Treffer, {result_cache.misses} neu berechnet")
+    print(df_undone.groupby(["VC", "Until"]).size().unstack())
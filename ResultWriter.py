@@ -0,0 +1,215 @@
+import os
+
+import pandas as pd
+
+from EventSink import EventSink
+
+FORMATS = ("csv", "parquet")
+EXECUTION_COLUMNS = ["Job", "Machine", "Start", "Duration", "End"]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Parquet benötigt das Paket 'pyarrow' (alternativ file_format='csv')") from error
+    return pyarrow, pyarrow.parquet
+
+
+# --- Schreiben ---
+
+class ResultWriter:
+    """
+    Schreibt Ergebnistabellen (z. B. "execution", "undone") während der Simulation in
+    Blöcken fester Größe auf die Platte: CSV (Anhängen) oder Parquet (eine Row Group je Block).
+    Im Speicher liegt höchstens ein Block je Tabelle.
+
+    Jede Tabelle landet in <directory>/<table>.<format>; Kennungen wie Replication=3
+    werden als führende Spalten ergänzt.
+    """
+
+    def __init__(self, directory, file_format="csv", chunk_size=100_000):
+        """
+        Args:
+            directory (str): Ausgabeverzeichnis (wird angelegt, vorhandene Tabellen werden überschrieben)
+            file_format (str): "csv" oder "parquet" (benötigt pyarrow)
+            chunk_size (int): Zeilen je geschriebenem Block
+        """
+        if file_format not in FORMATS:
+            raise ValueError(f"Unbekanntes Format '{file_format}', erlaubt: {', '.join(FORMATS)}")
+        if file_format == "parquet":
+            _require_pyarrow()
+
+        self.directory = directory
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        self.buffers = {}  # Tabelle -> [DataFrame, ...]
+        self.buffered_rows = {}
+        self.parquet_writers = {}
+        self.started = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, table):
+        return os.path.join(self.directory, f"{table}.{self.file_format}")
+
+    def write(self, table, dframe, **labels):
+        """Hängt Zeilen an eine Tabelle an; volle Blöcke werden sofort geschrieben."""
+        if labels:
+            dframe = dframe.assign(**labels)[list(labels) + [c for c in dframe.columns if c not in labels]]
+        self.buffers.setdefault(table, []).append(dframe)
+        self.buffered_rows[table] = self.buffered_rows.get(table, 0) + len(dframe)
+
+        if self.buffered_rows[table] >= self.chunk_size:
+            pending = pd.concat(self.buffers[table], ignore_index=True)
+            full = len(pending) - len(pending) % self.chunk_size
+            for start in range(0, full, self.chunk_size):
+                self._write_chunk(table, pending.iloc[start:start + self.chunk_size])
+            rest = pending.iloc[full:]
+            self.buffers[table] = [rest] if len(rest) else []
+            self.buffered_rows[table] = len(rest)
+
+    def flush(self):
+        for table, frames in self.buffers.items():
+            if frames:
+                self._write_chunk(table, pd.concat(frames, ignore_index=True))
+            self.buffers[table] = []
+            self.buffered_rows[table] = 0
+
+    def close(self):
+        self.flush()
+        for writer in self.parquet_writers.values():
+            writer.close()
+        self.parquet_writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_chunk(self, table, dframe):
+        # Kategorien als Text, damit alle Blöcke dasselbe Schema haben
+        dframe = dframe.astype({c: str for c in dframe.columns if isinstance(dframe[c].dtype, pd.CategoricalDtype)})
+
+        if self.file_format == "csv":
+            first = table not in self.started
+            dframe.to_csv(self.path(table), mode="w" if first else "a", header=first, index=False)
+        else:
+            pyarrow, parquet = _require_pyarrow()
+            writer = self.parquet_writers.get(table)
+            if writer is None:
+                arrow_table = pyarrow.Table.from_pandas(dframe, preserve_index=False)
+                writer = self.parquet_writers[table] = parquet.ParquetWriter(self.path(table), arrow_table.schema)
+            else:
+                arrow_table = pyarrow.Table.from_pandas(dframe, schema=writer.schema, preserve_index=False)
+            writer.write_table(arrow_table)
+        self.started.add(table)
+
+
+class ExecutionStreamSink(EventSink):
+    """
+    EventSink, der fertige Operationen noch während des Laufs an einen ResultWriter gibt
+    (gleiche Zeilen wie df_execution). Im Speicher bleiben nur laufende Operationen und
+    ein Block fertiger Zeilen.
+    """
+
+    def __init__(self, writer, table="execution", **labels):
+        self.writer = writer
+        self.table = table
+        self.labels = labels
+        self.started = {}  # (job_id, machine_name) -> Start
+        self.rows = []
+
+    def job_started(self, time_stamp, job_id, machine_name):
+        self.started[(job_id, machine_name)] = time_stamp
+
+    def job_finished(self, time_stamp, job_id, machine_name, sim_duration):
+        start = self.started.pop((job_id, machine_name))
+        self.rows.append((job_id, machine_name, round(start, 2), sim_duration, round(time_stamp, 2)))
+        if len(self.rows) >= self.writer.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write(self.table, pd.DataFrame(self.rows, columns=EXECUTION_COLUMNS), **self.labels)
+            self.rows = []
+
+    def close(self):
+        self.flush()
+
+
+def write_run(simulation, writer, until=None, durations=None, **labels):
+    """
+    Simuliert einen Lauf und schreibt fertige Operationen schon während des Laufs
+    (Tabelle "execution"), die offenen Operationen am Ende (Tabelle "undone").
+    Es wird kein df_execution im Speicher aufgebaut.
+
+    Args:
+        simulation (ProductionDaySimulation): noch nicht gestartete Simulation
+        writer (ResultWriter): Ziel
+        until (float, optional): Simulationsende in Minuten
+        durations (array, optional): vorab gezogene Dauern (siehe ProductionDaySimulation.run)
+        **labels: zusätzliche führende Spalten, z. B. Replication=3
+
+    Returns:
+        (int, int): Anzahl ausgeführter und offener Operationen
+    """
+    sink = ExecutionStreamSink(writer, **labels)
+    simulation.add_sink(sink)
+    try:
+        simulation.simulate(until, durations)
+    finally:
+        simulation.sinks.remove(sink)
+    sink.close()
+
+    df_undone = simulation.store.undone_frame()
+    writer.write("undone", df_undone, **labels)
+    return len(simulation.store) - len(df_undone), len(df_undone)
+
+
+# --- Lesen (blockweise) ---
+
+def iter_results(path, chunk_size=100_000, columns=None):
+    """
+    Liest eine mit ResultWriter geschriebene Tabelle blockweise (CSV oder Parquet),
+    ohne die ganze Datei zu laden.
+
+    Yields:
+        DataFrame: je Block höchstens chunk_size Zeilen
+    """
+    if path.endswith(".parquet"):
+        _, parquet = _require_pyarrow()
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=chunk_size, usecols=columns) as reader:
+            yield from reader
+
+
+def read_results(path, where=None, columns=None, chunk_size=100_000):
+    """
+    Liest nur die passenden Zeilen einer Tabelle (Filter wird je Block angewendet).
+
+    Args:
+        path (str): Datei von ResultWriter
+        where (dict | callable, optional): {Spalte: Wert oder Liste von Werten} oder
+            Funktion DataFrame -> boolesche Maske
+        columns (list, optional): nur diese Spalten laden (Filterspalten müssen enthalten sein)
+        chunk_size (int): Zeilen je gelesenem Block
+
+    Returns:
+        DataFrame: gefilterte Zeilen
+    """
+    frames = []
+    for chunk in iter_results(path, chunk_size, columns):
+        if callable(where):
+            chunk = chunk[where(chunk)]
+        elif where:
+            mask = pd.Series(True, index=chunk.index)
+            for column, value in where.items():
+                values = value if isinstance(value, (list, tuple, set, range)) else [value]
+                mask &= chunk[column].isin(values)
+            chunk = chunk[mask]
+        frames.append(chunk)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+
+from DispatchScheduler import make_dispatch_scheduler
+from PlanIO import load_plan
+from ProductionDaySimulation import ProductionDaySimulation, get_jssp_from_schedule
+
+
+# --- Tagesweise Zugänge ---
+
+def arrivals_from_plan(df_plan_archive, day_column="Day-ID"):
+    """
+    Liefert je Tag die neuen Jobs als JSSP-Dict {job: [[machine, duration], ...]},
+    z. B. aus einem mehrtägigen Planarchiv mit 'Day-ID'-Spalte. Tage ohne Zugänge liefern {}.
+    """
+    days = df_plan_archive[day_column]
+    for day in range(int(days.min()), int(days.max()) + 1):
+        df_day = df_plan_archive[days == day].sort_values(["Job", "Start"])
+        yield get_jssp_from_schedule(df_day) if len(df_day) else {}
+
+
+def combine_jssp(carry_over, arrivals):
+    """Übertrag zuerst, danach die neuen Jobs (gleiche Job-Ids werden hinten angehängt)."""
+    combined = {job: list(operations) for job, operations in carry_over.items()}
+    for job, operations in arrivals.items():
+        combined.setdefault(job, []).extend(operations)
+    return combined
+
+
+# --- Mehrtägige Simulation ---
+
+def run_rolling_horizon(arrivals, scheduler=None, vc=0.2, seed=None, until=1440, engine="fast",
+                        initial_plan=None, out_dir=None, first_day=None):
+    """
+    Generator für eine rollierende Mehrtagessimulation. Je Tag:
+    1. Übertrag (df_undone des Vortags) und neue Jobs zu einem JSSP zusammenführen
+    2. über scheduler(jssp, day) einen Tagesplan erzeugen
+    3. den Tag mit ProductionDaySimulation simulieren
+
+    Der Speicherbedarf bleibt unabhängig von der Anzahl Tage konstant: es wird nur der
+    Übertrag aufbewahrt, abgeschlossene Tage werden (optional) an CSV-Dateien angehängt.
+
+    Args:
+        arrivals (iterable): je Tag ein JSSP-Dict der neuen Jobs (bestimmt die Anzahl Tage)
+        scheduler (callable, optional): scheduler(jssp, day) -> DataFrame mit 'Job', 'Machine', 'Start', 'Duration', 'End'
+            (Standard: Giffler-Thompson mit SPT-Regel, siehe DispatchScheduler)
+        vc (float): Variationskoeffizient für Lognormalverteilung
+        seed (int, optional): Basis-Seed, je Tag wird ein unabhängiger Zufallsstrom abgeleitet
+        until (float): Simulationsende je Tag in Minuten
+        engine (str): "fast" oder "simpy"
+        initial_plan (DataFrame, optional): fertiger Plan für den ersten Tag (ohne Neuplanung)
+        out_dir (str, optional): Verzeichnis für plan.csv, execution.csv und undone.csv (mit 'Day-ID')
+        first_day (int, optional): Day-ID des ersten Tags (Standard: 'Day-ID' aus initial_plan, sonst 0),
+            die folgenden Tage werden fortlaufend nummeriert
+
+    Yields:
+        (int, DataFrame, DataFrame, DataFrame): Tag, df_plan, df_execution, df_undone
+    """
+    if scheduler is None:
+        scheduler = make_dispatch_scheduler("SPT")
+    seed_sequence = np.random.SeedSequence(seed)
+    carry_over = {}
+
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    if first_day is None:
+        first_day = _plan_day(initial_plan) if initial_plan is not None else 0
+
+    for index, new_jobs in enumerate(arrivals):
+        day = int(first_day) + index
+        if index == 0 and initial_plan is not None:
+            df_plan = initial_plan
+        else:
+            df_plan = scheduler(combine_jssp(carry_over, new_jobs or {}), day)
+
+        rng = np.random.default_rng(seed_sequence.spawn(1)[0])
+        simulation = ProductionDaySimulation(df_plan, vc=vc, seed=rng, engine=engine, sinks=[])
+        df_execution, df_undone = simulation.run(until=until)
+
+        carry_over = get_jssp_from_schedule(df_undone, duration_column="Planned Duration")
+
+        if out_dir is not None:
+            plan_columns = ["Job", "Machine", "Start", "Duration", "End"]
+            for name, dframe in (("plan", df_plan[plan_columns]), ("execution", df_execution), ("undone", df_undone)):
+                _append_csv(os.path.join(out_dir, f"{name}.csv"), dframe, day, first=index == 0)
+
+        yield day, df_plan, df_execution, df_undone
+
+
+def _plan_day(df_plan, day_column="Day-ID"):
+    """Day-ID eines Tagesplans (0, wenn der Plan keine hat); mehrere Tage in einem Plan -> ValueError."""
+    if day_column not in df_plan.columns or df_plan[day_column].isna().all():
+        return 0
+    days = df_plan[day_column].dropna().unique()
+    if len(days) > 1:
+        raise ValueError(f"initial_plan enthält mehrere Tage ({day_column}: {sorted(days.tolist())})")
+    return int(days[0])
+
+
+def _append_csv(path, dframe, day, first):
+    # Am ersten Tag wird die Datei neu angelegt, danach nur noch angehängt
+    dframe = dframe.assign(**{"Day-ID": day})
+    dframe.to_csv(path, mode="w" if first else "a", header=first, index=False)
+
+
+if __name__ == "__main__":
+    df_plan_archive = load_plan("data/04_schedule_plan_firstday.csv")
+
+    # Tag 0 mit dem vorhandenen Plan, danach nur noch der Übertrag (keine neuen Jobs)
+    day_arrivals = [{}] * 5
+    for day, df_plan, df_execution, df_undone in run_rolling_horizon(
+            day_arrivals, vc=0.25, seed=42, initial_plan=df_plan_archive):
+        print(f"Tag {day}: {len(df_plan)} geplant, {len(df_execution)} ausgeführt, {len(df_undone)} offen")
@@ -0,0 +1,136 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# Klassengrenzen (Minuten) des Wartezeit-Histogramms
+WAIT_BINS = (0, 1, 5, 15, 30, 60, 120, 240, np.inf)
+
+
+class SimulationMetrics:
+    """
+    Optionale Messwerte eines Simulationslaufs (ProductionDaySimulation(..., metrics=SimulationMetrics())):
+    - verarbeitete Kernel-Ereignisse (SimPy-Events bzw. Heap-Einträge der FastEngine)
+    - je Maschine: Anfragen, Warteschlangenlänge (zeitgewichtet, Maximum, Histogramm bei Ankunft),
+      Wartezeiten (Histogramm), Belegt-/Leerlaufzeit
+    - abgebrochene Jobs
+    - Wandzeit der Phasen setup, run und postprocess
+
+    Ohne Metrics-Objekt (Standard) rufen die Engines keine dieser Methoden auf.
+    """
+
+    def __init__(self, wait_bins=WAIT_BINS):
+        self.wait_bins = np.asarray(wait_bins, dtype=float)
+        self.phase_seconds = {}
+        self.reset()
+
+    def reset(self, machine_names=()):
+        """Setzt alle Zähler zurück (zu Beginn jedes Laufs)."""
+        self.events = 0
+        self.until = None
+        self.aborted = []  # (time, job_id, machine_name)
+
+        self.requests = defaultdict(int)
+        self.queue_length = defaultdict(int)
+        self.queue_area = defaultdict(float)  # Integral der Warteschlangenlänge über die Zeit
+        self.queue_changed = defaultdict(float)
+        self.queue_max = defaultdict(int)
+        self.queue_seen = defaultdict(list)  # Warteschlangenlänge, die ein ankommender Job vorfindet
+        self.wait_times = defaultdict(list)
+        self.busy_time = defaultdict(float)
+        self.busy_since = {}
+
+        self._requested = {}  # job_id -> Zeitpunkt der Anfrage
+        for machine_name in machine_names:
+            self.requests[machine_name] = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Misst die Wandzeit eines Abschnitts (mehrfache Aufrufe werden aufsummiert)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - start
+
+    # Hooks der Engines ---------------------------------------------------------------
+    def _queue_change(self, machine_name, time_stamp, delta):
+        length = self.queue_length[machine_name]
+        self.queue_area[machine_name] += length * (time_stamp - self.queue_changed[machine_name])
+        self.queue_changed[machine_name] = time_stamp
+        self.queue_length[machine_name] = length + delta
+
+    def request(self, time_stamp, job_id, machine_name):
+        """Job stellt sich an der Maschine an."""
+        self.requests[machine_name] += 1
+        self.queue_seen[machine_name].append(self.queue_length[machine_name])
+        self._queue_change(machine_name, time_stamp, 1)
+        self.queue_max[machine_name] = max(self.queue_max[machine_name], self.queue_length[machine_name])
+        self._requested[job_id] = time_stamp
+
+    def grant(self, time_stamp, job_id, machine_name):
+        """Job erhält die Maschine (danach Start oder Abbruch)."""
+        self._queue_change(machine_name, time_stamp, -1)
+        self.wait_times[machine_name].append(time_stamp - self._requested.pop(job_id))
+
+    def start(self, time_stamp, job_id, machine_name):
+        self.busy_since[machine_name] = time_stamp
+
+    def finish(self, time_stamp, job_id, machine_name):
+        self.busy_time[machine_name] += time_stamp - self.busy_since.pop(machine_name)
+
+    def abort(self, time_stamp, job_id, machine_name):
+        self.aborted.append((time_stamp, job_id, machine_name))
+
+    def close(self, until, events):
+        """Schließt offene Belegungen und Warteschlangen zum Simulationsende ab."""
+        self.until = until
+        self.events = events
+        for machine_name, since in self.busy_since.items():
+            self.busy_time[machine_name] += until - since
+        self.busy_since = {}
+        for machine_name in list(self.queue_length):
+            self._queue_change(machine_name, until, 0)
+
+    # Auswertung ----------------------------------------------------------------------
+    def to_dataframe(self):
+        """Eine Zeile je Maschine, sortiert nach mittlerer Wartezeit (Engpässe zuerst)."""
+        aborted = pd.Series([machine for _, _, machine in self.aborted], dtype=object).value_counts()
+        rows = []
+        for machine_name in self.requests:
+            waits = np.asarray(self.wait_times[machine_name])
+            busy = self.busy_time[machine_name]
+            rows.append({
+                "Machine": machine_name,
+                "Requests": self.requests[machine_name],
+                "Mean Wait": waits.mean() if len(waits) else 0.0,
+                "Max Wait": waits.max() if len(waits) else 0.0,
+                "Mean Queue": self.queue_area[machine_name] / self.until if self.until else 0.0,
+                "Max Queue": self.queue_max[machine_name],
+                "Busy": busy,
+                "Idle": self.until - busy if self.until is not None else np.nan,
+                "Utilization": busy / self.until if self.until else np.nan,
+                "Aborted": int(aborted.get(machine_name, 0)),
+            })
+        columns = ["Machine", "Requests", "Mean Wait", "Max Wait", "Mean Queue", "Max Queue",
+                   "Busy", "Idle", "Utilization", "Aborted"]
+        dframe = pd.DataFrame(rows, columns=columns)
+        return dframe.sort_values("Mean Wait", ascending=False, kind="stable").reset_index(drop=True)
+
+    def to_dict(self):
+        machines = {}
+        for row in self.to_dataframe().to_dict("records"):
+            machine_name = row.pop("Machine")
+            row["Wait Histogram"] = np.histogram(self.wait_times[machine_name], bins=self.wait_bins)[0].tolist()
+            row["Queue Histogram"] = np.bincount(np.asarray(self.queue_seen[machine_name], dtype=np.int64)).tolist()
+            machines[machine_name] = row
+        return {
+            "until": self.until,
+            "events": self.events,
+            "aborted_jobs": len(self.aborted),
+            "phases": dict(self.phase_seconds),
+            "wait_bins": self.wait_bins.tolist(),
+            "machines": machines,
+        }
@@ -0,0 +1,109 @@
+import copy
+import numpy as np
+
+from OperationStore import PLANNED
+from WorkerPool import map_in_pool, worker_state
+
+
+class SimulationSnapshot:
+    """
+    Zustand einer ProductionDaySimulation (engine="fast") zu einem Zeitpunkt t:
+    Maschinenbelegung, Warteschlangen, laufende Operationen, Fortschritt je Job,
+    bisherige Ergebnisse (OperationStore) und Zustand des Zufallsstroms.
+
+    fork() erzeugt daraus eine eigenständige Simulation, die nur noch den Rest des
+    Tages rechnet. Ohne Eingriffe liefert ein Fork exakt das Ergebnis des
+    ungestörten Laufs.
+    """
+
+    def __init__(self, simulation, time_stamp):
+        """
+        Args:
+            simulation (ProductionDaySimulation): bis time_stamp gelaufene Simulation (siehe snapshot_at)
+            time_stamp (float): Zeitpunkt des Snapshots in Minuten
+        """
+        self.time = time_stamp
+        self.until = simulation.until
+        self.simulation_class = type(simulation)
+        self.dframe_schedule_plan = simulation.dframe_schedule_plan
+        self.vc = simulation.vc
+        self.sampler = simulation.sampler
+        self.discipline = simulation.discipline
+        self.prune = simulation.prune
+        self.bit_generator = type(simulation.rng.bit_generator)
+        self.rng_state = copy.deepcopy(simulation.rng.bit_generator.state)
+        self.store = simulation.store.copy()
+        self.engine_state = simulation.fast_engine.state()
+
+    def running_operations(self):
+        """{(job_id, machine_name): Start} der zum Snapshot laufenden Operationen."""
+        return self.store.running_operations()
+
+    def fork(self, seed=None, block_machine=None, prioritise_job=None, sinks=None):
+        """
+        Erzeugt eine Fortsetzung ab dem Snapshot, die mit resume() zu Ende gerechnet wird.
+
+        Args:
+            seed (int, optional): neue Dauern für alle noch nicht begonnenen Operationen ziehen
+                (None -> bisherige Dauern, d. h. gleiche Zufallszahlen wie der ungestörte Lauf)
+            block_machine (tuple | list, optional): (machine, start, end) oder Liste davon, Ausfall im Zeitraum [start, end)
+            prioritise_job (str | list, optional): Job(s), die sich ab jetzt in Warteschlangen vorne einreihen
+            sinks (list, optional): Empfänger der Ereignisse (Standard: keine Ausgabe)
+
+        Returns:
+            ProductionDaySimulation: angehaltene Simulation, Ergebnis über resume()
+        """
+        from FastEngine import FastEngine
+
+        simulation = self.simulation_class(self.dframe_schedule_plan, vc=self.vc, engine="fast",
+                                           sampler=self.sampler, sinks=[] if sinks is None else sinks,
+                                           discipline=self.discipline, prune=self.prune)
+        simulation.until = self.until
+        simulation.rng = np.random.Generator(self.bit_generator())
+        simulation.rng.bit_generator.state = copy.deepcopy(self.rng_state)
+
+        store = self.store.copy()
+        if seed is not None:
+            simulation.rng = np.random.default_rng(seed)
+            planned = store.status == PLANNED
+            store.sim_duration[planned] = simulation.sample_durations()[planned]
+        simulation.store = store
+        simulation._init_queue_keys()
+        simulation._init_pruning()
+
+        engine = FastEngine(simulation, store.routes())
+        engine.restore(self.engine_state)
+        if block_machine is not None:
+            for machine_name, start, end in _as_list(block_machine, tuple):
+                engine.block_machine(machine_name, start, end)
+        if prioritise_job is not None:
+            for job_id in _as_list(prioritise_job, str):
+                engine.prioritise_job(job_id)
+        simulation.fast_engine = engine
+        simulation.started = True
+        return simulation
+
+
+def _as_list(value, single_type):
+    return [value] if isinstance(value, single_type) else list(value)
+
+
+# --- Mehrere Forks parallel ---
+
+def _run_fork(scenario):
+    return worker_state()["snapshot"].fork(**scenario).resume()
+
+
+def run_forks(snapshot, scenarios, workers=None):
+    """
+    Rechnet mehrere Fortsetzungen eines Snapshots, bei Bedarf parallel in einem Prozess-Pool.
+
+    Args:
+        snapshot (SimulationSnapshot): Ausgangszustand
+        scenarios (list): je Fork ein dict mit Argumenten für SimulationSnapshot.fork
+        workers (int, optional): Anzahl Prozesse (None -> alle Kerne, 1 -> ohne Pool)
+
+    Returns:
+        list: [(df_execution, df_undone), ...] in der Reihenfolge der Szenarien
+    """
+    return list(map_in_pool(_run_fork, scenarios, {"snapshot": snapshot}, workers))
@@ -0,0 +1,41 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Gemeinsame Daten des laufenden Prozesses (z. B. Plan, Parameter), gesetzt von _init_worker
+_worker_state = {}
+
+
+def _init_worker(state):
+    """Gemeinsame Daten einmal pro Prozess übergeben statt einmal pro Auftrag."""
+    _worker_state.clear()
+    _worker_state.update(state)
+
+
+def worker_state():
+    """Die mit map_in_pool übergebenen gemeinsamen Daten (im Worker-Prozess bzw. ohne Pool im eigenen Prozess)."""
+    return _worker_state
+
+
+def map_in_pool(function, tasks, state, workers=None, chunksize=1):
+    """
+    Wendet function auf alle Aufträge an, bei Bedarf parallel in einem Prozess-Pool.
+    function ist eine Funktion auf Modulebene und liest die gemeinsamen Daten über worker_state().
+
+    Args:
+        function (callable): Auftrag -> Ergebnis
+        tasks (iterable): Aufträge (klein halten, werden je Auftrag übertragen)
+        state (dict): gemeinsame Daten, einmal pro Prozess übertragen
+        workers (int, optional): Anzahl Prozesse (None -> alle Kerne, 1 -> ohne Pool)
+        chunksize (int): Aufträge je Übertragung an einen Prozess
+
+    Yields:
+        Ergebnisse in der Reihenfolge der Aufträge (sobald verfügbar)
+    """
+    if workers == 1:
+        _init_worker(state)
+        yield from map(function, tasks)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as executor:
+        yield from executor.map(function, tasks, chunksize=chunksize)
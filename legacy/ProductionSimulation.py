@@ -17,17 +17,13 @@ def duration_lognormal(duration, vc=0.2):
     result = random.lognormvariate(mu, sigma)
     return round(result, 2)
 
-df = pd.read_csv("../data/schedule.csv")
-
-simulated_log = []
-
 class Machine(simpy.Resource):
     def __init__(self, env, name):
         super().__init__(env, capacity=1)
         self.name = name
 
 
-def job_process(env, job_id, job_operations, machines, until=None):
+def job_process(env, job_id, job_operations, machines, simulated_log, until=None):
     for op in job_operations:
         machine = machines[op["Machine"]]
         start_time = op["Start"]
@@ -56,7 +52,9 @@ def job_process(env, job_id, job_operations, machines, until=None):
                                })
 
 def run_simulation_from_df(df, until=None):
+    """Simuliert den Plan und liefert die ausgeführten Operationen als Liste von dicts."""
     env = simpy.Environment()
+    simulated_log = []
 
     # Alle Maschinen extrahieren
     unique_machines = df["Machine"].unique()
@@ -68,7 +66,7 @@ def run_simulation_from_df(df, until=None):
     # Für jeden Job ein Prozess starten
     for job_id, group in jobs_grouped:
         operations = group.to_dict("records")
-        env.process(job_process(env, job_id, operations, machines, until=until))
+        env.process(job_process(env, job_id, operations, machines, simulated_log, until=until))
 
 
     # Simulation starten – entweder unbegrenzt oder bis 'until'
@@ -76,6 +74,7 @@ def run_simulation_from_df(df, until=None):
         env.run(until=until)
     else:
         env.run()
+    return simulated_log
 
 
 def skip_if_too_late(job_id, machine_name, sim_start, planned_duration, until):
@@ -91,7 +90,9 @@ def skip_if_too_late(job_id, machine_name, sim_start, planned_duration, until):
 
 
 if __name__ == "__main__":
-    run_simulation_from_df(df, 1440)
+    # Eigenständig lauffähig (aus legacy/ gestartet), daher ohne PlanIO: Spaltentypen wie load_plan
+    df = pd.read_csv("../data/schedule.csv", dtype={"Job": str, "Machine": str, "Start": float, "End": float})
+    simulated_log = run_simulation_from_df(df, 1440)
 
     # Simulations-DataFrame erzeugen
     df_simulated = pd.DataFrame(simulated_log)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Module liegen im Wurzelverzeichnis des Repositories (kein Paket)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DATA_DIR = os.path.join(ROOT, "data")
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from DispatchScheduler import RULES, dispatch_schedule
+from InstanceGenerator import generate_jssp
+from PlanValidator import validate_plan
+
+# Zwei Jobs auf zwei Maschinen, von Hand durchgerechnet:
+# J1 belegt M0 [0, 3]; danach konkurrieren J1 (M1, 2 min, ab 3) und J2 (M1, 4 min, ab 0) um M1
+TINY = {"J1": [[0, 3], [1, 2]], "J2": [[1, 4], [0, 1]]}
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_every_rule_gives_valid_plan(rule):
+    jssp = generate_jssp(30, 8, seed=4)
+    due_dates = {job: 50 * idx for idx, job in enumerate(jssp)} if rule == "EDD" else None
+    df_plan = dispatch_schedule(jssp, rule=rule, due_dates=due_dates)
+
+    assert len(df_plan) == 30 * 8
+    assert all(rows.empty for rows in validate_plan(df_plan).values())
+    # Jede Route in der Reihenfolge des JSSP
+    for job, operations in jssp.items():
+        machines = df_plan.loc[df_plan["Job"] == job].sort_values("Start")["Machine"].tolist()
+        assert machines == [f"M{machine}" for machine, _ in operations]
+
+
+@pytest.mark.parametrize("rule, expected", [
+    # SPT: J1 vor J2 auf M1 -> J2 auf M1 [5, 9], auf M0 [9, 10]
+    ("SPT", [("J1", "M0", 0, 3), ("J1", "M1", 3, 5), ("J2", "M1", 5, 9), ("J2", "M0", 9, 10)]),
+    # LPT: J2 vor J1 auf M1 -> J2 auf M1 [0, 4], J1 auf M1 [4, 6], J2 auf M0 [4, 5]
+    ("LPT", [("J1", "M0", 0, 3), ("J2", "M1", 0, 4), ("J1", "M1", 4, 6), ("J2", "M0", 4, 5)]),
+])
+def test_giffler_thompson_tiny_instance(rule, expected):
+    df_plan = dispatch_schedule(TINY, rule=rule)
+    rows = [(job, machine, start, end) for job, machine, start, _, end in df_plan.itertuples(index=False)]
+
+    assert sorted(rows) == sorted(expected)
+    assert df_plan["End"].max() == max(end for *_, end in expected)
+
+
+def test_start_time_and_machine_ready():
+    df_plan = dispatch_schedule(TINY, rule="SPT", start_time=100, machine_ready={1: 110})
+    starts = df_plan.set_index(["Job", "Machine"])["Start"]
+    assert starts[("J1", "M0")] == 100
+    assert starts[("J2", "M1")] >= 110
+    assert all(rows.empty for rows in validate_plan(df_plan).values())
+
+
+def test_unknown_rule_and_empty_instance():
+    with pytest.raises(ValueError):
+        dispatch_schedule(TINY, rule="RANDOM")
+    df_plan = dispatch_schedule({"J1": []})
+    assert df_plan.empty
+    assert list(df_plan.columns) == ["Job", "Machine", "Start", "Duration", "End"]
+    pd.testing.assert_frame_equal(df_plan, dispatch_schedule({}))
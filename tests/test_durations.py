@@ -0,0 +1,44 @@
+"""Ziehungsreihenfolge von draw_durations (Common Random Numbers über Planformate hinweg)."""
+import numpy as np
+import pytest
+
+from DurationSampler import LogNormalSampler, draw_durations
+from InstanceGenerator import generate_day_plan
+from PlanIO import to_typed_plan
+
+
+def _reference_draws(df_plan, sampler, rng):
+    """Ursprüngliche Ziehung: lexsort auf den Namen als Text, auf 2 Stellen gerundet."""
+    jobs = df_plan["Job"].astype(str).to_numpy()
+    machines = df_plan["Machine"].astype(str).to_numpy()
+    order = np.lexsort((machines, jobs))
+    drawn = sampler.sample(rng, df_plan["Duration"].to_numpy(dtype=float)[order], machines[order])
+    result = np.empty_like(drawn)
+    result[order] = drawn
+    return np.round(result, 2)
+
+
+@pytest.mark.parametrize("seed", [0, 7])
+def test_typed_and_string_plans_draw_identically(seed):
+    # 12 Maschinen: kategorial M2 vor M10, als Text M10 vor M2
+    df_plan = generate_day_plan(15, 12, seed=seed)
+    df_typed = to_typed_plan(df_plan)
+    assert list(df_typed["Machine"].cat.categories[:3]) == ["M0", "M1", "M2"]
+
+    sampler = LogNormalSampler(0.2)
+    from_strings = draw_durations(df_plan, sampler, np.random.default_rng(seed))
+    from_typed = draw_durations(df_typed, sampler, np.random.default_rng(seed))
+    reference = _reference_draws(df_plan, sampler, np.random.default_rng(seed))
+
+    np.testing.assert_array_equal(from_typed, from_strings)
+    np.testing.assert_array_equal(from_strings, reference)
+
+
+def test_draws_independent_of_row_order():
+    df_plan = generate_day_plan(10, 12, seed=3)
+    shuffled = df_plan.sample(frac=1, random_state=1)
+    sampler = LogNormalSampler(0.3)
+
+    drawn = draw_durations(df_plan, sampler, np.random.default_rng(5))
+    drawn_shuffled = draw_durations(shuffled, sampler, np.random.default_rng(5))
+    np.testing.assert_array_equal(drawn[shuffled.index.to_numpy()], drawn_shuffled)
@@ -0,0 +1,80 @@
+"""
+SimPy und FastEngine müssen für denselben Plan und Seed identische Ergebnisse liefern
+(df_execution, df_undone und die Ereignisfolge an den Sinks).
+
+Geprüft werden die Pläne in data/ sowie erzeugte Pläne mit vielen Gleichständen
+(ganzzahlige Dauern, vc=0 bzw. sehr kleines vc, also viele Ereignisse zum selben Zeitpunkt),
+jeweils für mehrere Simulationsenden.
+
+Zur Geschwindigkeit: gemessen ist FastEngine auf 500 Jobs x 50 Maschinen (rund 22.000 Operationen,
+82.310 Ereignisse) etwa 5- bis 7-mal schneller als SimPy (0,11-0,12 s gegen 0,62-0,75 s), nicht die
+angestrebte Größenordnung. Allein die gemeinsame Vorbereitung (Dauern ziehen, OperationStore, Routen)
+kostet rund 20 ms, die Heap-Operationen für Ankünfte und Fertigstellungen weitere rund 40 ms.
+"""
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from EventSink import RingBufferSink
+from InstanceGenerator import generate_day_plan
+from ProductionDaySimulation import ProductionDaySimulation
+
+UNTIL_VALUES = [None, 120, 480, 1440]
+DATA_PLANS = sorted(glob.glob(os.path.join(DATA_DIR, "*.csv")))
+
+
+def _run(df_plan, engine, until, **kwargs):
+    sink = RingBufferSink(capacity=None)
+    simulation = ProductionDaySimulation(df_plan, engine=engine, sinks=[sink], **kwargs)
+    df_execution, df_undone = simulation.run(until=until)
+    return df_execution, df_undone, sink.records()
+
+
+def _assert_same_results(df_plan, until, **kwargs):
+    execution_simpy, undone_simpy, events_simpy = _run(df_plan, "simpy", until, **kwargs)
+    execution_fast, undone_fast, events_fast = _run(df_plan, "fast", until, **kwargs)
+
+    pd.testing.assert_frame_equal(execution_fast, execution_simpy)
+    pd.testing.assert_frame_equal(undone_fast, undone_simpy)
+    assert events_fast == events_simpy
+
+
+@pytest.mark.parametrize("until", UNTIL_VALUES)
+@pytest.mark.parametrize("path", DATA_PLANS, ids=os.path.basename)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_data_plans(path, until, seed):
+    _assert_same_results(pd.read_csv(path), until, vc=0.3, seed=seed)
+
+
+@pytest.mark.parametrize("until", UNTIL_VALUES)
+@pytest.mark.parametrize("vc", [0.0, 0.01])
+@pytest.mark.parametrize("n_jobs, n_machines, seed", [(30, 5, 0), (60, 10, 1), (120, 12, 2)])
+def test_tie_heavy_plans(n_jobs, n_machines, seed, vc, until):
+    # Hohe Auslastung: viele Jobs warten gleichzeitig an denselben Maschinen
+    df_plan = generate_day_plan(n_jobs, n_machines, utilization=0.95, seed=seed, resolution=1)
+    _assert_same_results(df_plan, until, vc=vc, seed=seed)
+
+
+@pytest.mark.parametrize("until", [None, 480])
+@pytest.mark.parametrize("discipline", ["PlannedStart", "SPT", "EDD", "CR"])
+def test_tie_heavy_plans_with_discipline(discipline, until):
+    df_plan = generate_day_plan(60, 10, utilization=0.95, seed=4, resolution=1)
+    _assert_same_results(df_plan, until, vc=0.0, seed=4, discipline=discipline)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_events_after_empty_heap(n_jobs):
+    # Zwischendurch leerer Heap: das nächste Ereignis darf erst zu seinem Zeitpunkt verarbeitet werden
+    df_plan = pd.DataFrame({
+        "Job": [f"J{idx}" for idx in range(n_jobs) for _ in range(2)],
+        "Machine": ["M1", "M2"] * n_jobs,
+        "Start": [start for idx in range(n_jobs) for start in (10.0 + 50 * idx, 30.0 + 50 * idx)],
+        "Duration": [5, 7] * n_jobs,
+    })
+    df_plan["End"] = df_plan["Start"] + df_plan["Duration"]
+    _assert_same_results(df_plan, None, vc=0.0, seed=0)
+    execution, _, _ = _run(df_plan, "fast", None, vc=0.0, seed=0)
+    pd.testing.assert_series_equal(execution["End"], execution["Start"] + execution["Duration"], check_names=False)
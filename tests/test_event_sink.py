@@ -0,0 +1,55 @@
+"""Ereignis-Empfänger: Kapazität des RingBufferSink und Ausgabe des FileSink (JSONL und CSV)."""
+import json
+
+import pandas as pd
+import pytest
+
+from EventSink import FINISHED, INTERRUPTED, RECORD_FIELDS, STARTED, FileSink, RingBufferSink
+
+
+def _emit(sink, n):
+    for i in range(n):
+        sink.job_started(float(i), f"J{i}", "M1")
+        sink.job_finished(i + 0.5, f"J{i}", "M1", 0.5)
+    sink.job_interrupted(float(n), f"J{n}", "M2", n + 10.0)
+
+
+def test_ring_buffer_keeps_last_events():
+    sink = RingBufferSink(capacity=3)
+    _emit(sink, 5)
+
+    assert sink.records() == [
+        (STARTED, 4.0, "J4", "M1", None),
+        (FINISHED, 4.5, "J4", "M1", 0.5),
+        (INTERRUPTED, 5.0, "J5", "M2", 15.0),
+    ]
+    df_events = sink.to_dataframe()
+    assert list(df_events.columns) == list(RECORD_FIELDS)
+    assert len(df_events) == 3
+
+
+@pytest.mark.parametrize("file_format", ["jsonl", "csv"])
+def test_file_sink_writes_all_events(tmp_path, file_format):
+    path = tmp_path / f"events.{file_format}"
+    # buffer_size kleiner als die Ereigniszahl: mehrfaches Leeren darf nichts verlieren
+    with FileSink(str(path), file_format=file_format, buffer_size=4) as sink:
+        _emit(sink, 5)
+
+    if file_format == "jsonl":
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        df_events = pd.DataFrame(records, columns=list(RECORD_FIELDS))
+    else:
+        df_events = pd.read_csv(path)
+
+    assert list(df_events.columns) == list(RECORD_FIELDS)
+    assert len(df_events) == 11
+    assert df_events["Event"].tolist() == [STARTED, FINISHED] * 5 + [INTERRUPTED]
+    assert df_events["Job"].iloc[-1] == "J5"
+    assert df_events["Value"].iloc[1] == 0.5
+    assert pd.isna(df_events["Value"].iloc[0])
+    assert df_events["Value"].iloc[-1] == 15.0
+
+
+def test_file_sink_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        FileSink(str(tmp_path / "events.txt"), file_format="txt")
@@ -0,0 +1,125 @@
+"""
+Sichtfenster-Abfragen des GanttCanvas: visible_entries muss alle Operationen liefern, die das
+sichtbare Zeitfenster überlappen, auch noch laufende, die vor dem Fenster begonnen haben.
+
+Ohne Display werden die Zeichenaufrufe von tk.Canvas durch Platzhalter ersetzt; geprüft wird
+nur der Intervall-Index, nicht die Darstellung.
+"""
+import itertools
+import tkinter as tk
+
+import pandas as pd
+import pytest
+
+from GUI.GanttCanvas import END, JOB, TIMEOUT, GanttCanvas
+from GUI.Operation import Operation
+from Job import Job
+
+
+@pytest.fixture
+def canvas(monkeypatch):
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        root = None
+        item_ids = itertools.count(1)
+        monkeypatch.setattr(tk.Canvas, "__init__", lambda self, *args, **kwargs: None)
+        for name in ("create_line", "create_text", "create_rectangle", "delete", "itemconfig", "bind"):
+            monkeypatch.setattr(tk.Canvas, name, lambda self, *args, **kwargs: next(item_ids))
+        monkeypatch.setattr(tk.Canvas, "after_idle", lambda self, func: func())
+    gantt = GanttCanvas(root)
+    gantt.setup_machines(["M1", "M2"])
+    yield gantt
+    if root is not None:
+        root.destroy()
+
+
+def _jobs(gantt, machine_name):
+    return [entry[JOB] for entry in gantt.visible_entries(machine_name)]
+
+
+def _start(gantt, job_id, machine_name, start_time):
+    gantt.add_operation(Operation(Job(job_id, 0), machine_name, start_time, 0))
+
+
+def test_live_view_culls_by_overlap(canvas):
+    _start(canvas, "J1", "M1", 100)
+    canvas.finish_operation("J1", "M1", 150, "blue")
+    _start(canvas, "J2", "M1", 300)
+    canvas.finish_operation("J2", "M1", 320, "blue")
+    _start(canvas, "J3", "M1", 500)
+    canvas.finish_operation("J3", "M1", 700, "blue")
+
+    canvas.set_view(600, 700)
+    assert _jobs(canvas, "M1") == ["J3"]
+    canvas.set_view(140, 310)
+    assert _jobs(canvas, "M1") == ["J1", "J2"]
+    assert _jobs(canvas, "M2") == []
+
+
+def test_live_running_operation_started_before_view(canvas):
+    # Läuft seit 550 und ist zur aktuellen Minute 650 noch nicht fertig
+    _start(canvas, "J1", "M1", 550)
+    _start(canvas, "J2", "M2", 640)
+    canvas.finish_operation("J2", "M2", 650, "blue")
+
+    canvas.set_view(600, 700)
+    assert _jobs(canvas, "M1") == ["J1"]
+    canvas.set_view(660, 760)
+    assert _jobs(canvas, "M1") == []
+
+    canvas.finish_operation("J1", "M1", 800, "blue")
+    assert _jobs(canvas, "M1") == ["J1"]
+    assert canvas.running["M1"] == []
+
+
+def _load(gantt):
+    df_execution = pd.DataFrame({
+        "Job": ["J1", "J2", "J3", "J1"],
+        "Machine": ["M1", "M1", "M2", "M2"],
+        "Start": [550.0, 900.0, 100.0, 820.0],
+        "End": [800.0, 950.0, 200.0, 850.0],
+    })
+    df_undone = pd.DataFrame({
+        "Job": ["J3", "J2"],
+        "Machine": ["M1", "M2"],
+        "Planned Duration": [60, 30],
+        "Start": [1000.0, float("nan")],
+    })
+    gantt.load_results(df_execution, df_undone)
+
+
+def test_load_results(canvas):
+    _load(canvas)
+    assert canvas.starts == {"M1": [550.0, 900.0, 1000.0], "M2": [100.0, 820.0]}
+    assert canvas.max_duration == {"M1": 440.0, "M2": 100.0}
+    # Begonnene, nicht fertige Operation endet schraffiert bei total_minutes
+    entry = canvas.operations[("J3", "M1")]
+    assert (entry[END], entry[TIMEOUT]) == (1440.0, True)
+    assert ("J2", "M2") not in canvas.operations
+    assert canvas.current_time == 1440.0
+
+
+def test_replay_running_operation_started_before_view(canvas):
+    _load(canvas)
+    canvas.set_view(600, 700)
+    canvas.set_replay_time(650)
+    assert _jobs(canvas, "M1") == ["J1"]
+    canvas.set_replay_time(560)
+    assert _jobs(canvas, "M1") == []
+    canvas.set_replay_time(None)
+    assert _jobs(canvas, "M1") == ["J1"]
+
+    canvas.set_view(1100, 1200)
+    canvas.set_replay_time(1150)
+    assert _jobs(canvas, "M1") == ["J3"]
+    assert _jobs(canvas, "M2") == []
+
+
+def test_replay_counts(canvas):
+    _load(canvas)
+    assert canvas.replay_counts(0) == (0, 0)
+    assert canvas.replay_counts(150) == (1, 0)
+    assert canvas.replay_counts(650) == (1, 1)
+    assert canvas.replay_counts(800) == (0, 2)
+    assert canvas.replay_counts(1200) == (1, 4)
@@ -0,0 +1,81 @@
+"""
+IncrementalSimulation muss nach jeder Planänderung dasselbe Ergebnis liefern wie ein
+vollständiger Lauf des geänderten Plans mit demselben Seed (df_execution und df_undone),
+für alle Warteschlangen-Regeln und Abbruchschranken.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from IncrementalSimulation import IncrementalSimulation
+from InstanceGenerator import generate_day_plan
+from ProductionDaySimulation import ProductionDaySimulation
+
+SEED = 11
+
+
+def _full_run(df_plan, **kwargs):
+    simulation = ProductionDaySimulation(df_plan, seed=SEED, engine="fast", sinks=[], **kwargs)
+    return simulation.run(until=1440)
+
+
+def _edit(df_plan, rng, step):
+    """Zufällige Planänderung: Verschieben, Dauer ändern, Operation entfernen oder Zeilen mischen."""
+    df_new = df_plan.copy()
+    idx = df_new.index[rng.integers(len(df_new))]
+    kind = step % 4
+    if kind == 0:
+        df_new.loc[idx, ["Start", "End"]] += int(rng.integers(-30, 30))
+    elif kind == 1:
+        df_new.loc[idx, "Duration"] = max(1, int(df_new.loc[idx, "Duration"]) + int(rng.integers(-5, 10)))
+        df_new["End"] = df_new["Start"] + df_new["Duration"]
+    elif kind == 2:
+        df_new = df_new.drop(index=idx)
+    else:
+        df_new = df_new.sample(frac=1, random_state=step)
+        df_new.loc[df_new.index[0], ["Start", "End"]] += 10
+    return df_new
+
+
+@pytest.mark.parametrize("prune", [None, "route", "machine"])
+@pytest.mark.parametrize("discipline", [None, "PlannedStart", "SPT", "EDD", "CR"])
+def test_updates_match_full_run(discipline, prune):
+    df_plan = generate_day_plan(40, 8, utilization=0.9, seed=3)
+    incremental = IncrementalSimulation(df_plan, seed=SEED, discipline=discipline, prune=prune)
+    rng = np.random.default_rng(0)
+    for step in range(12):
+        df_plan = _edit(df_plan, rng, step)
+        df_execution, df_undone = incremental.update(df_plan)
+        expected_execution, expected_undone = _full_run(df_plan, discipline=discipline, prune=prune)
+        pd.testing.assert_frame_equal(df_execution, expected_execution)
+        pd.testing.assert_frame_equal(df_undone, expected_undone)
+
+
+def test_edit_recomputes_cone_only():
+    # 60 Jobs mit je 6 Operationen; je zwei Jobs teilen sich ihre Maschinen
+    df_plan = pd.DataFrame({
+        "Job": [f"J{job}" for job in range(60) for _ in range(6)],
+        "Machine": [f"M{job // 2}_{step}" for job in range(60) for step in range(6)],
+        "Start": [200.0 * step + 30 * (job % 2) for job in range(60) for step in range(6)],
+        "Duration": [25] * 360,
+    })
+    df_plan["End"] = df_plan["Start"] + df_plan["Duration"]
+    incremental = IncrementalSimulation(df_plan, seed=SEED)
+
+    df_new = df_plan.copy()
+    df_new.loc[(df_new["Job"] == "J0") & (df_new["Start"] == 600), "Duration"] = 40
+    df_new["End"] = df_new["Start"] + df_new["Duration"]
+    df_execution, df_undone = incremental.update(df_new)
+
+    assert incremental.restart_time > 0
+    assert incremental.recomputed_jobs <= 2
+    expected_execution, expected_undone = _full_run(df_new)
+    pd.testing.assert_frame_equal(df_execution, expected_execution)
+    pd.testing.assert_frame_equal(df_undone, expected_undone)
+
+
+def test_duplicate_operations_rejected():
+    df_plan = pd.DataFrame({"Job": ["J1", "J1"], "Machine": ["M1", "M1"], "Start": [0.0, 60.0],
+                            "Duration": [10, 10], "End": [10.0, 70.0]})
+    with pytest.raises(ValueError):
+        IncrementalSimulation(df_plan, seed=SEED)
@@ -0,0 +1,33 @@
+import pytest
+
+from InstanceGenerator import generate_day_plan
+
+HORIZON = 1440
+
+
+@pytest.mark.parametrize("resolution", [None, 1])
+@pytest.mark.parametrize("n_jobs, n_machines, utilization", [(400, 20, 0.5), (200, 10, 0.95), (5, 20, 0.8)])
+def test_plan_ends_within_horizon(n_jobs, n_machines, utilization, resolution):
+    df_plan = generate_day_plan(n_jobs, n_machines, utilization=utilization, seed=1, resolution=resolution)
+
+    assert len(df_plan) == n_jobs * n_machines
+    assert df_plan["End"].max() <= HORIZON
+    assert (df_plan["Duration"] > 0).all()
+    if resolution is None:
+        # Gestaucht wird nur, wenn der eingeplante Plan nicht in den Horizont passt
+        assert df_plan["Duration"].sum() / (n_machines * HORIZON) <= utilization + 1e-9
+
+
+def test_utilization_achieved():
+    df_plan = generate_day_plan(400, 20, utilization=0.5, seed=1)
+    assert df_plan["Duration"].sum() / (20 * HORIZON) == pytest.approx(0.5)
+    assert df_plan["End"].max() <= HORIZON
+
+
+def test_float_durations_fit_large_plans():
+    # Ganzzahlig (mindestens 1 Minute) hätte jede Maschine 2000 Minuten Arbeit
+    with pytest.raises(ValueError):
+        generate_day_plan(2000, 5, seed=1, resolution=1)
+    df_plan = generate_day_plan(2000, 5, utilization=0.5, seed=1)
+    assert df_plan["End"].max() <= HORIZON
+    assert df_plan["Duration"].sum() / (5 * HORIZON) == pytest.approx(0.5)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from KPI import KPI_COLUMNS, compute_kpis, summarize_kpis
+
+UNTIL = 100
+
+
+@pytest.fixture
+def df_plan():
+    return pd.DataFrame({
+        "Job": ["J1", "J1", "J2", "J3"],
+        "Machine": ["M1", "M2", "M1", "M2"],
+        "Start": [0.0, 10.0, 10.0, 30.0],
+        "Duration": [10, 20, 10, 10],
+        "End": [10.0, 30.0, 20.0, 40.0],
+    })
+
+
+@pytest.fixture
+def results():
+    # Replikation 0: alles fertig; Replikation 1: J1 läuft auf M2 seit 90, J3 nie begonnen
+    df_execution = pd.DataFrame({
+        "Replication": [0, 0, 0, 0, 1, 1],
+        "Job": ["J1", "J2", "J1", "J3", "J1", "J2"],
+        "Machine": ["M1", "M1", "M2", "M2", "M1", "M1"],
+        "Start": [0.0, 12.0, 12.0, 35.0, 0.0, 10.0],
+        "Duration": [12.0, 8.0, 23.0, 15.0, 10.0, 15.0],
+        "End": [12.0, 20.0, 35.0, 50.0, 10.0, 25.0],
+    })
+    df_undone = pd.DataFrame({
+        "Replication": [1, 1],
+        "Job": ["J1", "J3"],
+        "Machine": ["M2", "M2"],
+        "Planned Duration": [20, 10],
+        "Start": [90.0, np.nan],
+    })
+    return df_execution, df_undone
+
+
+def test_kpis_match_hand_computed_values(df_plan, results):
+    df_kpis = compute_kpis(df_plan, *results, until=UNTIL)
+
+    expected = pd.DataFrame({
+        "Makespan": [50.0, 25.0],
+        "Completed Jobs": [3, 1],
+        "Unfinished Jobs": [0, 2],
+        # Fertigstellung minus geplantes Job-Ende: J1 35-30, J2 20-20, J3 50-40 bzw. J2 25-20
+        "Tardy Jobs": [2, 1],
+        "Total Tardiness": [15.0, 5.0],
+        "Mean Tardiness": [5.0, 5.0],
+        # Fertigstellung minus geplanter Job-Beginn: J1 35-0, J2 20-10, J3 50-30 bzw. J2 25-10
+        "Mean Flow Time": [65 / 3, 15.0],
+        "Mean Start Deviation": [9 / 4, 0.0],
+        "Mean Abs Start Deviation": [9 / 4, 0.0],
+        # Bearbeitete Minuten je 2 Maschinen x 100 Minuten: 12+8+23+15 bzw. 10+15 + (100-90) laufend
+        "Utilization": [58 / 200, 35 / 200],
+        "Carry-over Share": [0.0, 0.5],
+        "Carry-over Work Share": [0.0, 30 / 50],
+    }, index=pd.Index([0, 1], name="Replication"), columns=KPI_COLUMNS)
+    pd.testing.assert_frame_equal(df_kpis, expected, check_dtype=False)
+
+
+def test_single_run_without_replication_column(df_plan, results):
+    df_execution, df_undone = results
+    single = compute_kpis(df_plan, df_execution[df_execution["Replication"] == 1].drop(columns="Replication"),
+                          df_undone.drop(columns="Replication"), until=UNTIL)
+    both = compute_kpis(df_plan, df_execution, df_undone, until=UNTIL)
+    np.testing.assert_allclose(single.to_numpy(dtype=float), both.loc[[1]].to_numpy(dtype=float))
+
+
+def test_unknown_operation_rejected(df_plan, results):
+    df_execution, df_undone = results
+    with pytest.raises(ValueError):
+        compute_kpis(df_plan, df_execution.assign(Machine="M9"), df_undone, until=UNTIL)
+
+
+def test_summary(df_plan, results):
+    summary = summarize_kpis(compute_kpis(df_plan, *results, until=UNTIL))
+    assert summary.loc["Makespan", "N"] == 2
+    assert summary.loc["Makespan", "Mean"] == 37.5
+    assert summary.loc["Makespan", "CI Low"] < 37.5 < summary.loc["Makespan", "CI High"]
@@ -0,0 +1,33 @@
+"""ks_lognormal_check: Randverteilung der Ziehungen je Schema (iid, antithetisch, LHS)."""
+import numpy as np
+import pytest
+
+from DurationSampler import SCHEMES, LogNormalSampler, draw_durations, ks_lognormal_check
+from InstanceGenerator import generate_day_plan
+
+ALPHA = 0.01
+VC = 0.2
+REPLICATIONS = 40
+
+
+@pytest.fixture(scope="module")
+def df_plan():
+    # Dauern in Minuten * 100, damit die Rundung auf 2 Stellen den Test nicht verfälscht
+    df_plan = generate_day_plan(20, 10, seed=11)
+    return df_plan.assign(Duration=df_plan["Duration"] * 100)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_schemes_follow_lognormal_marginal(df_plan, scheme, seed):
+    sim = draw_durations(df_plan, LogNormalSampler(VC), np.random.default_rng(seed), size=REPLICATIONS, scheme=scheme)
+    _, p_value = ks_lognormal_check(sim, df_plan["Duration"].to_numpy(dtype=float), VC)
+    assert p_value > ALPHA
+
+
+@pytest.mark.parametrize("wrong_vc", [0.15, 0.25])
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_wrong_vc_is_rejected(df_plan, scheme, wrong_vc):
+    sim = draw_durations(df_plan, LogNormalSampler(VC), np.random.default_rng(5), size=REPLICATIONS, scheme=scheme)
+    _, p_value = ks_lognormal_check(sim, df_plan["Duration"].to_numpy(dtype=float), wrong_vc)
+    assert p_value < ALPHA
@@ -0,0 +1,65 @@
+"""
+SimulationMetrics darf die Ergebnisse nicht verändern, und seine Zähler müssen zu df_execution
+und df_undone passen (für beide Engines).
+"""
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from InstanceGenerator import generate_day_plan
+from OperationStore import INTERRUPTED, RUNNING
+from ProductionDaySimulation import ProductionDaySimulation
+from SimulationMetrics import SimulationMetrics
+
+PLANS = {os.path.basename(path): path for path in sorted(glob.glob(os.path.join(DATA_DIR, "*.csv")))}
+
+
+def _plan(name):
+    if name == "generated":
+        return generate_day_plan(60, 10, utilization=0.95, seed=2, resolution=1)
+    return pd.read_csv(PLANS[name])
+
+
+@pytest.mark.parametrize("until", [480, 1440])
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+@pytest.mark.parametrize("name", [*PLANS, "generated"])
+def test_metrics_match_results(name, engine, until):
+    df_plan = _plan(name)
+    expected_execution, expected_undone = ProductionDaySimulation(df_plan, seed=5, engine=engine, sinks=[]) \
+        .run(until=until)
+
+    metrics = SimulationMetrics()
+    simulation = ProductionDaySimulation(df_plan, seed=5, engine=engine, sinks=[], metrics=metrics)
+    df_execution, df_undone = simulation.run(until=until)
+    pd.testing.assert_frame_equal(df_execution, expected_execution)
+    pd.testing.assert_frame_equal(df_undone, expected_undone)
+
+    running = df_undone["Start"].notna()
+    interrupted = int(np.count_nonzero(simulation.store.status == INTERRUPTED))
+    assert running.sum() == np.count_nonzero(simulation.store.status == RUNNING)
+
+    # Jede Zuteilung endet fertig, läuft bis until oder wird abgebrochen; der Rest wartet noch
+    grants = sum(len(waits) for waits in metrics.wait_times.values())
+    assert grants == len(df_execution) + running.sum() + interrupted
+    assert sum(metrics.requests.values()) == grants + sum(metrics.queue_length.values())
+    assert len(metrics.aborted) == interrupted
+    assert len(df_undone) == len(df_plan) - len(df_execution)
+
+    busy = df_execution["Duration"].sum() + (until - df_undone.loc[running, "Start"]).sum()
+    assert sum(metrics.busy_time.values()) == pytest.approx(busy)
+    assert metrics.until == until
+    assert metrics.events > 0
+
+
+def test_metrics_agree_between_engines():
+    df_plan = _plan("generated")
+    summaries = []
+    for engine in ("simpy", "fast"):
+        metrics = SimulationMetrics()
+        ProductionDaySimulation(df_plan, seed=5, engine=engine, sinks=[], metrics=metrics).run(until=600)
+        summaries.append(metrics.to_dataframe())
+    pd.testing.assert_frame_equal(summaries[1], summaries[0])
@@ -0,0 +1,95 @@
+"""
+Pruning (prune="route"/"machine") gibt Jobs auf, die laut Schranke nicht mehr bis until fertig werden.
+
+Gleiche Ergebnisse wie ohne Pruning sind dabei nicht zu erwarten: die restlichen Operationen eines
+aufgegebenen Jobs belegen keine Maschinen mehr, andere Jobs rücken nach. Geprüft wird deshalb:
+- beide Engines liefern je Modus identische Ergebnisse und Ereignisse
+- prune=None entspricht dem Lauf ohne Angabe
+- aufgegebene Jobs werden auch ohne Pruning nicht fertig
+- latest_starts stimmt mit einer einfachen Rückwärtsrechnung je Route überein
+"""
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from EventSink import RingBufferSink
+from InstanceGenerator import generate_day_plan
+from OperationStore import PRUNED, OperationStore
+from ProductionDaySimulation import ProductionDaySimulation
+
+DATA_PLANS = sorted(glob.glob(os.path.join(DATA_DIR, "*.csv")))
+UNTIL_VALUES = [300, 600, 1000, 1440]
+
+
+def _run(df_plan, until, **kwargs):
+    sink = RingBufferSink(capacity=None)
+    simulation = ProductionDaySimulation(df_plan, seed=3, sinks=[sink], **kwargs)
+    df_execution, df_undone = simulation.run(until=until)
+    return simulation, df_execution, df_undone, sink.records()
+
+
+@pytest.mark.parametrize("until", UNTIL_VALUES)
+@pytest.mark.parametrize("prune", ["route", "machine"])
+@pytest.mark.parametrize("path", DATA_PLANS, ids=os.path.basename)
+def test_engines_agree_with_pruning(path, prune, until):
+    df_plan = pd.read_csv(path)
+    _, execution_simpy, undone_simpy, events_simpy = _run(df_plan, until, engine="simpy", prune=prune)
+    _, execution_fast, undone_fast, events_fast = _run(df_plan, until, engine="fast", prune=prune)
+
+    pd.testing.assert_frame_equal(execution_fast, execution_simpy)
+    pd.testing.assert_frame_equal(undone_fast, undone_simpy)
+    assert events_fast == events_simpy
+
+
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+def test_prune_none_is_default(engine):
+    df_plan = generate_day_plan(60, 10, seed=1, resolution=1)
+    _, execution, undone, events = _run(df_plan, 600, engine=engine)
+    _, execution_none, undone_none, events_none = _run(df_plan, 600, engine=engine, prune=None)
+
+    pd.testing.assert_frame_equal(execution_none, execution)
+    pd.testing.assert_frame_equal(undone_none, undone)
+    assert events_none == events
+
+
+@pytest.mark.parametrize("until", UNTIL_VALUES)
+@pytest.mark.parametrize("prune", ["route", "machine"])
+@pytest.mark.parametrize("path", DATA_PLANS, ids=os.path.basename)
+def test_pruned_jobs_do_not_finish_without_pruning(path, prune, until):
+    df_plan = pd.read_csv(path)
+    simulation, _, undone, _ = _run(df_plan, until, engine="fast", prune=prune)
+    store = simulation.store
+    pruned = set(store.jobs.take(store.job_codes[store.status == PRUNED]))
+
+    _, _, undone_unpruned, _ = _run(df_plan, until, engine="fast")
+    assert pruned <= set(undone_unpruned["Job"])
+    assert pruned <= set(undone["Job"])
+
+
+def _latest_starts_by_route(df_plan, sim_durations, until):
+    """Rückwärts je Route: L_i = min(until - p_i, L_i+1 - d_i), -inf nach einer zu spät geplanten Operation."""
+    latest = np.empty(len(df_plan))
+    for _, route in df_plan.assign(row=np.arange(len(df_plan))).groupby("Job"):
+        rows = route.sort_values("Start", kind="stable")["row"].tolist()
+        bound = np.inf
+        lost = False
+        for row in reversed(rows):
+            bound = min(until - df_plan["Duration"].iloc[row], bound - sim_durations[row])
+            latest[row] = -np.inf if lost else bound
+            lost = lost or df_plan["Start"].iloc[row] > bound
+    return latest
+
+
+@pytest.mark.parametrize("until", [200, 700, 1440])
+def test_latest_starts_match_backward_pass(until):
+    df_plan = generate_day_plan(12, 6, seed=5, resolution=1)
+    sim_durations = np.round(np.random.default_rng(0).lognormal(0, 0.3, len(df_plan)) * df_plan["Duration"], 2)
+    store = OperationStore(df_plan, sim_durations)
+
+    expected = _latest_starts_by_route(df_plan, sim_durations, until)
+    np.testing.assert_allclose(store.latest_starts(until), expected)
+    assert np.isneginf(expected).any() and np.isfinite(expected).any()
@@ -0,0 +1,59 @@
+"""Replikationen: Engine-Wahl wird bis in die Worker durchgereicht, CLI-Prüfungen für -n > 1."""
+import os
+
+import pandas as pd
+import pytest
+
+import Cli
+from conftest import DATA_DIR
+from Replications import run_replications
+
+PLAN_PATH = os.path.join(DATA_DIR, "schedule.csv")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("sampling", ["iid", "antithetic"])
+def test_engines_agree_across_replications(workers, sampling):
+    df_plan = pd.read_csv(PLAN_PATH)
+    results = {engine: run_replications(df_plan, 4, vc=0.3, seeds=7, workers=workers, until=600,
+                                        sampling=sampling, engine=engine)
+               for engine in ("simpy", "fast")}
+    for simpy_frame, fast_frame in zip(results["simpy"], results["fast"]):
+        pd.testing.assert_frame_equal(fast_frame, simpy_frame)
+
+
+def test_engine_reaches_worker(monkeypatch):
+    import Replications
+
+    engines = []
+    original = Replications.ProductionDaySimulation
+
+    def recording(*args, **kwargs):
+        engines.append(kwargs["engine"])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(Replications, "ProductionDaySimulation", recording)
+    run_replications(pd.read_csv(PLAN_PATH), 2, seeds=1, workers=1, engine="fast")
+    assert engines == ["fast", "fast"]
+
+
+@pytest.mark.parametrize("arguments", [["-n", "3", "--sampling", "antithetic"], ["-n", "2", "--verbose"]])
+def test_cli_rejects_invalid_replication_options(tmp_path, capsys, arguments):
+    with pytest.raises(SystemExit) as exit_info:
+        Cli.main([PLAN_PATH, "-o", str(tmp_path), "--no-cache"] + arguments)
+    assert exit_info.value.code == 2
+    assert "jobshop-sim: error" in capsys.readouterr().err
+
+
+def test_cli_replications_with_fast_engine(tmp_path):
+    arguments = [PLAN_PATH, "-o", str(tmp_path), "--no-cache", "-n", "2", "--workers", "1", "--seed", "3",
+                 "--sampling", "antithetic", "--engine", "fast"]
+    assert Cli.main(arguments) == 0
+    assert {"execution.csv", "undone.csv", "kpis.csv"} <= set(os.listdir(tmp_path))
+
+
+def test_cli_engine_default_documented():
+    # Die CLI nutzt den schnellen Kern, die Bibliothek bleibt ohne Angabe bei SimPy
+    parser = Cli.build_parser()
+    assert parser.parse_args([PLAN_PATH]).engine == "fast"
+    assert "'simpy'" in parser.format_help()
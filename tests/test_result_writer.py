@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from ProductionDaySimulation import ProductionDaySimulation
+from Replications import run_replications
+from ResultWriter import ResultWriter, iter_results, read_results, write_run
+
+PLAN = os.path.join(DATA_DIR, "schedule.csv")
+
+try:
+    import pyarrow  # noqa: F401
+    FORMATS = ["csv", "parquet"]
+except ImportError:
+    FORMATS = ["csv", pytest.param("parquet", marks=pytest.mark.skip(reason="pyarrow nicht installiert"))]
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+@pytest.mark.parametrize("until", [480, None])
+def test_write_run_round_trip(tmp_path, file_format, engine, until):
+    df_plan = pd.read_csv(PLAN)
+    expected_execution, expected_undone = ProductionDaySimulation(df_plan, seed=4, engine=engine, sinks=[]) \
+        .run(until=until)
+
+    with ResultWriter(str(tmp_path), file_format=file_format, chunk_size=7) as writer:
+        counts = write_run(ProductionDaySimulation(df_plan, seed=4, engine=engine, sinks=[]), writer,
+                           until=until, Replication=0)
+        paths = writer.path("execution"), writer.path("undone")
+
+    assert counts == (len(expected_execution), len(expected_undone))
+    df_execution, df_undone = (read_results(path) for path in paths)
+    assert (df_execution["Replication"] == 0).all() and (df_undone["Replication"] == 0).all()
+    pd.testing.assert_frame_equal(df_execution.drop(columns="Replication"), expected_execution, check_dtype=False)
+    pd.testing.assert_frame_equal(df_undone.drop(columns="Replication"), expected_undone, check_dtype=False)
+    assert max(len(chunk) for chunk in iter_results(paths[0], chunk_size=10)) <= 10
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_replication_writer_round_trip(tmp_path, file_format):
+    df_plan = pd.read_csv(PLAN)
+    expected_execution, expected_undone = run_replications(df_plan, 4, seeds=9, workers=1, until=600)
+
+    writer = ResultWriter(str(tmp_path), file_format=file_format, chunk_size=25)
+    execution_path, undone_path = run_replications(df_plan, 4, seeds=9, workers=1, until=600, writer=writer)
+    writer.close()
+
+    df_execution, df_undone = read_results(execution_path), read_results(undone_path)
+    assert len(df_execution) == len(expected_execution)
+    assert len(df_undone) == len(expected_undone)
+    pd.testing.assert_frame_equal(df_execution, expected_execution, check_dtype=False)
+    pd.testing.assert_frame_equal(df_undone, expected_undone, check_dtype=False)
+
+    second = read_results(execution_path, where={"Replication": [1, 2]})
+    pd.testing.assert_frame_equal(second, expected_execution[expected_execution["Replication"].isin([1, 2])]
+                                  .reset_index(drop=True), check_dtype=False)
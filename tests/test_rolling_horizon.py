@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from RollingHorizon import arrivals_from_plan, run_rolling_horizon
+
+
+@pytest.fixture
+def df_plan():
+    # Erster Tag des Archivs als Tag 3
+    df_plan = pd.read_csv(os.path.join(DATA_DIR, "04_schedule_plan_firstday.csv"), index_col=0)
+    return df_plan.assign(**{"Day-ID": 3})
+
+
+def test_two_days_keep_day_ids_of_plan(tmp_path, df_plan):
+    out_dir = str(tmp_path)
+    # Reste eines früheren Laufs werden überschrieben, nicht ergänzt
+    pd.DataFrame({"Job": ["alt"], "Day-ID": [0]}).to_csv(os.path.join(out_dir, "execution.csv"), index=False)
+
+    days = list(run_rolling_horizon([{}, {}], seed=1, until=600, initial_plan=df_plan, out_dir=out_dir))
+    assert [day for day, *_ in days] == [3, 4]
+
+    # Der zweite Tag plant genau den Übertrag des ersten
+    (_, _, execution_first, undone_first), (_, plan_second, execution_second, undone_second) = days
+    assert len(undone_first) > 0
+    assert sorted(zip(plan_second["Job"], plan_second["Machine"])) == \
+        sorted(zip(undone_first["Job"], undone_first["Machine"]))
+
+    for name, first, second in (("execution", execution_first, execution_second),
+                                ("undone", undone_first, undone_second)):
+        written = pd.read_csv(os.path.join(out_dir, f"{name}.csv"))
+        assert written["Day-ID"].tolist() == [3] * len(first) + [4] * len(second)
+    written_plan = pd.read_csv(os.path.join(out_dir, "plan.csv"))
+    assert written_plan["Day-ID"].tolist() == [3] * len(df_plan) + [4] * len(plan_second)
+
+
+def test_first_day_from_archive(df_plan):
+    archive = pd.concat([df_plan, df_plan.assign(**{"Day-ID": 4, "Job": "Neu " + df_plan["Job"]})])
+    arrivals = list(arrivals_from_plan(archive))
+    assert len(arrivals) == 2
+
+    days = [day for day, *_ in run_rolling_horizon(arrivals, seed=1, until=600, first_day=archive["Day-ID"].min())]
+    assert days == [3, 4]
+
+
+def test_initial_plan_with_several_days(df_plan):
+    archive = pd.concat([df_plan, df_plan.assign(**{"Day-ID": 4})])
+    with pytest.raises(ValueError):
+        next(run_rolling_horizon([{}], initial_plan=archive))
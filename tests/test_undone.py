@@ -0,0 +1,79 @@
+"""get_undone_operations_df (index-basiert) gegen die bisherige Merge-Implementierung."""
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from InstanceGenerator import generate_day_plan
+from PlanIO import load_plan
+from ProductionDaySimulation import ProductionDaySimulation, get_undone_operations_df
+
+DATA_PLANS = sorted(glob.glob(os.path.join(DATA_DIR, "*.csv")))
+LOADERS = {
+    "read_csv": pd.read_csv,
+    "load_plan": lambda path: load_plan(path, cache=False),
+}
+
+
+def _executions(df_plan):
+    """Ausführungen: teilweise (Lauf bis 8:00), leer, vollständig und mit planfremden Zeilen."""
+    df_partial, _ = ProductionDaySimulation(df_plan, seed=1, engine="fast", sinks=[]).run(until=480)
+    df_foreign = pd.concat([df_partial, pd.DataFrame({
+        "Job": ["Job fremd", str(df_plan["Job"].iloc[0])],
+        "Machine": ["M999", "M999"],
+        "Start": [0.0, 0.0], "Duration": [1.0, 1.0], "End": [1.0, 1.0],
+    })], ignore_index=True)
+    return {
+        "partial": df_partial,
+        "empty": df_partial.iloc[:0],
+        "complete": df_plan[["Job", "Machine", "Start", "Duration", "End"]],
+        "foreign": df_foreign,
+    }
+
+
+def undone_operations_by_merge(df_plan, df_exec):
+    """Bisherige Implementierung von get_undone_operations_df (Outer-Merge mit Indikator), Vergleichsbasis der Tests."""
+    df_diff = pd.merge(
+        df_plan[["Job", "Machine"]],
+        df_exec[["Job", "Machine"]],
+        how='outer',
+        indicator=True
+    ).query('_merge == "left_only"').drop(columns=['_merge'])
+    df_result = df_plan[["Job", "Machine", "Duration"]].merge(
+        df_diff, on=["Job", "Machine"], how="inner")
+    return df_result.rename(columns={"Duration": "Planned Duration"})
+
+
+@pytest.mark.parametrize("execution", ["partial", "empty", "complete", "foreign"])
+@pytest.mark.parametrize("loader", list(LOADERS))
+@pytest.mark.parametrize("path", DATA_PLANS, ids=os.path.basename)
+def test_matches_merge_implementation(path, loader, execution):
+    df_plan = LOADERS[loader](path)
+    df_exec = _executions(df_plan)[execution]
+
+    result = get_undone_operations_df(df_plan, df_exec)
+    expected = undone_operations_by_merge(df_plan, df_exec)
+
+    if execution == "foreign" and loader == "load_plan":
+        # Der Merge mit planfremden Texten verliert die Kategorien, die neue Variante behält den Plan-dtype
+        assert result["Job"].dtype == df_plan["Job"].dtype
+        assert result["Machine"].dtype == df_plan["Machine"].dtype
+        result = result.astype({"Job": str, "Machine": str})
+        expected = expected.astype({"Job": str, "Machine": str})
+    pd.testing.assert_frame_equal(result, expected)
+
+    if execution == "empty":
+        assert len(result) == len(df_plan)
+    elif execution == "complete":
+        assert result.empty
+
+
+def test_matches_merge_implementation_generated_plan():
+    df_plan = generate_day_plan(200, 50, utilization=0.95, seed=3)
+    df_exec, _ = ProductionDaySimulation(df_plan, seed=3, engine="fast", sinks=[]).run(until=600)
+
+    result = get_undone_operations_df(df_plan, df_exec)
+    assert 0 < len(result) < len(df_plan)
+    pd.testing.assert_frame_equal(result, undone_operations_by_merge(df_plan, df_exec))
@@ -0,0 +1,40 @@
+"""Gemeinsamer Prozess-Pool (WorkerPool): gleiche Ergebnisse mit und ohne Pool."""
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from ProductionDaySimulation import ProductionDaySimulation
+from ResultCache import run_sweep
+from Snapshot import run_forks
+from WorkerPool import map_in_pool, worker_state
+
+
+def _scaled(task):
+    return task * worker_state()["factor"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_in_pool_keeps_order(workers):
+    assert list(map_in_pool(_scaled, range(10), {"factor": 3}, workers, chunksize=3)) == [3 * i for i in range(10)]
+
+
+@pytest.fixture(scope="module")
+def df_plan():
+    return pd.read_csv(os.path.join(DATA_DIR, "schedule.csv"))
+
+
+def test_sweep_with_and_without_pool(df_plan):
+    serial = run_sweep(df_plan, vcs=[0.1, 0.3], untils=[600], seeds=range(3), workers=1)
+    parallel = run_sweep(df_plan, vcs=[0.1, 0.3], untils=[600], seeds=range(3), workers=2)
+    for serial_frame, parallel_frame in zip(serial, parallel):
+        pd.testing.assert_frame_equal(parallel_frame, serial_frame)
+
+
+def test_forks_with_and_without_pool(df_plan):
+    snapshot = ProductionDaySimulation(df_plan, seed=1, engine="fast", sinks=[]).snapshot_at(300)
+    scenarios = [{}, {"seed": 3}, {"block_machine": ("M1", 300, 420)}]
+    for serial, parallel in zip(run_forks(snapshot, scenarios, workers=1), run_forks(snapshot, scenarios, workers=2)):
+        pd.testing.assert_frame_equal(parallel[0], serial[0])
+        pd.testing.assert_frame_equal(parallel[1], serial[1])